@@ -0,0 +1,91 @@
+"""Working days of vacancy quotas: single questions vs batch methods of LocalProductionCalendar.
+
+Usage: python -m benchmarks.calendar_batch [--quotas N]
+
+Every quota has a creation date and a deadline within 2020-2024, the calendar
+has weekends only (non-working days are served by a fake entity, no HTTP).
+Calendar years are downloaded before measurements.
+"""
+
+import asyncio
+import datetime
+import random
+import time
+from argparse import ArgumentParser, Namespace
+from typing import List, Optional
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.entities.production_calendars import ProductionCalendar
+from huntflow_api_client.local_calendar import LocalProductionCalendar
+from huntflow_api_client.models.response.production_calendars import NonWorkingDaysResponse
+from huntflow_api_client.tokens.token import ApiToken
+
+CALENDAR_ID = 1
+
+
+class WeekendsCalendar(ProductionCalendar):
+    async def get_non_working_days_in_period(
+        self,
+        calendar_id: int,
+        deadline: datetime.date,
+        start: Optional[datetime.date] = None,
+        verbose: Optional[bool] = True,
+    ) -> NonWorkingDaysResponse:
+        assert start is not None
+        days = [
+            start + datetime.timedelta(days=i)
+            for i in range((deadline - start).days + 1)
+            if (start + datetime.timedelta(days=i)).weekday() >= 5
+        ]
+        return NonWorkingDaysResponse(
+            start=start,
+            deadline=deadline,
+            total_days=(deadline - start).days + 1,
+            not_working_days=len(days),
+            production_calendar=calendar_id,
+            items=days,
+        )
+
+
+async def main(args: Namespace) -> None:
+    api = HuntflowAPI(token=ApiToken(access_token="token"))
+    calendar = LocalProductionCalendar(WeekendsCalendar(api), CALENDAR_ID)
+    await calendar.load(datetime.date(2020, 1, 1), datetime.date(2025, 12, 31))
+
+    rng = random.Random(0)
+    first_day = datetime.date(2020, 1, 1)
+    created: List[datetime.date] = []
+    deadlines: List[datetime.date] = []
+    for _ in range(args.quotas):
+        created.append(first_day + datetime.timedelta(days=rng.randrange(1500)))
+        deadlines.append(created[-1] + datetime.timedelta(days=rng.randrange(90)))
+
+    start = time.perf_counter()
+    working_days = []
+    for created_date, deadline in zip(created, deadlines):
+        period = await calendar.get_non_working_days_in_period(
+            deadline,
+            created_date,
+            verbose=False,
+        )
+        working_days.append(period.total_days - period.not_working_days)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_working_days = await calendar.count_working_days_batch(created, deadlines)
+    batch = time.perf_counter() - start
+
+    assert batch_working_days.tolist() == working_days
+    print(f"{args.quotas} quotas")
+    print(f"  single questions {single * 1000:9.1f} ms")
+    print(f"  batch            {batch * 1000:9.1f} ms  x{single / batch:.1f}")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--quotas", type=int, default=50_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,67 @@
+"""Requests per second with a shared http client vs a client per request.
+
+Usage: python -m benchmarks.http_client [--requests N] [--concurrency N]
+
+The fake API server from tests is used, so the numbers show the client side
+overhead only (no network round trips).
+"""
+
+import asyncio
+import time
+from argparse import ArgumentParser, Namespace
+
+import httpx
+import respx
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.errors.response_hooks import raise_for_status
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import BASE_URL, FakeAPIServer
+
+
+class PerRequestClientAPI(HuntflowAPI):
+    """Reproduces the old behaviour: a new http client for every request."""
+
+    async def _request(self, method: str, path: str, **kwargs: str) -> httpx.Response:
+        headers = {}
+        headers.update(await self._token_proxy.get_auth_header())
+        async with httpx.AsyncClient(base_url=self.api_url) as client:
+            client.event_hooks["response"] = [raise_for_status]
+            return await client.request(method, path, headers=headers)
+
+
+async def run(api: HuntflowAPI, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call() -> None:
+        async with semaphore:
+            await api.request("GET", "/me")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await api.aclose()
+    return requests / elapsed
+
+
+async def main(args: Namespace) -> None:
+    with respx.mock:
+        server = FakeAPIServer()
+        token = ApiToken(access_token=server.token_pair.access_token)
+        for name, api_class in (
+            ("client per request", PerRequestClientAPI),
+            ("shared client", HuntflowAPI),
+        ):
+            rps = await run(api_class(BASE_URL, token=token), args.requests, args.concurrency)
+            print(f"{name:>20}: {rps:10.1f} requests/s")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,121 @@
+"""Request body encoding and response decoding with different JSON paths.
+
+Usage: python -m benchmarks.json_codec [--repeat N] [--items N]
+
+Request bodies (`ApplicantCreateRequest`, `VacancyCreateRequest`):
+
+* jsonable_dict + json: the old path, the model is dumped to a JSON string,
+  parsed back to a dict and encoded again by httpx with stdlib json
+* jsonable_dict + orjson: the same dict encoded with orjson codec
+* json_bytes: the model is encoded once by pydantic and sent as is
+
+Responses (a page of `--items` applicants):
+
+* json + validate: the old path, `response.json()` and `model_validate`
+* orjson + validate: decoding with orjson codec and `model_validate`
+* validate_json: `model_validate_json` on the response body
+* orjson (raw mode): decoding only, without validation
+"""
+
+import copy
+import datetime
+import json
+import time
+from argparse import ArgumentParser, Namespace
+from typing import Callable, Dict
+
+import httpx
+
+from huntflow_api_client.json_codec import OrjsonCodec
+from huntflow_api_client.models.common import FillQuota, JsonRequestModel
+from huntflow_api_client.models.request.applicants import ApplicantCreateRequest
+from huntflow_api_client.models.request.vacancies import VacancyCreateRequest
+from huntflow_api_client.models.response.applicants import ApplicantListResponse
+from tests.test_entities.test_applicants import APPLICANT_CREATE_REQUEST, APPLICANT_LIST_RESPONSE
+
+VACANCY_BODY = (
+    "<p>We are looking for a developer.</p>" + "<ul><li>Python</li><li>asyncio</li></ul>" * 20
+)
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def print_results(title: str, results: Dict[str, float]) -> None:
+    print(title)
+    baseline = next(iter(results.values()))
+    for name, elapsed in results.items():
+        print(f"  {name:<24} {elapsed * 1_000_000:9.1f} us  x{baseline / elapsed:.1f}")
+
+
+def bench_request(model: JsonRequestModel, repeat: int) -> Dict[str, float]:
+    orjson_codec = OrjsonCodec()
+    return {
+        "jsonable_dict + json": measure(
+            lambda: json.dumps(model.jsonable_dict(exclude_none=True)).encode(),
+            repeat,
+        ),
+        "jsonable_dict + orjson": measure(
+            lambda: orjson_codec.dumps(model.jsonable_dict(exclude_none=True)),
+            repeat,
+        ),
+        "json_bytes": measure(lambda: model.json_bytes(exclude_none=True), repeat),
+    }
+
+
+def bench_response(items: int, repeat: int) -> Dict[str, float]:
+    page = copy.deepcopy(APPLICANT_LIST_RESPONSE)
+    page["items"] = [{**item, "id": i} for i, item in enumerate(page["items"] * (items // 2))]
+    response = httpx.Response(200, json=page)
+    orjson_codec = OrjsonCodec()
+    return {
+        "json + validate": measure(
+            lambda: ApplicantListResponse.model_validate(response.json()),
+            repeat,
+        ),
+        "orjson + validate": measure(
+            lambda: ApplicantListResponse.model_validate(orjson_codec.loads(response.content)),
+            repeat,
+        ),
+        "validate_json": measure(
+            lambda: ApplicantListResponse.model_validate_json(response.content),
+            repeat,
+        ),
+        "orjson (raw mode)": measure(lambda: orjson_codec.loads(response.content), repeat),
+    }
+
+
+def main(args: Namespace) -> None:
+    applicant = ApplicantCreateRequest(**APPLICANT_CREATE_REQUEST)
+    vacancy = VacancyCreateRequest(
+        position="Python developer",
+        company="Google Inc.",
+        money="$100000",
+        priority=1,
+        body=VACANCY_BODY,
+        requirements=VACANCY_BODY,
+        conditions=VACANCY_BODY,
+        coworkers=list(range(1, 11)),
+        fill_quotas=[FillQuota(deadline=datetime.date(2023, 7, 1), applicants_to_hire=3)],
+    )
+    print_results("ApplicantCreateRequest", bench_request(applicant, args.repeat))
+    print_results("VacancyCreateRequest", bench_request(vacancy, args.repeat))
+    print_results(
+        f"ApplicantListResponse ({args.items} items)",
+        bench_response(args.items, max(1, args.repeat // 100)),
+    )
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--items", type=int, default=100)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
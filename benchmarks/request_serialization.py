@@ -0,0 +1,151 @@
+"""Serialization of every request model from `huntflow_api_client.models.request`.
+
+Usage: python -m benchmarks.request_serialization [--repeat N] [--items N]
+
+Models are filled with generated values: every optional field is set
+and lists have `--items` elements, so the numbers are close to the worst case.
+Paths:
+
+* reparse: the old `jsonable_dict`, `json.loads(model.model_dump_json())`
+* jsonable_dict: `model.model_dump(mode="json")`
+* json_bytes: the request body as sent by entity methods
+
+Allocations are measured with tracemalloc for a single call: `peak` is
+the peak of traced memory during the call (temporary strings and dicts included),
+`blocks` is the number of memory blocks held by the returned value.
+"""
+
+import datetime
+import enum
+import importlib
+import json
+import pkgutil
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
+
+from annotated_types import MaxLen
+from pydantic import AnyHttpUrl, BaseModel, EmailStr, ValidationError
+from typing_extensions import Annotated, Literal, get_args, get_origin
+
+import huntflow_api_client.models.request
+from huntflow_api_client.models.common import JsonRequestModel
+
+MAX_DEPTH = 3
+
+Path = Callable[[JsonRequestModel], object]
+PATHS: Dict[str, Path] = {
+    "reparse": lambda model: json.loads(model.model_dump_json()),
+    "jsonable_dict": lambda model: model.jsonable_dict(),
+    "json_bytes": lambda model: model.json_bytes(),
+}
+
+
+def request_models() -> List[Type[JsonRequestModel]]:
+    package = huntflow_api_client.models.request
+    models: List[Type[JsonRequestModel]] = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        models.extend(
+            value
+            for value in vars(module).values()
+            if isinstance(value, type) and issubclass(value, JsonRequestModel)
+            if value.__module__ == module.__name__
+        )
+    return models
+
+
+def sample_value(annotation: Any, items: int, depth: int) -> Any:  # noqa: C901
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return sample_value(args[0], items, depth)
+    if origin is Union:
+        return sample_value(next(arg for arg in args if arg is not type(None)), items, depth)
+    if origin is Literal:
+        return args[0]
+    if origin is list or annotation is list:
+        if depth >= MAX_DEPTH or not args:
+            return []
+        return [sample_value(args[0], items, depth + 1) for _ in range(items)]
+    if origin is dict or annotation is dict:
+        return {"key": "value"}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample_data(annotation, items, depth + 1)
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation)).value
+    samples: Dict[Any, Any] = {
+        bool: True,
+        int: 1,
+        str: "text",
+        datetime.datetime: "2023-01-01T12:00:00+03:00",
+        datetime.date: "2023-01-01",
+        EmailStr: "user@example.com",
+        AnyHttpUrl: "https://example.com/file.pdf",
+    }
+    return samples.get(annotation, "text")
+
+
+def sample_data(model: Type[BaseModel], items: int, depth: int = 0) -> Dict[str, Any]:
+    data = {}
+    for name, field in model.model_fields.items():
+        max_length = min(
+            [item.max_length for item in field.metadata if isinstance(item, MaxLen)],
+            default=items,
+        )
+        data[field.alias or name] = sample_value(field.annotation, min(items, max_length), depth)
+    return data
+
+
+def measure_time(path: Path, model: JsonRequestModel, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        path(model)
+    return (time.perf_counter() - start) / repeat
+
+
+def measure_memory(path: Path, model: JsonRequestModel) -> Tuple[int, int]:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = path(model)
+        _, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - before, blocks
+
+
+def main(args: Namespace) -> None:
+    totals = dict.fromkeys(PATHS, 0.0)
+    skipped = []
+    print(f"{'model':<42}" + "".join(f"{name:>34}" for name in PATHS))
+    for model_class in request_models():
+        try:
+            model = model_class.model_validate(sample_data(model_class, args.items))
+        except ValidationError:
+            skipped.append(model_class.__name__)
+            continue
+        row = f"{model_class.__name__:<42}"
+        for name, path in PATHS.items():
+            elapsed = measure_time(path, model, args.repeat)
+            peak, blocks = measure_memory(path, model)
+            totals[name] += elapsed
+            row += f"{elapsed * 1_000_000:9.1f} us {peak / 1024:7.1f} KiB {blocks:6} blocks"
+        print(row)
+    print(f"{'total':<42}" + "".join(f"{total * 1_000_000:>31.1f} us" for total in totals.values()))
+    if skipped:
+        print("skipped (generated data is not valid):", ", ".join(skipped))
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2_000)
+    parser.add_argument("--items", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
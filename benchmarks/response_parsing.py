@@ -0,0 +1,77 @@
+"""Time to turn a response into the return value of an entity method in every response mode.
+
+Usage: python -m benchmarks.response_parsing [--items N] [--repeat N]
+
+Pages are built from the applicant and resume fixtures of the tests:
+a page of `--items` applicants (`ApplicantListResponse`) and a single resume
+(`ApplicantResumeResponse`). JSON decoding is included in the timings.
+
+There is no mode which builds nested models with `model_construct`:
+doing it in Python was about twice slower than validation by pydantic-core.
+"""
+
+import copy
+import time
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List, Tuple, Type
+
+import httpx
+from pydantic import BaseModel
+
+from huntflow_api_client.models.response.applicants import ApplicantListResponse
+from huntflow_api_client.models.response.resume import ApplicantResumeResponse
+from huntflow_api_client.parsing import ResponseMode, parse_response
+from tests.test_entities.test_applicants import APPLICANT_LIST_RESPONSE
+from tests.test_entities.test_resume import APPLICANT_RESUME_RESPONSE
+
+
+def make_applicant_page(items: int) -> Dict[str, Any]:
+    page = copy.deepcopy(APPLICANT_LIST_RESPONSE)
+    templates = page["items"]
+    page["items"] = [
+        {**copy.deepcopy(templates[i % len(templates)]), "id": i + 1} for i in range(items)
+    ]
+    page["count"] = page["total_items"] = items
+    return page
+
+
+def measure(
+    model: Type[BaseModel],
+    response: httpx.Response,
+    mode: ResponseMode,
+    repeat: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_response(model, response, mode)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(args: Namespace) -> None:
+    cases: List[Tuple[str, Type[BaseModel], Dict[str, Any]]] = [
+        (
+            f"ApplicantListResponse ({args.items} items)",
+            ApplicantListResponse,
+            make_applicant_page(args.items),
+        ),
+        ("ApplicantResumeResponse", ApplicantResumeResponse, APPLICANT_RESUME_RESPONSE),
+    ]
+    for title, model, data in cases:
+        print(title)
+        baseline = None
+        for mode in ResponseMode:
+            response = httpx.Response(200, json=data)
+            elapsed = measure(model, response, mode, args.repeat)
+            baseline = baseline or elapsed
+            print(f"  {mode.value:<10} {elapsed * 1000:8.3f} ms  x{baseline / elapsed:.1f}")
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
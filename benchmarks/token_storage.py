@@ -0,0 +1,122 @@
+"""Event loop stall time caused by the token file storage.
+
+Usage: python -m benchmarks.token_storage [--requests N] [--concurrency N] [--io-latency MS]
+
+Every request reads the auth header through HuntflowTokenProxy, like
+HuntflowAPI does. A probe task measures how late the event loop wakes it up:
+the sum of these delays is the time the loop was busy or blocked.
+`--io-latency` emulates a slower disk (or network file system) by adding
+a delay to every file read; page-cached reads of a local file are very fast,
+so the difference is mostly visible with non-zero latency.
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+from argparse import ArgumentParser, Namespace
+from typing import Hashable, Tuple
+
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from huntflow_api_client.tokens.storage import (
+    AbstractHuntflowTokenStorage,
+    HuntflowTokenFileStorage,
+)
+from huntflow_api_client.tokens.token import ApiToken
+
+PROBE_INTERVAL = 0.001
+
+
+class BlockingTokenFileStorage(AbstractHuntflowTokenStorage):
+    """Reproduces the old behaviour: blocking file I/O on the event loop."""
+
+    def __init__(self, filename: str, io_latency: float) -> None:
+        self._filename = filename
+        self._io_latency = io_latency
+
+    async def get(self) -> ApiToken:
+        time.sleep(self._io_latency)
+        with open(self._filename) as fin:
+            data = json.load(fin)
+        return ApiToken.from_dict(data)
+
+    async def update(self, token: ApiToken) -> None:
+        with open(self._filename, "w") as fout:
+            json.dump(token.dict(), fout, indent=4)
+
+
+class SlowTokenFileStorage(HuntflowTokenFileStorage):
+    def __init__(self, filename: str, io_latency: float) -> None:
+        super().__init__(filename)
+        self._io_latency = io_latency
+
+    def _get_version(self) -> Hashable:
+        time.sleep(self._io_latency)
+        return super()._get_version()
+
+
+async def probe(stop: asyncio.Event) -> Tuple[float, float]:
+    total_stall = max_stall = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        stall = max(0.0, time.perf_counter() - start - PROBE_INTERVAL)
+        total_stall += stall
+        max_stall = max(max_stall, stall)
+    return total_stall, max_stall
+
+
+async def run(
+    name: str,
+    proxy: HuntflowTokenProxy,
+    requests: int,
+    concurrency: int,
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request() -> None:
+        async with semaphore:
+            await proxy.get_auth_header()
+            # Emulate a network round trip
+            await asyncio.sleep(0)
+
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    total_stall, max_stall = await probe_task
+    print(
+        f"{name:>30}: elapsed {elapsed:6.2f}s, "
+        f"loop stall {total_stall * 1000:8.1f}ms total, {max_stall * 1000:6.2f}ms max",
+    )
+
+
+async def main(args: Namespace) -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as token_file:
+        json.dump(ApiToken(access_token="a" * 64, refresh_token="r" * 64).dict(), token_file)
+        token_file.flush()
+        filename, io_latency = token_file.name, args.io_latency / 1000
+        cases = (
+            ("blocking I/O", HuntflowTokenProxy(BlockingTokenFileStorage(filename, io_latency))),
+            ("I/O in executor", HuntflowTokenProxy(SlowTokenFileStorage(filename, io_latency))),
+            (
+                "I/O in executor + proxy cache",
+                HuntflowTokenProxy(SlowTokenFileStorage(filename, io_latency), cache_ttl=1.0),
+            ),
+        )
+        for name, proxy in cases:
+            await run(name, proxy, args.requests, args.concurrency)
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--io-latency", type=float, default=0.1, help="Milliseconds")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
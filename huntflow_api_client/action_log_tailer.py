@@ -0,0 +1,272 @@
+import asyncio
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.entities.action_logs import ActionLog
+from huntflow_api_client.models.consts import ActionLogType
+from huntflow_api_client.models.response.action_logs import ActionLog as ActionLogItem
+from huntflow_api_client.models.response.action_logs import ActionLogsResponse
+from huntflow_api_client.pagination import cancel_futures
+from huntflow_api_client.parsing import ModelOrRaw, get_field
+
+logger = logging.getLogger(__name__)
+
+# Logs and responses are models or raw data according to the client's response mode
+Log = ModelOrRaw[ActionLogItem]
+LogsPage = ModelOrRaw[ActionLogsResponse]
+
+
+class AbstractCheckpointStore(ABC):
+    """Keeps ID of the last processed action log"""
+
+    @abstractmethod
+    async def get(self) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def update(self, last_id: int) -> None:
+        pass
+
+
+class InMemoryCheckpointStore(AbstractCheckpointStore):
+    def __init__(self, last_id: Optional[int] = None) -> None:
+        self._last_id = last_id
+
+    async def get(self) -> Optional[int]:
+        return self._last_id
+
+    async def update(self, last_id: int) -> None:
+        self._last_id = last_id
+
+
+class FileCheckpointStore(AbstractCheckpointStore):
+    """Keeps the checkpoint in a text file.
+    The file is updated atomically in a thread pool executor.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self._filename = filename
+
+    async def get(self) -> Optional[int]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read)
+
+    async def update(self, last_id: int) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write, last_id)
+
+    def _read(self) -> Optional[int]:
+        try:
+            with open(self._filename) as fin:
+                content = fin.read().strip()
+        except FileNotFoundError:
+            return None
+        return int(content) if content else None
+
+    def _write(self, last_id: int) -> None:
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        fd, tmp_filename = tempfile.mkstemp(dir=directory, prefix=".tmp-checkpoint-")
+        try:
+            with os.fdopen(fd, "w") as fout:
+                fout.write(str(last_id))
+                fout.flush()
+                os.fsync(fout.fileno())
+            os.replace(tmp_filename, self._filename)
+        except BaseException:
+            os.unlink(tmp_filename)
+            raise
+
+
+class ActionLogTailer:
+    """Reads new security logs of an organization.
+
+    `tail` polls action logs newer than the last processed one (`previous_id`)
+    and yields them from older to newer. The ID of the last log is saved
+    to the checkpoint store after all logs of a poll have been processed,
+    so after a restart the tailer continues from the same place
+    (a log may be yielded twice if the process is stopped in the middle of a poll).
+    When there are no new logs, the polling interval is multiplied by `backoff_factor`
+    up to `max_interval`; it is reset to `min_interval` as soon as new logs appear.
+
+    `backfill` reads old logs walking `next_id` downwards. The ID range is split
+    into `concurrency` parts which are read concurrently.
+
+    Logs are models or raw data according to the client's response mode.
+
+    :param api: API client
+    :param account_id: Organization ID
+    :param checkpoint_store: Storage of the last processed log ID
+    :param types: Action log types
+    :param count: Number of items per request
+    :param initial_id: Start from logs newer than this ID when there is no checkpoint yet.
+        If not set, only logs created after the first poll are yielded
+    :param min_interval: Minimal delay (in seconds) between polls
+    :param max_interval: Maximal delay (in seconds) between polls
+    :param backoff_factor: Delay multiplier for polls without new logs
+    """
+
+    def __init__(
+        self,
+        api: HuntflowAPI,
+        account_id: int,
+        checkpoint_store: Optional[AbstractCheckpointStore] = None,
+        types: Optional[List[ActionLogType]] = None,
+        count: int = 100,
+        initial_id: Optional[int] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff_factor: float = 2.0,
+    ):
+        self._api = api
+        self._action_log = ActionLog(api)
+        self._account_id = account_id
+        self._checkpoint_store = checkpoint_store or InMemoryCheckpointStore()
+        self._types = types
+        self._count = count
+        self._initial_id = initial_id
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.last_id: Optional[int] = None
+
+    async def tail(self) -> AsyncGenerator[Log, None]:
+        """Yields new action logs forever"""
+        interval = self.min_interval
+        while True:
+            logs = await self.poll()
+            for log in logs:
+                yield log
+            if logs:
+                await self.commit(_get_id(logs[-1]))
+                interval = self.min_interval
+            logger.debug("%s new action logs, next poll in %.2fs", len(logs), interval)
+            await asyncio.sleep(interval)
+            if not logs:
+                interval = min(self.max_interval, interval * self.backoff_factor)
+
+    async def poll(self) -> List[Log]:
+        """Returns logs newer than the last committed one, from older to newer"""
+        last_id = await self._get_last_id()
+        logs: Dict[int, Log] = {}
+        response = await self._list(previous_id=last_id)
+        while True:
+            items = get_field(response, "items")
+            logs.update((_get_id(log), log) for log in items if _get_id(log) > last_id)
+            next_id = get_field(response, "next_id")
+            if not items or next_id is None:
+                break
+            if not last_id < next_id < _get_id(items[-1]):
+                break
+            response = await self._list(next_id=next_id, previous_id=last_id)
+        return [logs[log_id] for log_id in sorted(logs)]
+
+    async def commit(self, last_id: int) -> None:
+        """Saves ID of the last processed log"""
+        self.last_id = last_id
+        await self._checkpoint_store.update(last_id)
+
+    async def backfill(
+        self,
+        from_id: Optional[int] = None,
+        to_id: int = 0,
+        concurrency: int = 4,
+    ) -> AsyncGenerator[Log, None]:
+        """Yields logs with IDs in range (to_id, from_id].
+        Logs of every part of the range are yielded from newer to older,
+        parts are read concurrently so the total order isn't preserved.
+        The checkpoint isn't changed.
+
+        :param from_id: The newest log ID, the latest log by default
+        :param to_id: Logs with this ID and older are not read
+        :param concurrency: Number of concurrent requests
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if from_id is None:
+            from_id = await self._get_latest_id()
+        if from_id is None or from_id <= to_id:
+            return
+        logs = self._read_ranges(_split_range(to_id, from_id, concurrency))
+        try:
+            async for log in logs:
+                yield log
+        finally:
+            await logs.aclose()
+
+    async def _read_ranges(
+        self,
+        ranges: List[Tuple[int, int]],
+    ) -> AsyncGenerator[Log, None]:
+        """Reads ranges (low, high] concurrently"""
+        pending: Dict["asyncio.Future[LogsPage]", Tuple[int, int]] = {}
+        for low, high in ranges:
+            pending[self._start_list(low, high)] = low, high
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    low, high = pending.pop(future)
+                    response = future.result()
+                    for log in get_field(response, "items"):
+                        if low < _get_id(log) <= high:
+                            yield log
+                    next_high = _get_next_high(response, low, high)
+                    if next_high is not None:
+                        pending[self._start_list(low, next_high)] = low, next_high
+        finally:
+            cancel_futures(pending)
+
+    def _start_list(self, low: int, high: int) -> "asyncio.Future[LogsPage]":
+        return asyncio.ensure_future(self._list(next_id=high, previous_id=low))
+
+    async def _get_last_id(self) -> int:
+        if self.last_id is not None:
+            return self.last_id
+        last_id = await self._checkpoint_store.get()
+        if last_id is None:
+            last_id = self._initial_id
+        if last_id is None:
+            last_id = await self._get_latest_id() or 0
+            await self.commit(last_id)
+        self.last_id = last_id
+        return last_id
+
+    async def _get_latest_id(self) -> Optional[int]:
+        response = await self._action_log.list(self._account_id, self._types, count=1)
+        items = get_field(response, "items")
+        return _get_id(items[0]) if items else None
+
+    async def _list(
+        self,
+        next_id: Optional[int] = None,
+        previous_id: Optional[int] = None,
+    ) -> LogsPage:
+        return await self._action_log.list(
+            self._account_id,
+            self._types,
+            next_id=next_id,
+            previous_id=previous_id,
+            count=self._count,
+        )
+
+
+def _split_range(low: int, high: int, parts: int) -> List[Tuple[int, int]]:
+    """Splits range (low, high] into at most `parts` ranges"""
+    size = max(1, -(-(high - low) // parts))
+    return [(start, min(start + size, high)) for start in range(low, high, size)]
+
+
+def _get_next_high(response: LogsPage, low: int, high: int) -> Optional[int]:
+    """Returns the upper bound of logs left to read in range (low, high]"""
+    next_id: Optional[int] = get_field(response, "next_id")
+    if not get_field(response, "items") or next_id is None or not low < next_id < high:
+        return None
+    return next_id
+
+
+def _get_id(log: Log) -> int:
+    return int(get_field(log, "id"))
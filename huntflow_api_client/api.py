@@ -1,17 +1,36 @@
+import asyncio
+import functools
 import logging
-from typing import Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import httpx
 
+from huntflow_api_client.cache import (
+    AbstractResponseCache,
+    CachedResponse,
+    CacheKey,
+    make_cache_key,
+)
+from huntflow_api_client.coalescing import RequestCoalescer
+from huntflow_api_client.concurrency import AdaptiveConcurrencyLimiter
 from huntflow_api_client.errors.errors import InvalidAccessTokenError, TokenExpiredError
 from huntflow_api_client.errors.response_hooks import raise_for_status
+from huntflow_api_client.json_codec import AbstractJsonCodec, get_default_codec
+from huntflow_api_client.parsing import ResponseMode
+from huntflow_api_client.rate_limit import RateLimiter
+from huntflow_api_client.retry import RetryPolicy
 from huntflow_api_client.tokens.proxy import AbstractTokenProxy, DummyHuntflowTokenProxy
 from huntflow_api_client.tokens.token import ApiToken
+from huntflow_api_client.transport import TransportConfig
 
 logger = logging.getLogger(__name__)
 
 API_VERSION_PATH = "/v2"
 
+# Sends a request with optional conditional headers (If-None-Match, If-Modified-Since)
+SendRequest = Callable[..., Awaitable[httpx.Response]]
+
 
 class HuntflowAPI:
     def __init__(
@@ -21,6 +40,15 @@ class HuntflowAPI:
         token: Optional[ApiToken] = None,
         token_proxy: Optional[AbstractTokenProxy] = None,
         auto_refresh_tokens: bool = False,
+        transport_config: Optional[TransportConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        token_refresh_margin: Optional[float] = None,
+        response_mode: ResponseMode = ResponseMode.VALIDATE,
+        json_codec: Optional[AbstractJsonCodec] = None,
+        response_cache: Optional[AbstractResponseCache] = None,
+        request_coalescer: Optional[RequestCoalescer] = None,
     ):
         """API client.
         :param base_url: Base url for API (including schema),
@@ -35,6 +63,47 @@ class HuntflowAPI:
             Also see usage example at `examples.api_client_with_simple_locks`.
         :param auto_refresh_tokens: If True then the client will handle token expiration.
             "Handle" means: catch token expiration errors and run token refresh request.
+        :param transport_config: Connection settings for the underlying http client:
+            HTTP/2, pool limits, timeouts, custom transport, etc.
+            See `huntflow_api_client.transport.TransportConfig`.
+            The client is created once and reused for all requests, so connections
+            are kept alive between API calls. Use `async with HuntflowAPI(...)` or
+            call `aclose` to release the connections when the client is not needed anymore.
+        :param rate_limiter: Optional client side rate limiter.
+            Requests are paced according to the limiter settings and
+            `Retry-After` / rate limit headers of API responses.
+            See `huntflow_api_client.rate_limit.RateLimiter`.
+        :param retry_policy: Optional policy to retry requests failed with transient errors
+            (429, 5xx, connection errors and timeouts).
+            See `huntflow_api_client.retry.RetryPolicy`.
+        :param concurrency_limiter: Optional limiter of in-flight requests which adapts
+            the limit to API latency and errors. Current limit and queue depth are available
+            via its `metrics` property.
+            See `huntflow_api_client.concurrency.AdaptiveConcurrencyLimiter`.
+        :param token_refresh_margin: If set, then a background task refreshes the token
+            this number of seconds before its expiration, so requests don't fail
+            with expired token errors. The task is started with the first request
+            (or `async with`) and stopped by `aclose`. The token proxy must provide
+            the expiration time (see `AbstractTokenProxy.get_expiration_timestamp`).
+        :param response_mode: How entity methods convert responses: validate them
+            with pydantic models (default) or return decoded JSON as is.
+            Use `huntflow_api_client.parsing.use_response_mode` to override it
+            for particular calls.
+            See `huntflow_api_client.parsing.ResponseMode`.
+        :param json_codec: Codec to encode `json` request bodies and decode raw responses.
+            By default orjson is used if it's installed, stdlib json otherwise.
+            See `huntflow_api_client.json_codec`.
+        :param response_cache: Optional cache of responses of reference data endpoints
+            (regions, rejection reasons, tags, dictionaries, etc.).
+            Responses are cached per token, write requests to the same resource
+            invalidate them. Expired responses with validators (ETag, Last-Modified)
+            are revalidated with conditional requests.
+            Use `huntflow_api_client.cache.SQLiteResponseCache` to keep responses
+            between restarts. See `huntflow_api_client.cache`.
+        :param request_coalescer: Optional single-flight for GET requests:
+            concurrent identical requests share one API call.
+            Coalescing hit rate is available via its `metrics` property.
+            See `huntflow_api_client.coalescing.RequestCoalescer`.
         """
         if token_proxy is None:
             if token is None:
@@ -44,13 +113,63 @@ class HuntflowAPI:
         self.api_url = base_url + API_VERSION_PATH
 
         self._autorefresh_tokens = auto_refresh_tokens
+        self._transport_config = transport_config or TransportConfig()
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._is_transport_used = False
+        self._token_refresh_margin = token_refresh_margin
+        self.response_mode = response_mode
+        self.json_codec = json_codec or get_default_codec()
+        self.response_cache = response_cache
+        self.request_coalescer = request_coalescer
+        self._token_refresher: Optional["asyncio.Task[None]"] = None
+
+    async def __aenter__(self) -> "HuntflowAPI":
+        self._ensure_token_refresher()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     @property
     def http_client(self) -> httpx.AsyncClient:
-        http_client = httpx.AsyncClient(base_url=self.api_url)
-        http_client.event_hooks["response"] = [raise_for_status]
+        """Shared http client with a connection pool.
+        The client is created on first access and recreated if it has been closed.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = self._create_http_client()
+        return self._http_client
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        config = self._transport_config
+        if config.transport is not None and config.transport_factory is None:
+            if self._is_transport_used:
+                raise RuntimeError(
+                    "The custom transport has been closed with the previous http client, "
+                    "use `TransportConfig.transport_factory` to recreate it",
+                )
+            self._is_transport_used = True
+        http_client = httpx.AsyncClient(
+            base_url=self.api_url,
+            transport=config.create_transport(),
+            timeout=self._transport_config.timeout,
+        )
+        response_hooks: List[Callable[[httpx.Response], Awaitable[None]]] = [raise_for_status]
+        if self._rate_limiter is not None:
+            response_hooks.insert(0, self._rate_limiter.observe_response)
+        http_client.event_hooks["response"] = response_hooks
         return http_client
 
+    async def aclose(self) -> None:
+        """Close the underlying http client and its connections."""
+        await self.stop_token_refresher()
+        if self._http_client is None:
+            return
+        http_client, self._http_client = self._http_client, None
+        await http_client.aclose()
+
     async def request(  # type: ignore[no-untyped-def]
         self,
         method: str,
@@ -64,29 +183,101 @@ class HuntflowAPI:
         headers=None,
         timeout=None,
     ) -> httpx.Response:
-        if self._autorefresh_tokens:
-            return await self._autorefresh_token_request(
-                method,
-                path,
-                data=data,
-                files=files,
-                json=json,
-                content=content,
-                params=params,
-                headers=headers,
-                timeout=timeout,
+        """Sends a request to API.
+        `json` body is encoded with the client's `json_codec` once for all retries,
+        it may also be an already encoded JSON (bytes),
+        e.g. `JsonRequestModel.json_bytes()`.
+        """
+        self._ensure_token_refresher()
+        if json is not None:
+            content = json if isinstance(json, bytes) else self.json_codec.dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        request_kwargs = {
+            "data": data,
+            "files": files,
+            "content": content,
+            "params": params,
+            "headers": headers,
+            "timeout": timeout,
+        }
+
+        async def send_request(request_headers: Any) -> httpx.Response:
+            kwargs = {**request_kwargs, "headers": request_headers}
+            if self._autorefresh_tokens:
+                return await self._autorefresh_token_request(method, path, **kwargs)
+            return await self._request(method, path, **kwargs)
+
+        async def send(conditional_headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+            request_headers = (
+                {**(headers or {}), **conditional_headers} if conditional_headers else headers
             )
-        return await self._request(
-            method,
-            path,
-            data=data,
-            files=files,
-            json=json,
-            content=content,
-            params=params,
-            headers=headers,
-            timeout=timeout,
-        )
+            attempt = functools.partial(send_request, request_headers)
+            if self._retry_policy is None:
+                return await attempt()
+            return await self._retry_policy.run(method, path, attempt)
+
+        coalescer = self.request_coalescer
+        if coalescer is not None and coalescer.match(method, path):
+            send = functools.partial(self._coalesced_request, coalescer, method, path, params, send)
+        if self.response_cache is None:
+            return await send()
+        return await self._cached_request(self.response_cache, method, path, params, send)
+
+    async def _coalesced_request(
+        self,
+        coalescer: RequestCoalescer,
+        method: str,
+        path: str,
+        params: Any,
+        send: SendRequest,
+        conditional_headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        if conditional_headers:
+            # Conditional requests may get 304 without a body, don't share it with others
+            return await send(conditional_headers)
+        key = make_cache_key(method, path, params, await self._token_proxy.get_auth_header())
+        return await coalescer.run(key, send)
+
+    async def _cached_request(
+        self,
+        cache: AbstractResponseCache,
+        method: str,
+        path: str,
+        params: Any,
+        send: SendRequest,
+    ) -> httpx.Response:
+        if method.upper() != "GET":
+            try:
+                return await send()
+            finally:
+                # A failed request may have been applied by the server as well
+                await cache.invalidate_for_write(path)
+        ttl = cache.get_ttl(path)
+        if ttl is None:
+            return await send()
+        key = make_cache_key(method, path, params, await self._token_proxy.get_auth_header())
+        cached = await cache.get(key)
+        if cached is not None:
+            request = httpx.Request(method, self.api_url + path, params=params)
+            return cached.to_response(request)
+        return await self._revalidate(cache, key, ttl, send)
+
+    async def _revalidate(
+        self,
+        cache: AbstractResponseCache,
+        key: CacheKey,
+        ttl: float,
+        send: SendRequest,
+    ) -> httpx.Response:
+        """Sends a conditional request if there is an expired response with validators"""
+        stale = await cache.get_stale(key)
+        conditional_headers = stale.get_conditional_headers() if stale is not None else {}
+        response = await send(conditional_headers)
+        if stale is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            await cache.set(key, stale, ttl)
+            return stale.to_response(response.request)
+        await cache.set(key, CachedResponse.from_response(response), ttl)
+        return response
 
     async def _request(  # type: ignore[no-untyped-def]
         self,
@@ -95,7 +286,6 @@ class HuntflowAPI:
         *,
         data=None,
         files=None,
-        json=None,
         content=None,
         params=None,
         headers=None,
@@ -103,20 +293,23 @@ class HuntflowAPI:
     ) -> httpx.Response:
         headers = headers or {}
         headers.update(await self._token_proxy.get_auth_header())
-        async with self.http_client as client:
-            response = await client.request(
-                method,
-                path,
-                data=data,
-                files=files,
-                json=json,
-                content=content,
-                params=params,
-                headers=headers,
-                timeout=timeout,
-            )
-
-        return response
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(headers)
+        send = functools.partial(
+            self.http_client.request,
+            method,
+            path,
+            data=data,
+            files=files,
+            content=content,
+            params=params,
+            headers=headers,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+        if self._concurrency_limiter is None:
+            return await send()
+        async with self._concurrency_limiter.slot():
+            return await send()
 
     async def _run_token_refresh(self) -> None:
         # Why do we have to check if token was changed?
@@ -138,10 +331,84 @@ class HuntflowAPI:
         if not await self._token_proxy.lock_for_update():
             return
         try:
-            refresh_data = await self._token_proxy.get_refresh_data()
-            async with self.http_client as client:
-                response = await client.post("/token/refresh", json=refresh_data)
-            await self._token_proxy.update(response.json())
+            # The token may have been refreshed by somebody else between the check above
+            # and acquiring of the lock (e.g. by another process), so check it once again
+            if await self._token_proxy.is_updated():
+                return
+            await self._refresh_token()
+        finally:
+            await self._token_proxy.release_lock()
+
+    async def _refresh_token(self) -> None:
+        refresh_data = await self._token_proxy.get_refresh_data()
+        response = await self.http_client.post("/token/refresh", json=refresh_data)
+        await self._token_proxy.update(response.json())
+
+    def start_token_refresher(self, margin: float, check_interval: float = 60.0) -> None:
+        """Start a background task which refreshes the token `margin` seconds
+        before its expiration.
+        The token is refreshed under the token proxy lock (see `lock_for_update`),
+        so several clients sharing the same token refresh it once.
+
+        :param margin: How many seconds before expiration to refresh the token
+        :param check_interval: Maximum interval (in seconds) between expiration checks.
+            The expiration time is re-read periodically, because the token may be
+            refreshed by another client
+        """
+        if self._token_refresher is not None and not self._token_refresher.done():
+            return
+        self._token_refresher = asyncio.create_task(
+            self._token_refresh_loop(margin, check_interval),
+        )
+
+    async def stop_token_refresher(self) -> None:
+        """Stop the background token refresh task"""
+        if self._token_refresher is None:
+            return
+        task, self._token_refresher = self._token_refresher, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _ensure_token_refresher(self) -> None:
+        if self._token_refresh_margin is not None and self._token_refresher is None:
+            self.start_token_refresher(self._token_refresh_margin)
+
+    async def _token_refresh_loop(self, margin: float, check_interval: float) -> None:
+        while True:
+            try:
+                delay = await self._get_token_refresh_delay(margin)
+                if delay <= 0:
+                    await self._run_proactive_token_refresh(margin)
+                    delay = await self._get_token_refresh_delay(margin)
+                if delay <= 0:
+                    # The token hasn't been refreshed (e.g. another client is refreshing it
+                    # right now) or it's short-lived: don't spin, check it later
+                    delay = check_interval
+            except Exception:
+                logger.exception("Background token refresh failed")
+                delay = check_interval
+            await asyncio.sleep(min(delay, check_interval))
+
+    async def _get_token_refresh_delay(self, margin: float) -> float:
+        expiration_timestamp = await self._token_proxy.get_expiration_timestamp()
+        if expiration_timestamp is None:
+            return float("inf")
+        return expiration_timestamp - margin - time.time()
+
+    async def _run_proactive_token_refresh(self, margin: float) -> None:
+        if not await self._token_proxy.lock_for_update():
+            return
+        try:
+            # The token may have been refreshed by another client while we were
+            # waiting for the lock, so check it once again
+            await self._token_proxy.reload()
+            if await self._get_token_refresh_delay(margin) > 0:
+                return
+            logger.debug("Refresh token before its expiration")
+            await self._refresh_token()
         finally:
             await self._token_proxy.release_lock()
 
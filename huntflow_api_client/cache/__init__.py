@@ -0,0 +1,22 @@
+from .base import (
+    DEFAULT_CACHE_RULES,
+    AbstractResponseCache,
+    CachedResponse,
+    CacheKey,
+    CacheRule,
+    make_cache_key,
+)
+from .disk import PERSISTENT_CACHE_RULES, SQLiteResponseCache
+from .memory import InMemoryResponseCache
+
+__all__ = (
+    "DEFAULT_CACHE_RULES",
+    "AbstractResponseCache",
+    "CacheKey",
+    "CacheRule",
+    "CachedResponse",
+    "InMemoryResponseCache",
+    "PERSISTENT_CACHE_RULES",
+    "SQLiteResponseCache",
+    "make_cache_key",
+)
@@ -0,0 +1,164 @@
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
+
+import httpx
+
+# method, path, query params, token identity
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...], str]
+
+
+def path_template_regex(template: str) -> str:
+    """Regex (without anchors) for a path template like "/accounts/{account_id}/tags",
+    every `{...}` placeholder matches one path segment
+    """
+    return re.sub(r"\\{[^/]*?\\}", "[^/]+", re.escape(template))
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Responses of GET requests to `path` are cached for `ttl` seconds.
+
+    `path` is a template like "/accounts/{account_id}/tags",
+    every `{...}` placeholder matches one path segment.
+    Write requests (any method except GET) invalidate the cached responses
+    of the same path and of its parent, if the write path matches the template itself
+    or the template with one more segment: e.g. `PUT /accounts/1/tags/2` invalidates
+    `GET /accounts/1/tags`.
+    Set `read_only` for resources which can't be changed through the API
+    (e.g. production calendars, whose POST endpoints are queries),
+    then write requests don't invalidate them.
+    """
+
+    path: str
+    ttl: float
+    read_only: bool = False
+    _regex: Pattern[str] = field(init=False, repr=False, compare=False)
+    _write_regex: Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        regex = path_template_regex(self.path)
+        object.__setattr__(self, "_regex", re.compile(f"{regex}$"))
+        object.__setattr__(self, "_write_regex", re.compile(f"{regex}(/[^/]+)?$"))
+
+    def match(self, path: str) -> bool:
+        return self._regex.match(path) is not None
+
+    def match_write(self, path: str) -> bool:
+        return not self.read_only and self._write_regex.match(path) is not None
+
+
+DEFAULT_CACHE_RULES = (
+    CacheRule("/accounts/{account_id}/regions", ttl=3600),
+    CacheRule("/accounts/{account_id}/rejection_reasons", ttl=600),
+    CacheRule("/accounts/{account_id}/vacancies/statuses", ttl=600),
+    CacheRule("/accounts/{account_id}/vacancies/additional_fields", ttl=3600),
+    CacheRule("/accounts/{account_id}/tags", ttl=300),
+    CacheRule("/accounts/{account_id}/dictionaries/{dict_code}", ttl=600),
+    CacheRule("/accounts/{account_id}/vacancy_hold_reasons", ttl=600),
+    CacheRule("/accounts/{account_id}/vacancy_close_reasons", ttl=600),
+    CacheRule("/production_calendars", ttl=86400, read_only=True),
+)
+
+
+# The body is kept decoded, these headers don't describe it anymore
+_CONTENT_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse":
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _CONTENT_HEADERS
+        ]
+        return cls(response.status_code, headers, response.content)
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """Headers to revalidate the response with a conditional request,
+        empty if the response has no validators (ETag, Last-Modified)
+        """
+        headers = httpx.Headers(self.headers)
+        conditional_headers = {}
+        if "etag" in headers:
+            conditional_headers["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional_headers["If-Modified-Since"] = headers["last-modified"]
+        return conditional_headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+def make_cache_key(
+    method: str,
+    path: str,
+    params: Any,
+    auth_header: Dict[str, str],
+) -> CacheKey:
+    """Responses depend on the token (different users see different data),
+    so the key includes a hash of the authorization header instead of the token itself.
+    """
+    query = tuple(sorted(httpx.QueryParams(params).multi_items()))
+    token_hash = hashlib.sha256(repr(sorted(auth_header.items())).encode()).hexdigest()
+    return method.upper(), path, query, token_hash
+
+
+class AbstractResponseCache(ABC):
+    """Cache of API responses for `HuntflowAPI` (see its `response_cache` param).
+    Only responses of paths matching `rules` are cached.
+    """
+
+    def __init__(self, rules: Sequence[CacheRule] = DEFAULT_CACHE_RULES):
+        self.rules = tuple(rules)
+
+    def get_ttl(self, path: str) -> Optional[float]:
+        """TTL for responses of the path or None if they aren't cached"""
+        for rule in self.rules:
+            if rule.match(path):
+                return rule.ttl
+        return None
+
+    async def invalidate_for_write(self, path: str) -> None:
+        """Invalidate responses affected by a write request to the path"""
+        if not any(rule.match_write(path) for rule in self.rules):
+            return
+        await self.invalidate(path, path.rsplit("/", 1)[0])
+
+    @abstractmethod
+    async def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Returns a cached response if it hasn't expired yet"""
+        pass
+
+    @abstractmethod
+    async def get_stale(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Returns a cached response even if it has expired,
+        it's used to revalidate the response with a conditional request
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: CacheKey, response: CachedResponse, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, *paths: str) -> None:
+        """Drop cached responses of the paths (with any query params and tokens)"""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
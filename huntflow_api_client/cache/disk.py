@@ -0,0 +1,149 @@
+import asyncio
+import json
+import sqlite3
+import time
+import zlib
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from huntflow_api_client.cache.base import (
+    DEFAULT_CACHE_RULES,
+    AbstractResponseCache,
+    CachedResponse,
+    CacheKey,
+    CacheRule,
+)
+
+T = TypeVar("T")
+
+# Large responses which rarely change
+PERSISTENT_CACHE_RULES = DEFAULT_CACHE_RULES + (
+    CacheRule("/accounts/{account_id}/applicants/{applicant_id}/externals/{external_id}", ttl=3600),
+    CacheRule("/production_calendars/{calendar_id}", ttl=86400, read_only=True),
+    CacheRule("/accounts/{account_id}/account_vacancy_requests/{vacancy_request_id}", ttl=3600),
+    CacheRule("/accounts/{account_id}/applicants/questionary", ttl=3600),
+)
+
+
+class SQLiteResponseCache(AbstractResponseCache):
+    """Responses are kept in a SQLite database file, so they survive restarts
+    of the process. The file may be shared by processes on the same host.
+    Response bodies are compressed with zlib. When the total size of compressed bodies
+    exceeds `max_size` bytes, the least recently used responses are dropped.
+    Expired responses are kept until they are dropped, so they can be revalidated.
+    Database queries are run in a thread pool executor to not block the event loop.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        rules: Sequence[CacheRule] = PERSISTENT_CACHE_RULES,
+        max_size: int = 256 * 1024 * 1024,
+        compression_level: int = 6,
+        timeout: float = 5.0,
+    ):
+        super().__init__(rules)
+        self._filename = filename
+        self._max_size = max_size
+        self._compression_level = compression_level
+        self._timeout = timeout
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._filename, timeout=self._timeout, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, path TEXT NOT NULL, status_code INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, content BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses (path)")
+            self._initialized = True
+        return connection
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _get(self, key: str, now: float, stale: bool) -> Optional[CachedResponse]:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT status_code, headers, content, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (not stale and row[3] <= now):
+                return None
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        finally:
+            connection.close()
+        status_code, headers, content, _ = row
+        return CachedResponse(
+            status_code,
+            [(name, value) for name, value in json.loads(headers)],
+            zlib.decompress(content),
+        )
+
+    def _set(self, key: str, path: str, response: CachedResponse, now: float, ttl: float) -> None:
+        content = zlib.compress(response.content, self._compression_level)
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, path, status_code, headers, content, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    content,
+                    len(content),
+                    now + ttl,
+                    now,
+                ),
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        rows = connection.execute("SELECT key, size FROM responses ORDER BY accessed_at DESC")
+        total_size = 0
+        evicted: List[str] = []
+        for key, size in rows:
+            total_size += size
+            if total_size > self._max_size:
+                evicted.append(key)
+        connection.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in evicted])
+
+    def _delete(self, paths: Optional[Sequence[str]]) -> None:
+        connection = self._connect()
+        try:
+            if paths is None:
+                connection.execute("DELETE FROM responses")
+            else:
+                connection.executemany(
+                    "DELETE FROM responses WHERE path = ?",
+                    [(path,) for path in paths],
+                )
+        finally:
+            connection.close()
+
+    async def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        return await self._run(self._get, json.dumps(key), time.time(), False)
+
+    async def get_stale(self, key: CacheKey) -> Optional[CachedResponse]:
+        return await self._run(self._get, json.dumps(key), time.time(), True)
+
+    async def set(self, key: CacheKey, response: CachedResponse, ttl: float) -> None:
+        await self._run(self._set, json.dumps(key), key[1], response, time.time(), ttl)
+
+    async def invalidate(self, *paths: str) -> None:
+        await self._run(self._delete, paths)
+
+    async def clear(self) -> None:
+        await self._run(self._delete, None)
@@ -0,0 +1,58 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+from huntflow_api_client.cache.base import (
+    DEFAULT_CACHE_RULES,
+    AbstractResponseCache,
+    CachedResponse,
+    CacheKey,
+    CacheRule,
+)
+
+
+class InMemoryResponseCache(AbstractResponseCache):
+    """Responses are kept in memory of the current process.
+    When there are more than `max_size` responses, the least recently used ones are dropped.
+    Expired responses are kept until they are dropped, so they can be revalidated.
+    """
+
+    def __init__(self, rules: Sequence[CacheRule] = DEFAULT_CACHE_RULES, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        super().__init__(rules)
+        self._max_size = max_size
+        self._entries: "OrderedDict[CacheKey, Tuple[CachedResponse, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        response, expires_at = entry
+        if expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def get_stale(self, key: CacheKey) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: CacheKey, response: CachedResponse, ttl: float) -> None:
+        self._entries[key] = (response, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, *paths: str) -> None:
+        for key in [key for key in self._entries if key[1] in paths]:
+            del self._entries[key]
+
+    async def clear(self) -> None:
+        self._entries.clear()
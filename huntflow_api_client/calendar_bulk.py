@@ -0,0 +1,200 @@
+import asyncio
+import datetime
+from collections import OrderedDict
+from itertools import islice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from huntflow_api_client.entities.production_calendars import ProductionCalendar
+from huntflow_api_client.models.request.production_calendars import (
+    DeadLineDate,
+    DeadLineDatesBulkRequest,
+)
+from huntflow_api_client.models.request.production_calendars import (
+    NonWorkingDays as NonWorkingDaysPeriod,
+)
+from huntflow_api_client.models.request.production_calendars import (
+    NonWorkingDaysBulkRequest,
+    StartDate,
+    StartDatesBulkRequest,
+)
+from huntflow_api_client.models.response.production_calendars import NonWorkingDays
+from huntflow_api_client.pagination import cancel_futures
+from huntflow_api_client.parsing import fetch_validated
+
+ItemT = TypeVar("ItemT", bound=BaseModel)
+ResultT = TypeVar("ResultT")
+T = TypeVar("T")
+
+SendChunk = Callable[[List[ItemT]], Awaitable[Sequence[ResultT]]]
+
+
+def _item_key(item: BaseModel) -> Hashable:
+    return (type(item).__name__, *(getattr(item, name) for name in type(item).model_fields))
+
+
+def _split(items: List[T], size: int) -> List[List[T]]:
+    iterator = iter(items)
+    return list(iter(lambda: list(islice(iterator, size)), []))
+
+
+def _is_memoizable(item: BaseModel) -> bool:
+    """Items without a date are counted from today on the server side, so they are not kept"""
+    return all(getattr(item, name) is not None for name in type(item).model_fields)
+
+
+class ProductionCalendarBulk:
+    """Runs bulk production calendar methods for any number of items.
+
+    Items are deduplicated, the unique ones are split into chunks of `chunk_size`
+    items (the server limit for a bulk request), and chunks are sent concurrently,
+    at most `concurrency` at once. Results are returned in the order of the items.
+
+    Results are memoized: items which have been answered by previous calls
+    are not sent again. Items without `start` / `deadline` dates depend on the current day,
+    so they are deduplicated within a call only. At most `memo_size` results are kept,
+    the least recently used ones are dropped.
+
+    Responses are validated whatever the client's response mode is,
+    results are models and dates.
+
+    :param calendar: Production calendar entity
+    :param calendar_id: Calendar ID
+    :param chunk_size: Maximum number of items in one request
+    :param concurrency: Maximum number of requests sent at once
+    :param memo_size: Maximum number of memoized results
+    """
+
+    def __init__(
+        self,
+        calendar: ProductionCalendar,
+        calendar_id: int,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        memo_size: int = 100_000,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._calendar = calendar
+        self.calendar_id = calendar_id
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def clear(self) -> None:
+        """Forget memoized results, e.g. after the calendar is changed"""
+        self._memo.clear()
+
+    async def get_non_working_days(
+        self,
+        periods: Iterable[NonWorkingDaysPeriod],
+    ) -> List[NonWorkingDays]:
+        """
+        :param periods: Periods with deadline, start fields
+        :return: The total number of non-working/working days for every period
+        """
+
+        async def send(chunk: List[NonWorkingDaysPeriod]) -> List[NonWorkingDays]:
+            response = await fetch_validated(
+                self._calendar.get_non_working_days_for_multiple_period,
+                self.calendar_id,
+                NonWorkingDaysBulkRequest(chunk),
+            )
+            return response.items
+
+        return await self._run(periods, send)
+
+    async def get_deadline_dates(self, items: Iterable[DeadLineDate]) -> List[datetime.date]:
+        """
+        :param items: Items with days, start fields
+        :return: Deadline for every item
+        """
+
+        async def send(chunk: List[DeadLineDate]) -> List[datetime.date]:
+            response = await fetch_validated(
+                self._calendar.get_multiple_deadline_dates_with_non_working_days,
+                self.calendar_id,
+                DeadLineDatesBulkRequest(chunk),
+            )
+            return response.items
+
+        return await self._run(items, send)
+
+    async def get_start_dates(self, items: Iterable[StartDate]) -> List[datetime.date]:
+        """
+        :param items: Items with days, deadline fields
+        :return: Start date for every item
+        """
+
+        async def send(chunk: List[StartDate]) -> List[datetime.date]:
+            response = await fetch_validated(
+                self._calendar.get_multiple_start_dates_with_non_working_days,
+                self.calendar_id,
+                StartDatesBulkRequest(chunk),
+            )
+            return response.items
+
+        return await self._run(items, send)
+
+    def _deduplicate(
+        self,
+        items: Iterable[ItemT],
+    ) -> Tuple[List[Hashable], Dict[Hashable, Any], Dict[Hashable, ItemT]]:
+        """Keys of all items, memoized results and unique items which are not memoized"""
+        keys: List[Hashable] = []
+        results: Dict[Hashable, Any] = {}
+        unique_items: Dict[Hashable, ItemT] = {}
+        for item in items:
+            key = _item_key(item)
+            keys.append(key)
+            if key in results or key in unique_items:
+                continue
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                results[key] = self._memo[key]
+            else:
+                unique_items[key] = item
+        return keys, results, unique_items
+
+    async def _run(self, items: Iterable[ItemT], send: SendChunk[ItemT, ResultT]) -> List[ResultT]:
+        keys, results, unique_items = self._deduplicate(items)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send_chunk(chunk: List[Tuple[Hashable, ItemT]]) -> None:
+            async with semaphore:
+                chunk_results = await send([item for _, item in chunk])
+            if len(chunk_results) != len(chunk):
+                raise ValueError(f"Expected {len(chunk)} results, got {len(chunk_results)}")
+            for (key, item), result in zip(chunk, chunk_results):
+                results[key] = result
+                if _is_memoizable(item):
+                    self._remember(key, result)
+
+        chunks = _split(list(unique_items.items()), self.chunk_size)
+        futures = [asyncio.ensure_future(send_chunk(chunk)) for chunk in chunks]
+        try:
+            await asyncio.gather(*futures)
+        finally:
+            cancel_futures(futures)
+        return [results[key] for key in keys]
+
+    def _remember(self, key: Hashable, result: Any) -> None:
+        self._memo[key] = result
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
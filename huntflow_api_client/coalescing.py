@@ -0,0 +1,106 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Pattern, Sequence
+
+import httpx
+
+from huntflow_api_client.cache.base import CachedResponse, CacheKey, path_template_regex
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class CoalescingMetrics:
+    # Requests which could be coalesced (safe methods, matching paths)
+    requests: int
+    # Requests which have joined an identical in-flight request
+    coalesced: int
+    in_flight: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Task[httpx.Response]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Single-flight for identical requests of safe methods (GET, HEAD, OPTIONS):
+    while a request is in flight, identical requests (same method, path, query params
+    and token) don't go to API, they wait for the first one
+    and get a copy of its response or its error.
+
+    :param paths: Path templates like "/accounts/{account_id}/vacancies/{vacancy_id}"
+        (every `{...}` matches one path segment) of requests to coalesce.
+        All paths are coalesced if not set.
+    :param exclude_paths: Path templates of requests which are never coalesced
+    """
+
+    def __init__(
+        self,
+        paths: Optional[Sequence[str]] = None,
+        exclude_paths: Sequence[str] = (),
+    ):
+        self._paths = self._compile(paths) if paths is not None else None
+        self._exclude_paths = self._compile(exclude_paths)
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    @staticmethod
+    def _compile(templates: Sequence[str]) -> Pattern[str]:
+        if not templates:
+            return re.compile("(?!)")
+        return re.compile("|".join(f"(?:{path_template_regex(path)})$" for path in templates))
+
+    @property
+    def metrics(self) -> CoalescingMetrics:
+        return CoalescingMetrics(
+            requests=self._requests,
+            coalesced=self._coalesced,
+            in_flight=len(self._flights),
+        )
+
+    def match(self, method: str, path: str) -> bool:
+        if method.upper() not in SAFE_METHODS:
+            return False
+        if self._exclude_paths.match(path):
+            return False
+        if self._paths is None:
+            return True
+        return self._paths.match(path) is not None
+
+    async def run(
+        self,
+        key: CacheKey,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Sends the request with `send` unless an identical one is in flight"""
+        self._requests += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(send()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+        else:
+            self._coalesced += 1
+        flight.waiters += 1
+        try:
+            response = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # Don't leave the request running if nobody waits for it
+            if flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        return CachedResponse.from_response(response).to_response(response.request)
+
+    def _finish(self, key: CacheKey, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
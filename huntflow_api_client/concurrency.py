@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Optional
+
+import httpx
+
+from huntflow_api_client.errors import ApiError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConcurrencyMetrics:
+    limit: int
+    in_flight: int
+    queue_depth: int
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Errors which mean that the API is overloaded: 429, 5xx and timeouts"""
+    if isinstance(error, ApiError):
+        return error.code == 429 or error.code >= 500
+    return isinstance(error, httpx.TimeoutException)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of in-flight requests and adjusts the limit
+    with AIMD (additive increase, multiplicative decrease):
+
+    * every successful request raises the limit by `increase / limit`,
+      i.e. by `increase` per window of `limit` requests, while at least
+      half of the limit is in use
+    * 429, 5xx, timeouts and latency spikes (latency greater than
+      `latency_tolerance` times the smoothed baseline latency) multiply the limit
+      by `decrease_factor`. Requests started before the last decrease don't
+      decrease the limit again, so a burst of failures cuts it once.
+
+    Requests above the limit wait in a FIFO queue.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        latency_smoothing: float = 0.1,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._latency_smoothing = latency_smoothing
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease_at = 0.0
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def metrics(self) -> ConcurrencyMetrics:
+        return ConcurrencyMetrics(
+            limit=self.limit,
+            in_flight=self.in_flight,
+            queue_depth=self.queue_depth,
+        )
+
+    async def acquire(self) -> None:
+        """Wait for a free slot"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been given to us already, pass it further
+                self._in_flight -= 1
+                self._wake_up_waiters()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(
+        self,
+        started_at: float,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+    ) -> None:
+        """Release a slot and adjust the limit.
+
+        :param started_at: Monotonic time when the request was started
+        :param latency: Latency of a successful request. None if the request failed
+        :param overloaded: True if the request failed because the API is overloaded
+        """
+        # The limit is considered as reached if at least half of it is used
+        saturated = self._in_flight * 2 >= self._limit
+        self._in_flight -= 1
+        if overloaded or (latency is not None and self._is_latency_spike(latency)):
+            self._decrease(started_at)
+        elif latency is not None and saturated:
+            self._limit = min(self._max_limit, self._limit + self._increase / self._limit)
+        self._wake_up_waiters()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Acquire a slot for a request, measure the request and release the slot"""
+        await self.acquire()
+        started_at = time.monotonic()
+        try:
+            yield
+        except BaseException as error:
+            self.release(started_at, overloaded=is_overload_error(error))
+            raise
+        self.release(started_at, latency=time.monotonic() - started_at)
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        if self._latency_tolerance is None:
+            return False
+        baseline = self._baseline_latency
+        if baseline is None:
+            self._baseline_latency = latency
+            return False
+        self._baseline_latency = baseline + self._latency_smoothing * (latency - baseline)
+        return latency > baseline * self._latency_tolerance
+
+    def _decrease(self, started_at: float) -> None:
+        if started_at < self._last_decrease_at:
+            return
+        self._last_decrease_at = time.monotonic()
+        self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+        logger.debug("Concurrency limit is decreased to %s", self.limit)
+
+    def _wake_up_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
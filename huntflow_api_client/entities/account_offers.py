@@ -3,10 +3,11 @@ from huntflow_api_client.models.response.account_offers import (
     AccountOfferResponse,
     AccountOffersListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class AccountOffer(BaseEntity, GetEntityMixin, ListEntityMixin):
-    async def list(self, account_id: int) -> AccountOffersListResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[AccountOffersListResponse]:
         """
         API method reference: https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/offers
 
@@ -15,9 +16,9 @@ class AccountOffer(BaseEntity, GetEntityMixin, ListEntityMixin):
         :return: List of organization's offers
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/offers")
-        return AccountOffersListResponse.model_validate(response.json())
+        return self._parse_response(AccountOffersListResponse, response)
 
-    async def get(self, account_id: int, offer_id: int) -> AccountOfferResponse:
+    async def get(self, account_id: int, offer_id: int) -> ModelOrRaw[AccountOfferResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/offers/-offer_id-
@@ -28,4 +29,4 @@ class AccountOffer(BaseEntity, GetEntityMixin, ListEntityMixin):
         :return: Organization's offer with a schema of values
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/offers/{offer_id}")
-        return AccountOfferResponse.model_validate(response.json())
+        return self._parse_response(AccountOfferResponse, response)
@@ -3,6 +3,7 @@ from huntflow_api_client.models.response.account_vacancy_request import (
     AccountVacancyRequestResponse,
     AccountVacancyRequestsListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class AccountVacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin):
@@ -10,7 +11,7 @@ class AccountVacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin):
         self,
         account_id: int,
         only_active: bool = True,
-    ) -> AccountVacancyRequestsListResponse:
+    ) -> ModelOrRaw[AccountVacancyRequestsListResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/account_vacancy_requests
@@ -24,13 +25,13 @@ class AccountVacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin):
             "only_active": only_active,
         }
         response = await self._api.request("GET", path, params=params)
-        return AccountVacancyRequestsListResponse.model_validate(response.json())
+        return self._parse_response(AccountVacancyRequestsListResponse, response)
 
     async def get(
         self,
         account_id: int,
         account_vacancy_request_id: int,
-    ) -> AccountVacancyRequestResponse:
+    ) -> ModelOrRaw[AccountVacancyRequestResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/account_vacancy_requests/-account_vacancy_request_id-
@@ -41,4 +42,4 @@ class AccountVacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = f"/accounts/{account_id}/account_vacancy_requests/{account_vacancy_request_id}"
         response = await self._api.request("GET", path)
-        return AccountVacancyRequestResponse.model_validate(response.json())
+        return self._parse_response(AccountVacancyRequestResponse, response)
@@ -4,19 +4,20 @@ from huntflow_api_client.models.response.accounts import (
     OrganizationInfoResponse,
     OrganizationsListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class Account(BaseEntity, GetEntityMixin, ListEntityMixin):
-    async def get_current_user(self) -> MeResponse:
+    async def get_current_user(self) -> ModelOrRaw[MeResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/me
 
         :return: Information about the current user
         """
         response = await self._api.request("GET", "/me")
-        return MeResponse.model_validate(response.json())
+        return self._parse_response(MeResponse, response)
 
-    async def list(self) -> OrganizationsListResponse:
+    async def list(self) -> ModelOrRaw[OrganizationsListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts
 
@@ -24,9 +25,9 @@ class Account(BaseEntity, GetEntityMixin, ListEntityMixin):
             associated with the passed authentication
         """
         response = await self._api.request("GET", "/accounts")
-        return OrganizationsListResponse.model_validate(response.json())
+        return self._parse_response(OrganizationsListResponse, response)
 
-    async def get(self, account_id: int) -> OrganizationInfoResponse:
+    async def get(self, account_id: int) -> ModelOrRaw[OrganizationInfoResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-
 
@@ -34,4 +35,4 @@ class Account(BaseEntity, GetEntityMixin, ListEntityMixin):
         :return: Information about the specified organization
         """
         response = await self._api.request("GET", f"/accounts/{account_id}")
-        return OrganizationInfoResponse.model_validate(response.json())
+        return self._parse_response(OrganizationInfoResponse, response)
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from huntflow_api_client.entities.base import BaseEntity, ListEntityMixin
 from huntflow_api_client.models.consts import ActionLogType
 from huntflow_api_client.models.response.action_logs import ActionLogsResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ActionLog(BaseEntity, ListEntityMixin):
@@ -13,7 +14,7 @@ class ActionLog(BaseEntity, ListEntityMixin):
         next_id: Optional[int] = None,
         previous_id: Optional[int] = None,
         count: Optional[int] = 30,
-    ) -> ActionLogsResponse:
+    ) -> ModelOrRaw[ActionLogsResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/action_logs
 
@@ -38,4 +39,4 @@ class ActionLog(BaseEntity, ListEntityMixin):
             f"/accounts/{account_id}/action_logs",
             params=params,
         )
-        return ActionLogsResponse.model_validate(response.json())
+        return self._parse_response(ActionLogsResponse, response)
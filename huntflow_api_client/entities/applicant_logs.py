@@ -1,12 +1,15 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from huntflow_api_client.entities.base import BaseEntity, CreateEntityMixin, ListEntityMixin
 from huntflow_api_client.models.consts import ApplicantLogType
 from huntflow_api_client.models.request.applicant_logs import CreateApplicantLogRequest
 from huntflow_api_client.models.response.applicant_logs import (
+    ApplicantLogItem,
     ApplicantLogResponse,
     CreateApplicantLogResponse,
 )
+from huntflow_api_client.pagination import paginate
+from huntflow_api_client.parsing import ModelOrRaw, get_field
 
 
 class ApplicantLog(BaseEntity, ListEntityMixin, CreateEntityMixin):
@@ -19,7 +22,7 @@ class ApplicantLog(BaseEntity, ListEntityMixin, CreateEntityMixin):
         personal: bool = False,
         count: int = 30,
         page: int = 1,
-    ) -> ApplicantLogResponse:
+    ) -> ModelOrRaw[ApplicantLogResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/-applicant_id-/logs
@@ -46,14 +49,57 @@ class ApplicantLog(BaseEntity, ListEntityMixin, CreateEntityMixin):
             params["vacancy"] = vacancy
 
         response = await self._api.request("GET", path, params=params)
-        return ApplicantLogResponse.model_validate(response.json())
+        return self._parse_response(ApplicantLogResponse, response)
+
+    async def iter_list(
+        self,
+        account_id: int,
+        applicant_id: int,
+        type_: Optional[ApplicantLogType] = None,
+        vacancy: Optional[int] = None,
+        personal: bool = False,
+        count: int = 30,
+        prefetch: bool = True,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ModelOrRaw[ApplicantLogItem]]:
+        """
+        Iterate over applicant's logs of all pages of `list` method.
+
+        :param account_id: Organization ID
+        :param applicant_id: Applicant ID
+        :param type_: Log type
+        :param vacancy: If supplied, only logs related to the specified vacancy will be returned
+        :param personal: If supplied, only logs not related to any vacancy will be returned
+        :param count: Number of items per page
+        :param prefetch: Request the next page while the current one is being processed
+        :param concurrency: Fetch pages concurrently, at most `concurrency` pages at once
+        :param ordered: Keep the order of pages when they are fetched concurrently
+
+        :return: Applicant's worklog
+        """
+
+        async def fetch_page(page: int) -> ModelOrRaw[ApplicantLogResponse]:
+            return await self.list(
+                account_id,
+                applicant_id,
+                type_,
+                vacancy,
+                personal,
+                count,
+                page,
+            )
+
+        async for page in paginate(fetch_page, prefetch, concurrency, ordered):
+            for item in get_field(page, "items"):
+                yield item
 
     async def create(
         self,
         account_id: int,
         applicant_id: int,
         data: CreateApplicantLogRequest,
-    ) -> CreateApplicantLogResponse:
+    ) -> ModelOrRaw[CreateApplicantLogResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/applicants/-applicant_id-/logs
@@ -68,6 +114,6 @@ class ApplicantLog(BaseEntity, ListEntityMixin, CreateEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/applicants/{applicant_id}/logs",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return CreateApplicantLogResponse.model_validate(response.json())
+        return self._parse_response(CreateApplicantLogResponse, response)
@@ -1,6 +1,7 @@
 from huntflow_api_client.entities.base import BaseEntity, GetEntityMixin, UpdateEntityMixin
 from huntflow_api_client.models.request.applicant_offers import ApplicantOfferUpdate
 from huntflow_api_client.models.response.applicant_offers import ApplicantVacancyOfferResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ApplicantOffer(BaseEntity, UpdateEntityMixin, GetEntityMixin):
@@ -27,7 +28,7 @@ class ApplicantOffer(BaseEntity, UpdateEntityMixin, GetEntityMixin):
         applicant_id: int,
         offer_id: int,
         data: ApplicantOfferUpdate,
-    ) -> ApplicantVacancyOfferResponse:
+    ) -> ModelOrRaw[ApplicantVacancyOfferResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/applicants/-applicant_id-/offers/-offer_id-
@@ -42,9 +43,9 @@ class ApplicantOffer(BaseEntity, UpdateEntityMixin, GetEntityMixin):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/applicants/{applicant_id}/offers/{offer_id}",
-            json=data.jsonable_dict(),
+            json=data.json_bytes(),
         )
-        return ApplicantVacancyOfferResponse.model_validate(response.json())
+        return self._parse_response(ApplicantVacancyOfferResponse, response)
 
     async def get(
         self,
@@ -52,7 +53,7 @@ class ApplicantOffer(BaseEntity, UpdateEntityMixin, GetEntityMixin):
         applicant_id: int,
         vacancy_frame_id: int,
         normalize: bool = False,
-    ) -> ApplicantVacancyOfferResponse:
+    ) -> ModelOrRaw[ApplicantVacancyOfferResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/-applicant_id-/vacancy_frames/-vacancy_frame_id-/offer
@@ -71,4 +72,4 @@ class ApplicantOffer(BaseEntity, UpdateEntityMixin, GetEntityMixin):
             f"/vacancy_frames/{vacancy_frame_id}/offer",
             params={"normalize": normalize},
         )
-        return ApplicantVacancyOfferResponse.model_validate(response.json())
+        return self._parse_response(ApplicantVacancyOfferResponse, response)
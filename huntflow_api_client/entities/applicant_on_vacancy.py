@@ -10,6 +10,7 @@ from huntflow_api_client.models.response.applicant_on_vacancy import (
     AddApplicantToVacancyResponse,
     ApplicantVacancySplitResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ApplicantOnVacancy(BaseEntity):
@@ -18,7 +19,7 @@ class ApplicantOnVacancy(BaseEntity):
         account_id: int,
         applicant_id: Union[str, int],
         data: AddApplicantToVacancyRequest,
-    ) -> AddApplicantToVacancyResponse:
+    ) -> ModelOrRaw[AddApplicantToVacancyResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/applicants/-applicant_id-/vacancy
@@ -33,16 +34,16 @@ class ApplicantOnVacancy(BaseEntity):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/applicants/{applicant_id}/vacancy",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return AddApplicantToVacancyResponse.model_validate(response.json())
+        return self._parse_response(AddApplicantToVacancyResponse, response)
 
     async def change_vacancy_status_for_applicant(
         self,
         account_id: int,
         applicant_id: int,
         data: ChangeVacancyApplicantStatusRequest,
-    ) -> AddApplicantToVacancyResponse:
+    ) -> ModelOrRaw[AddApplicantToVacancyResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/applicants/-applicant_id-/vacancy
@@ -55,16 +56,16 @@ class ApplicantOnVacancy(BaseEntity):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/applicants/{applicant_id}/vacancy",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return AddApplicantToVacancyResponse.model_validate(response.json())
+        return self._parse_response(AddApplicantToVacancyResponse, response)
 
     async def move_applicant_to_child_vacancy(
         self,
         account_id: int,
         vacancy_id: int,
         data: ApplicantVacancySplitRequest,
-    ) -> ApplicantVacancySplitResponse:
+    ) -> ModelOrRaw[ApplicantVacancySplitResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/applicants/vacancy/-vacancy_id-/split
@@ -77,6 +78,6 @@ class ApplicantOnVacancy(BaseEntity):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/applicants/vacancy/{vacancy_id}/split",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return ApplicantVacancySplitResponse.model_validate(response.json())
+        return self._parse_response(ApplicantVacancySplitResponse, response)
@@ -1,9 +1,10 @@
 from huntflow_api_client.entities.base import BaseEntity, ListEntityMixin
 from huntflow_api_client.models.response.applicant_on_vacancy_status import VacancyStatusesResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ApplicantOnVacancyStatus(BaseEntity, ListEntityMixin):
-    async def list(self, account_id: int) -> VacancyStatusesResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[VacancyStatusesResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/statuses
@@ -12,4 +13,4 @@ class ApplicantOnVacancyStatus(BaseEntity, ListEntityMixin):
         :return: List of available applicant on vacancy statuses (stages)
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/vacancies/statuses")
-        return VacancyStatusesResponse.model_validate(response.json())
+        return self._parse_response(VacancyStatusesResponse, response)
@@ -1,7 +1,12 @@
 from typing import Any, Dict, Optional
 
 from huntflow_api_client.entities.base import BaseEntity, ListEntityMixin
+from huntflow_api_client.models.response.applicant_response import (
+    ApplicantResponse as ApplicantResponseItem,
+)
 from huntflow_api_client.models.response.applicant_response import ApplicantResponsesListResponse
+from huntflow_api_client.pagination import CursorPaginator
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ApplicantResponse(BaseEntity, ListEntityMixin):
@@ -11,7 +16,7 @@ class ApplicantResponse(BaseEntity, ListEntityMixin):
         applicant_id: int,
         count: int = 30,
         next_page_cursor: Optional[str] = None,
-    ) -> ApplicantResponsesListResponse:
+    ) -> ModelOrRaw[ApplicantResponsesListResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/-applicant_id-/responses
@@ -28,4 +33,40 @@ class ApplicantResponse(BaseEntity, ListEntityMixin):
         if next_page_cursor:
             params["next_page_cursor"] = next_page_cursor
         response = await self._api.request("GET", path, params=params)
-        return ApplicantResponsesListResponse.model_validate(response.json())
+        return self._parse_response(ApplicantResponsesListResponse, response)
+
+    def iter_list(
+        self,
+        account_id: int,
+        applicant_id: int,
+        count: int = 30,
+        next_page_cursor: Optional[str] = None,
+        max_items: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        prefetch: bool = True,
+    ) -> CursorPaginator[ModelOrRaw[ApplicantResponseItem]]:
+        """
+        Iterate over applicant's responses of all pages of `list` method.
+
+        :param account_id: Organization ID
+        :param applicant_id: Applicant ID
+        :param count: Number of items per page
+        :param next_page_cursor: A cursor to continue from,
+            e.g. a saved `cursor` attribute of the returned paginator
+        :param max_items: Stop after this number of responses
+        :param time_budget: Stop after this number of seconds
+        :param prefetch: Request the next page while the current one is being processed
+
+        :return: Async iterator over applicant's responses from job sites
+        """
+
+        async def fetch_page(cursor: Optional[str]) -> ModelOrRaw[ApplicantResponsesListResponse]:
+            return await self.list(account_id, applicant_id, count, cursor)
+
+        return CursorPaginator(
+            fetch_page,
+            next_page_cursor,
+            max_items,
+            time_budget,
+            prefetch,
+        )
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from huntflow_api_client.entities.base import (
     BaseEntity,
@@ -16,7 +16,10 @@ from huntflow_api_client.models.response.applicants import (
     ApplicantItem,
     ApplicantListResponse,
     ApplicantSearchByCursorResponse,
+    ApplicantSearchItem,
 )
+from huntflow_api_client.pagination import CursorPaginator, paginate
+from huntflow_api_client.parsing import ModelOrRaw, get_field
 
 
 class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
@@ -28,7 +31,7 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
         status: Optional[int] = None,
         vacancy_id: Optional[int] = None,
         agreement_state: Optional[AgreementState] = None,
-    ) -> ApplicantListResponse:
+    ) -> ModelOrRaw[ApplicantListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants
 
@@ -54,13 +57,45 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
             f"/accounts/{account_id}/applicants",
             params=params,
         )
-        return ApplicantListResponse.model_validate(response.json())
+        return self._parse_response(ApplicantListResponse, response)
+
+    async def iter_list(
+        self,
+        account_id: int,
+        count: int = 30,
+        status: Optional[int] = None,
+        vacancy_id: Optional[int] = None,
+        agreement_state: Optional[AgreementState] = None,
+        prefetch: bool = True,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ModelOrRaw[ApplicantItem]]:
+        """
+        Iterate over applicants of all pages of `list` method.
+
+        :param account_id: Organization ID
+        :param count: Number of items per page
+        :param status: Vacancy status ID
+        :param vacancy_id: Vacancy ID
+        :param agreement_state: Agreement's state of applicant to personal data processing
+        :param prefetch: Request the next page while the current one is being processed
+        :param concurrency: Fetch pages concurrently, at most `concurrency` pages at once
+        :param ordered: Keep the order of pages when they are fetched concurrently
+        :return: Applicants
+        """
+
+        async def fetch_page(page: int) -> ModelOrRaw[ApplicantListResponse]:
+            return await self.list(account_id, count, page, status, vacancy_id, agreement_state)
+
+        async for page in paginate(fetch_page, prefetch, concurrency, ordered):
+            for item in get_field(page, "items"):
+                yield item
 
     async def create(
         self,
         account_id: int,
         data: ApplicantCreateRequest,
-    ) -> ApplicantCreateResponse:
+    ) -> ModelOrRaw[ApplicantCreateResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/applicants
 
@@ -71,11 +106,11 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/applicants",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return ApplicantCreateResponse.model_validate(response.json())
+        return self._parse_response(ApplicantCreateResponse, response)
 
-    async def get(self, account_id: int, applicant_id: int) -> ApplicantItem:
+    async def get(self, account_id: int, applicant_id: int) -> ModelOrRaw[ApplicantItem]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/-applicant_id-
@@ -88,14 +123,14 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
             "GET",
             f"/accounts/{account_id}/applicants/{applicant_id}",
         )
-        return ApplicantItem.model_validate(response.json())
+        return self._parse_response(ApplicantItem, response)
 
     async def patch(
         self,
         account_id: int,
         applicant_id: int,
         data: ApplicantUpdateRequest,
-    ) -> ApplicantItem:
+    ) -> ModelOrRaw[ApplicantItem]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#patch-/accounts/-account_id-/applicants/-applicant_id-
@@ -108,9 +143,9 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
         response = await self._api.request(
             "PATCH",
             f"/accounts/{account_id}/applicants/{applicant_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return ApplicantItem.model_validate(response.json())
+        return self._parse_response(ApplicantItem, response)
 
     async def delete(self, account_id: int, applicant_id: int) -> None:
         """
@@ -138,7 +173,7 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
         account_source: Optional[List[int]] = None,
         field: ApplicantSearchField = ApplicantSearchField.all,
         count: int = 30,
-    ) -> ApplicantSearchByCursorResponse:
+    ) -> ModelOrRaw[ApplicantSearchByCursorResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/search_by_cursor
@@ -185,4 +220,68 @@ class Applicant(BaseEntity, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
                 params["vacancy"] = vacancy if vacancy else "null"
 
         response = await self._api.request("GET", path, params=params)
-        return ApplicantSearchByCursorResponse.model_validate(response.json())
+        return self._parse_response(ApplicantSearchByCursorResponse, response)
+
+    def iter_search_by_cursor(
+        self,
+        account_id: int,
+        next_page_cursor: Optional[str] = None,
+        query: Optional[str] = None,
+        tag: Optional[List[int]] = None,
+        status: Optional[List[int]] = None,
+        rejection_reason: Optional[List[int]] = None,
+        vacancy: Union[List[int], None] = None,
+        only_current_status: bool = False,
+        account_source: Optional[List[int]] = None,
+        field: ApplicantSearchField = ApplicantSearchField.all,
+        count: int = 30,
+        max_items: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        prefetch: bool = True,
+    ) -> CursorPaginator[ModelOrRaw[ApplicantSearchItem]]:
+        """
+        Iterate over found applicants of all pages of `search_by_cursor` method.
+        The search parameters are the same as in `search_by_cursor` method.
+
+        :param account_id: Organization ID
+        :param next_page_cursor: A cursor to continue the search from,
+            e.g. a saved `cursor` attribute of the returned paginator
+        :param query: Search query
+        :param tag: List of tag ID
+        :param status: List of vacancy status ID
+        :param rejection_reason: List of rejection reason ID
+        :param vacancy: List of vacancy ID's or None
+        :param only_current_status: If the value is set to True,
+            then applicants who are currently at this status will be displayed.
+        :param account_source: List of resume source ID
+        :param field: Search field
+        :param count: Number of items per page
+        :param max_items: Stop after this number of applicants
+        :param time_budget: Stop after this number of seconds
+        :param prefetch: Request the next page while the current one is being processed
+
+        :return: Async iterator over found applicants
+        """
+
+        async def fetch_page(cursor: Optional[str]) -> ModelOrRaw[ApplicantSearchByCursorResponse]:
+            return await self.search_by_cursor(
+                account_id,
+                cursor,
+                query,
+                tag,
+                status,
+                rejection_reason,
+                vacancy,
+                only_current_status,
+                account_source,
+                field,
+                count,
+            )
+
+        return CursorPaginator(
+            fetch_page,
+            next_page_cursor,
+            max_items,
+            time_budget,
+            prefetch,
+        )
@@ -1,12 +1,20 @@
 import abc
+from typing import Type
+
+import httpx
 
 from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.parsing import ModelOrRaw, ModelT, parse_response
 
 
 class BaseEntity:
     def __init__(self, api: HuntflowAPI):
         self._api: HuntflowAPI = api
 
+    def _parse_response(self, model: Type[ModelT], response: httpx.Response) -> ModelOrRaw[ModelT]:
+        """Converts the response to `model` according to the client's response mode"""
+        return parse_response(model, response, self._api.response_mode, self._api.json_codec)
+
 
 class GetEntityMixin(abc.ABC):
     @abc.abstractmethod
@@ -1,8 +1,10 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from huntflow_api_client.entities.base import BaseEntity, GetEntityMixin, ListEntityMixin
 from huntflow_api_client.models.consts import MemberType
 from huntflow_api_client.models.response.coworkers import CoworkerResponse, CoworkersListResponse
+from huntflow_api_client.pagination import paginate
+from huntflow_api_client.parsing import ModelOrRaw, get_field
 
 
 class Coworker(BaseEntity, ListEntityMixin, GetEntityMixin):
@@ -14,7 +16,7 @@ class Coworker(BaseEntity, ListEntityMixin, GetEntityMixin):
         vacancy_id: Optional[Union[int, List[int]]] = None,
         count: Optional[int] = 30,
         page: Optional[int] = 1,
-    ) -> CoworkersListResponse:
+    ) -> ModelOrRaw[CoworkersListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/coworkers
 
@@ -43,14 +45,46 @@ class Coworker(BaseEntity, ListEntityMixin, GetEntityMixin):
             f"/accounts/{account_id}/coworkers",
             params=params,
         )
-        return CoworkersListResponse.model_validate(response.json())
+        return self._parse_response(CoworkersListResponse, response)
+
+    async def iter_list(
+        self,
+        account_id: int,
+        types: Optional[List[MemberType]] = None,
+        fetch_permissions: Optional[bool] = None,
+        vacancy_id: Optional[Union[int, List[int]]] = None,
+        count: int = 30,
+        prefetch: bool = True,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ModelOrRaw[CoworkerResponse]]:
+        """
+        Iterate over coworkers of all pages of `list` method.
+
+        :param account_id: Organization ID
+        :param types: Coworker types. Used to filter coworkers by their type (role).
+        :param fetch_permissions: Flag for returning coworker's permissions.
+        :param vacancy_id: Vacancy ID or list of Vacancy ID
+        :param count: Number of items per page
+        :param prefetch: Request the next page while the current one is being processed
+        :param concurrency: Fetch pages concurrently, at most `concurrency` pages at once
+        :param ordered: Keep the order of pages when they are fetched concurrently
+        :return: Coworkers
+        """
+
+        async def fetch_page(page: int) -> ModelOrRaw[CoworkersListResponse]:
+            return await self.list(account_id, types, fetch_permissions, vacancy_id, count, page)
+
+        async for page in paginate(fetch_page, prefetch, concurrency, ordered):
+            for item in get_field(page, "items"):
+                yield item
 
     async def get(
         self,
         account_id: int,
         coworker_id: int,
         vacancy_id: Optional[int] = None,
-    ) -> CoworkerResponse:
+    ) -> ModelOrRaw[CoworkerResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/coworkers/-coworker_id-
@@ -68,4 +102,4 @@ class Coworker(BaseEntity, ListEntityMixin, GetEntityMixin):
             f"/accounts/{account_id}/coworkers/{coworker_id}",
             params=params,
         )
-        return CoworkerResponse.model_validate(response.json())
+        return self._parse_response(CoworkerResponse, response)
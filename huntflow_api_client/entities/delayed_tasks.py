@@ -1,9 +1,10 @@
 from huntflow_api_client.entities.base import BaseEntity, GetEntityMixin
 from huntflow_api_client.models.response.delayed_tasks import DelayedTaskResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class DelayedTask(BaseEntity, GetEntityMixin):
-    async def get(self, account_id: int, task_id: str) -> DelayedTaskResponse:
+    async def get(self, account_id: int, task_id: str) -> ModelOrRaw[DelayedTaskResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/delayed_tasks/-task_id-
@@ -16,4 +17,4 @@ class DelayedTask(BaseEntity, GetEntityMixin):
 
         path = f"/accounts/{account_id}/delayed_tasks/{task_id}"
         response = await self._api.request("GET", path)
-        return DelayedTaskResponse.model_validate(response.json())
+        return self._parse_response(DelayedTaskResponse, response)
@@ -14,10 +14,11 @@ from huntflow_api_client.models.response.dictionaries import (
     DictionaryResponse,
     DictionaryTaskResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class Dictionary(BaseEntity, UpdateEntityMixin, ListEntityMixin, CreateEntityMixin, GetEntityMixin):
-    async def list(self, account_id: int) -> DictionariesListResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[DictionariesListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/dictionaries
 
@@ -26,14 +27,14 @@ class Dictionary(BaseEntity, UpdateEntityMixin, ListEntityMixin, CreateEntityMix
         """
         path = f"/accounts/{account_id}/dictionaries"
         response = await self._api.request("GET", path)
-        data = DictionariesListResponse.model_validate(response.json())
+        data = self._parse_response(DictionariesListResponse, response)
         return data
 
     async def create(
         self,
         account_id: int,
         data: DictionaryCreateRequest,
-    ) -> DictionaryTaskResponse:
+    ) -> ModelOrRaw[DictionaryTaskResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/dictionaries
@@ -43,10 +44,10 @@ class Dictionary(BaseEntity, UpdateEntityMixin, ListEntityMixin, CreateEntityMix
         :return: An object that contains the task ID of the delayed background update task
         """
         path = f"/accounts/{account_id}/dictionaries"
-        response = await self._api.request("POST", path, json=data.jsonable_dict(exclude_none=True))
-        return DictionaryTaskResponse.model_validate(response.json())
+        response = await self._api.request("POST", path, json=data.json_bytes(exclude_none=True))
+        return self._parse_response(DictionaryTaskResponse, response)
 
-    async def get(self, account_id: int, dict_code: str) -> DictionaryResponse:
+    async def get(self, account_id: int, dict_code: str) -> ModelOrRaw[DictionaryResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/dictionaries/-dictionary_code-
@@ -57,14 +58,14 @@ class Dictionary(BaseEntity, UpdateEntityMixin, ListEntityMixin, CreateEntityMix
         """
         path = f"/accounts/{account_id}/dictionaries/{dict_code}"
         response = await self._api.request("GET", path)
-        return DictionaryResponse.model_validate(response.json())
+        return self._parse_response(DictionaryResponse, response)
 
     async def update(
         self,
         account_id: int,
         dict_code: str,
         data: DictionaryUpdateRequest,
-    ) -> DictionaryTaskResponse:
+    ) -> ModelOrRaw[DictionaryTaskResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/dictionaries/-dictionary_code-
@@ -75,5 +76,5 @@ class Dictionary(BaseEntity, UpdateEntityMixin, ListEntityMixin, CreateEntityMix
         :return: An object that contains the task ID of the delayed background update task
         """
         path = f"/accounts/{account_id}/dictionaries/{dict_code}"
-        response = await self._api.request("PUT", path, json=data.jsonable_dict(exclude_none=True))
-        return DictionaryTaskResponse.model_validate(response.json())
+        response = await self._api.request("PUT", path, json=data.json_bytes(exclude_none=True))
+        return self._parse_response(DictionaryTaskResponse, response)
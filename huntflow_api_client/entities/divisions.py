@@ -6,6 +6,7 @@ from huntflow_api_client.models.response.divisions import (
     BatchDivisionsResponse,
     DivisionsListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class AccountDivision(BaseEntity, ListEntityMixin, CreateEntityMixin):
@@ -14,7 +15,7 @@ class AccountDivision(BaseEntity, ListEntityMixin, CreateEntityMixin):
         account_id: int,
         coworker_id: Optional[int] = None,
         only_available: bool = False,
-    ) -> DivisionsListResponse:
+    ) -> ModelOrRaw[DivisionsListResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/divisions
@@ -46,13 +47,13 @@ class AccountDivision(BaseEntity, ListEntityMixin, CreateEntityMixin):
             path,
             params=params,
         )
-        return DivisionsListResponse.model_validate(response.json())
+        return self._parse_response(DivisionsListResponse, response)
 
     async def create(
         self,
         account_id: int,
         divisions: BatchDivisionsRequest,
-    ) -> BatchDivisionsResponse:
+    ) -> ModelOrRaw[BatchDivisionsResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/divisions/batch
@@ -65,6 +66,6 @@ class AccountDivision(BaseEntity, ListEntityMixin, CreateEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/divisions/batch",
-            json=divisions.jsonable_dict(exclude_none=True),
+            json=divisions.json_bytes(exclude_none=True),
         )
-        return BatchDivisionsResponse.model_validate(response.json())
+        return self._parse_response(BatchDivisionsResponse, response)
@@ -1,9 +1,14 @@
 from huntflow_api_client.entities.base import BaseEntity, ListEntityMixin
 from huntflow_api_client.models.response.email_templates import MailTemplatesResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class MailTemplate(BaseEntity, ListEntityMixin):
-    async def list(self, account_id: int, editable: bool = False) -> MailTemplatesResponse:
+    async def list(
+        self,
+        account_id: int,
+        editable: bool = False,
+    ) -> ModelOrRaw[MailTemplatesResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/mail/templates
@@ -19,4 +24,4 @@ class MailTemplate(BaseEntity, ListEntityMixin):
             f"/accounts/{account_id}/mail/templates",
             params={"editable": editable},
         )
-        return MailTemplatesResponse.model_validate(response.json())
+        return self._parse_response(MailTemplatesResponse, response)
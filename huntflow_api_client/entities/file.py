@@ -1,8 +1,10 @@
-from typing import BinaryIO, Optional, Union
+from typing import Dict, Optional
 
 from huntflow_api_client.entities.base import BaseEntity
 from huntflow_api_client.models.request.file import UploadFileHeaders
 from huntflow_api_client.models.response.file import UploadResponse
+from huntflow_api_client.parsing import ModelOrRaw
+from huntflow_api_client.upload import FileSource, MultipartFileStream, ProgressCallback
 
 
 class File(BaseEntity):
@@ -10,27 +12,42 @@ class File(BaseEntity):
         self,
         account_id: int,
         headers: UploadFileHeaders,
-        file: Union[bytes, BinaryIO],
+        file: FileSource,
         preset: Optional[str] = None,
-    ) -> UploadResponse:
+        filename: Optional[str] = None,
+        size: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ModelOrRaw[UploadResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/upload
 
+        The file is streamed in chunks, see `MultipartFileStream` for supported sources:
+        bytes, binary file objects, paths, memory-mapped files and async iterables of bytes.
+
         :param account_id: Organization ID
         :param file: File
         :param preset: Preset
         :param headers: Headers
+        :param filename: File name, the name of the file source by default
+        :param size: File size, required to send an async iterable with Content-Length
+        :param progress: Called after every sent chunk with sent and total bytes of the file
         :return: Additional data
         """
 
-        data = {}
+        data: Dict[str, str] = {}
         if preset:
             data["preset"] = preset
+        stream = MultipartFileStream(
+            file,
+            fields=data,
+            filename=filename,
+            size=size,
+            progress=progress,
+        )
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/upload",
-            files={"file": file},
-            data=data,
-            headers=headers.jsonable_dict(exclude_none=True, by_alias=True),
+            content=stream,
+            headers={**headers.jsonable_dict(exclude_none=True, by_alias=True), **stream.headers},
         )
-        return UploadResponse.model_validate(response.json())
+        return self._parse_response(UploadResponse, response)
@@ -7,6 +7,7 @@ from huntflow_api_client.models.request.multi_vacancies import (
     MultiVacancyUpdateRequest,
 )
 from huntflow_api_client.models.response.muilti_vacancies import MultiVacancyResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class MultiVacancy(BaseEntity, CreateEntityMixin, UpdateEntityMixin):
@@ -14,7 +15,7 @@ class MultiVacancy(BaseEntity, CreateEntityMixin, UpdateEntityMixin):
         self,
         account_id: int,
         data: MultiVacancyCreateRequest,
-    ) -> MultiVacancyResponse:
+    ) -> ModelOrRaw[MultiVacancyResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/multi-vacancies
@@ -26,9 +27,9 @@ class MultiVacancy(BaseEntity, CreateEntityMixin, UpdateEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/multi-vacancies",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return MultiVacancyResponse.model_validate(response.json())
+        return self._parse_response(MultiVacancyResponse, response)
 
     async def update(
         self,
@@ -36,7 +37,7 @@ class MultiVacancy(BaseEntity, CreateEntityMixin, UpdateEntityMixin):
         vacancy_id: int,
         data: Union[MultiVacancyUpdateRequest, MultiVacancyPartialUpdateRequest],
         partial: bool = False,
-    ) -> MultiVacancyResponse:
+    ) -> ModelOrRaw[MultiVacancyResponse]:
         """
         API methods reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/multi-vacancies/-vacancy_id-
@@ -52,6 +53,6 @@ class MultiVacancy(BaseEntity, CreateEntityMixin, UpdateEntityMixin):
         response = await self._api.request(
             method,
             f"/accounts/{account_id}/multi-vacancies/{vacancy_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return MultiVacancyResponse.model_validate(response.json())
+        return self._parse_response(MultiVacancyResponse, response)
@@ -4,10 +4,11 @@ from huntflow_api_client.models.response.organization_settings import (
     CloseReasonsListResponse,
     HoldReasonsListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class OrganizationSettings(BaseEntity):
-    async def get_hold_reasons(self, account_id: int) -> HoldReasonsListResponse:
+    async def get_hold_reasons(self, account_id: int) -> ModelOrRaw[HoldReasonsListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancy_hold_reasons
@@ -19,9 +20,9 @@ class OrganizationSettings(BaseEntity):
             "GET",
             f"/accounts/{account_id}/vacancy_hold_reasons",
         )
-        return HoldReasonsListResponse.model_validate(response.json())
+        return self._parse_response(HoldReasonsListResponse, response)
 
-    async def get_close_reasons(self, account_id: int) -> CloseReasonsListResponse:
+    async def get_close_reasons(self, account_id: int) -> ModelOrRaw[CloseReasonsListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancy_close_reasons
@@ -33,13 +34,13 @@ class OrganizationSettings(BaseEntity):
             "GET",
             f"/accounts/{account_id}/vacancy_close_reasons",
         )
-        return CloseReasonsListResponse.model_validate(response.json())
+        return self._parse_response(CloseReasonsListResponse, response)
 
     async def get_applicant_survey_form(
         self,
         account_id: int,
         survey_id: int,
-    ) -> BaseSurveySchemaTypeWithSchemas:
+    ) -> ModelOrRaw[BaseSurveySchemaTypeWithSchemas]:
         """
         API method reference
            https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/surveys/type_a/-survey_id-
@@ -52,4 +53,4 @@ class OrganizationSettings(BaseEntity):
             "GET",
             f"/accounts/{account_id}/surveys/type_a/{survey_id}",
         )
-        return BaseSurveySchemaTypeWithSchemas.model_validate(response.json())
+        return self._parse_response(BaseSurveySchemaTypeWithSchemas, response)
@@ -15,10 +15,11 @@ from huntflow_api_client.models.response.production_calendars import (
     NonWorkingDaysBulkResponse,
     NonWorkingDaysResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
-    async def list(self) -> CalendarListResponse:
+    async def list(self) -> ModelOrRaw[CalendarListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/production_calendars
 
@@ -26,9 +27,9 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = "/production_calendars"
         response = await self._api.request("GET", path)
-        return CalendarListResponse.model_validate(response.json())
+        return self._parse_response(CalendarListResponse, response)
 
-    async def get(self, calendar_id: int) -> CalendarResponse:
+    async def get(self, calendar_id: int) -> ModelOrRaw[CalendarResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/production_calendars/-calendar_id-
 
@@ -37,9 +38,12 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = f"/production_calendars/{calendar_id}"
         response = await self._api.request("GET", path)
-        return CalendarResponse.model_validate(response.json())
+        return self._parse_response(CalendarResponse, response)
 
-    async def get_organizations_calendar(self, account_id: int) -> AccountCalendarResponse:
+    async def get_organizations_calendar(
+        self,
+        account_id: int,
+    ) -> ModelOrRaw[AccountCalendarResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/calendar
 
@@ -48,7 +52,7 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = f"/accounts/{account_id}/calendar"
         response = await self._api.request("GET", path)
-        return AccountCalendarResponse.model_validate(response.json())
+        return self._parse_response(AccountCalendarResponse, response)
 
     async def get_non_working_days_in_period(
         self,
@@ -56,7 +60,7 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         deadline: datetime.date,
         start: Optional[datetime.date] = None,
         verbose: Optional[bool] = True,
-    ) -> NonWorkingDaysResponse:
+    ) -> ModelOrRaw[NonWorkingDaysResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/production_calendars/-calendar_id-/days/-deadline-
@@ -74,13 +78,13 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
             params["start"] = start.strftime("%Y-%m-%d")
         path = f"/production_calendars/{calendar_id}/days/{deadline}"
         response = await self._api.request("GET", path, params=params)
-        return NonWorkingDaysResponse.model_validate(response.json())
+        return self._parse_response(NonWorkingDaysResponse, response)
 
     async def get_non_working_days_for_multiple_period(
         self,
         calendar_id: int,
         data: NonWorkingDaysBulkRequest,
-    ) -> NonWorkingDaysBulkResponse:
+    ) -> ModelOrRaw[NonWorkingDaysBulkResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/production_calendars/-calendar_id-/days
@@ -92,7 +96,7 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = f"/production_calendars/{calendar_id}/days"
         response = await self._api.request("POST", path, content=data.model_dump_json())
-        return NonWorkingDaysBulkResponse.model_validate(response.json())
+        return self._parse_response(NonWorkingDaysBulkResponse, response)
 
     async def get_deadline_date_with_non_working_days(
         self,
@@ -120,7 +124,7 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         self,
         calendar_id: int,
         data: DeadLineDatesBulkRequest,
-    ) -> DatesBulkResponse:
+    ) -> ModelOrRaw[DatesBulkResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/production_calendars/-calendar_id-/deadline
@@ -131,7 +135,7 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = f"/production_calendars/{calendar_id}/deadline"
         response = await self._api.request("POST", path, content=data.model_dump_json())
-        return DatesBulkResponse.model_validate(response.json())
+        return self._parse_response(DatesBulkResponse, response)
 
     async def get_start_date_with_non_working_days(
         self,
@@ -160,7 +164,7 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         self,
         calendar_id: int,
         data: StartDatesBulkRequest,
-    ) -> DatesBulkResponse:
+    ) -> ModelOrRaw[DatesBulkResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/production_calendars/-calendar_id-/start
@@ -171,4 +175,4 @@ class ProductionCalendar(BaseEntity, ListEntityMixin, GetEntityMixin):
         """
         path = f"/production_calendars/{calendar_id}/start"
         response = await self._api.request("POST", path, content=data.model_dump_json())
-        return DatesBulkResponse.model_validate(response.json())
+        return self._parse_response(DatesBulkResponse, response)
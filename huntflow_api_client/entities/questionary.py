@@ -7,10 +7,11 @@ from huntflow_api_client.entities.base import (
     UpdateEntityMixin,
 )
 from huntflow_api_client.models.response.questionary import QuestionarySchemaResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class ApplicantsQuestionary(BaseEntity, GetEntityMixin, CreateEntityMixin, UpdateEntityMixin):
-    async def get_schema(self, account_id: int) -> QuestionarySchemaResponse:
+    async def get_schema(self, account_id: int) -> ModelOrRaw[QuestionarySchemaResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/questionary
@@ -20,7 +21,7 @@ class ApplicantsQuestionary(BaseEntity, GetEntityMixin, CreateEntityMixin, Updat
         :return: A schema of applicant's questionary for organization
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/applicants/questionary")
-        return QuestionarySchemaResponse.model_validate(response.json())
+        return self._parse_response(QuestionarySchemaResponse, response)
 
     async def create(
         self,
@@ -1,9 +1,10 @@
 from huntflow_api_client.entities.base import BaseEntity, ListEntityMixin
 from huntflow_api_client.models.response.regions import RegionsListResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class Region(BaseEntity, ListEntityMixin):
-    async def list(self, account_id: int) -> RegionsListResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[RegionsListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/regions
 
@@ -11,4 +12,4 @@ class Region(BaseEntity, ListEntityMixin):
         :return: List of organization regions
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/regions")
-        return RegionsListResponse.model_validate(response.json())
+        return self._parse_response(RegionsListResponse, response)
@@ -1,9 +1,10 @@
 from huntflow_api_client.entities.base import BaseEntity, ListEntityMixin
 from huntflow_api_client.models.response.rejection_reason import RejectionReasonsListResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class RejectionReason(BaseEntity, ListEntityMixin):
-    async def list(self, account_id: int) -> RejectionReasonsListResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[RejectionReasonsListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/rejection_reasons
@@ -12,4 +13,4 @@ class RejectionReason(BaseEntity, ListEntityMixin):
         :return: List of applicant on vacancy rejection reasons
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/rejection_reasons")
-        return RejectionReasonsListResponse.model_validate(response.json())
+        return self._parse_response(RejectionReasonsListResponse, response)
@@ -9,6 +9,7 @@ from huntflow_api_client.models.response.resume import (
     ApplicantResumeResponse,
     ApplicantSourcesResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class Resume(BaseEntity, GetEntityMixin, DeleteEntityMixin, UpdateEntityMixin):
@@ -17,7 +18,7 @@ class Resume(BaseEntity, GetEntityMixin, DeleteEntityMixin, UpdateEntityMixin):
         account_id: int,
         applicant_id: int,
         external_id: int,
-    ) -> ApplicantResumeResponse:
+    ) -> ModelOrRaw[ApplicantResumeResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/-applicant_id-/externals/-external_id-
@@ -31,9 +32,9 @@ class Resume(BaseEntity, GetEntityMixin, DeleteEntityMixin, UpdateEntityMixin):
             "GET",
             f"/accounts/{account_id}/applicants/{applicant_id}/externals/{external_id}",
         )
-        return ApplicantResumeResponse.model_validate(response.json())
+        return self._parse_response(ApplicantResumeResponse, response)
 
-    async def get_sources(self, account_id: int) -> ApplicantSourcesResponse:
+    async def get_sources(self, account_id: int) -> ModelOrRaw[ApplicantSourcesResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/sources
@@ -42,7 +43,7 @@ class Resume(BaseEntity, GetEntityMixin, DeleteEntityMixin, UpdateEntityMixin):
         :return: List of applicant's resume sources
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/applicants/sources")
-        return ApplicantSourcesResponse.model_validate(response.json())
+        return self._parse_response(ApplicantSourcesResponse, response)
 
     async def delete(
         self,
@@ -69,7 +70,7 @@ class Resume(BaseEntity, GetEntityMixin, DeleteEntityMixin, UpdateEntityMixin):
         applicant_id: int,
         external_id: int,
         data: ApplicantResumeUpdateRequest,
-    ) -> ApplicantResumeResponse:
+    ) -> ModelOrRaw[ApplicantResumeResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/applicants/-applicant_id-/externals/-external_id-
@@ -83,9 +84,9 @@ class Resume(BaseEntity, GetEntityMixin, DeleteEntityMixin, UpdateEntityMixin):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/applicants/{applicant_id}/externals/{external_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return ApplicantResumeResponse.model_validate(response.json())
+        return self._parse_response(ApplicantResumeResponse, response)
 
     async def get_pdf(
         self,
@@ -11,6 +11,7 @@ from huntflow_api_client.models.response.survey import (
     SurveySchemasTypeQListResponse,
     SurveySchemaTypeQResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class SurveyTypeQ(
@@ -23,7 +24,7 @@ class SurveyTypeQ(
         self,
         account_id: int,
         active: bool = True,
-    ) -> SurveySchemasTypeQListResponse:
+    ) -> ModelOrRaw[SurveySchemasTypeQListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/surveys/type_q
@@ -38,9 +39,13 @@ class SurveyTypeQ(
             f"/accounts/{account_id}/surveys/type_q",
             params=params,
         )
-        return SurveySchemasTypeQListResponse.model_validate(response.json())
+        return self._parse_response(SurveySchemasTypeQListResponse, response)
 
-    async def get_schema(self, account_id: int, survey_id: int) -> SurveySchemaTypeQResponse:
+    async def get_schema(
+        self,
+        account_id: int,
+        survey_id: int,
+    ) -> ModelOrRaw[SurveySchemaTypeQResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/surveys/type_q/-survey_id-
@@ -53,13 +58,13 @@ class SurveyTypeQ(
             "GET",
             f"/accounts/{account_id}/surveys/type_q/{survey_id}",
         )
-        return SurveySchemaTypeQResponse.model_validate(response.json())
+        return self._parse_response(SurveySchemaTypeQResponse, response)
 
     async def create(
         self,
         account_id: int,
         request_data: SurveyQuestionaryCreateRequest,
-    ) -> SurveyQuestionaryResponse:
+    ) -> ModelOrRaw[SurveyQuestionaryResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/surveys/type_q/questionaries
@@ -71,11 +76,15 @@ class SurveyTypeQ(
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/surveys/type_q/questionaries",
-            data=request_data.jsonable_dict(),
+            json=request_data.json_bytes(),
         )
-        return SurveyQuestionaryResponse.model_validate(response.json())
+        return self._parse_response(SurveyQuestionaryResponse, response)
 
-    async def get(self, account_id: int, questionary_id: int) -> SurveyQuestionaryResponse:
+    async def get(
+        self,
+        account_id: int,
+        questionary_id: int,
+    ) -> ModelOrRaw[SurveyQuestionaryResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/surveys/type_q/questionaries/-questionary_id-
@@ -89,7 +98,7 @@ class SurveyTypeQ(
             "GET",
             f"/accounts/{account_id}/surveys/type_q/questionaries/{questionary_id}",
         )
-        return SurveyQuestionaryResponse.model_validate(response.json())
+        return self._parse_response(SurveyQuestionaryResponse, response)
 
     async def delete(self, account_id: int, questionary_id: int) -> None:
         """
@@ -104,7 +113,11 @@ class SurveyTypeQ(
             f"/accounts/{account_id}/surveys/type_q/questionaries/{questionary_id}",
         )
 
-    async def get_answer(self, account_id: int, answer_id: int) -> SurveyQuestionaryAnswerResponse:
+    async def get_answer(
+        self,
+        account_id: int,
+        answer_id: int,
+    ) -> ModelOrRaw[SurveyQuestionaryAnswerResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/surveys/type_q/answers/-answer_id-
@@ -118,4 +131,4 @@ class SurveyTypeQ(
             "GET",
             f"/accounts/{account_id}/surveys/type_q/answers/{answer_id}",
         )
-        return SurveyQuestionaryAnswerResponse.model_validate(response.json())
+        return self._parse_response(SurveyQuestionaryAnswerResponse, response)
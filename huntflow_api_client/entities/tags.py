@@ -13,10 +13,11 @@ from huntflow_api_client.models.response.tags import (
     AccountTagsListResponse,
     ApplicantTagsListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class AccountTag(BaseEntity, CRUDEntityMixin, ListEntityMixin):
-    async def get(self, account_id: int, account_tag_id: int) -> AccountTagResponse:
+    async def get(self, account_id: int, account_tag_id: int) -> ModelOrRaw[AccountTagResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/tags/-tag_id-
@@ -26,13 +27,13 @@ class AccountTag(BaseEntity, CRUDEntityMixin, ListEntityMixin):
         :return: The specified tag
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/tags/{account_tag_id}")
-        return AccountTagResponse.model_validate(response.json())
+        return self._parse_response(AccountTagResponse, response)
 
     async def create(
         self,
         account_id: int,
         account_tag: CreateAccountTagRequest,
-    ) -> AccountTagResponse:
+    ) -> ModelOrRaw[AccountTagResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/tags
 
@@ -43,16 +44,16 @@ class AccountTag(BaseEntity, CRUDEntityMixin, ListEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/tags",
-            json=account_tag.jsonable_dict(exclude_none=True),
+            json=account_tag.json_bytes(exclude_none=True),
         )
-        return AccountTagResponse.model_validate(response.json())
+        return self._parse_response(AccountTagResponse, response)
 
     async def update(
         self,
         account_id: int,
         account_tag_id: int,
         data: CreateAccountTagRequest,
-    ) -> AccountTagResponse:
+    ) -> ModelOrRaw[AccountTagResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/tags/-tag_id-
@@ -65,9 +66,9 @@ class AccountTag(BaseEntity, CRUDEntityMixin, ListEntityMixin):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/tags/{account_tag_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return AccountTagResponse.model_validate(response.json())
+        return self._parse_response(AccountTagResponse, response)
 
     async def delete(self, account_id: int, account_tag_id: int) -> None:
         """
@@ -82,7 +83,7 @@ class AccountTag(BaseEntity, CRUDEntityMixin, ListEntityMixin):
             f"/accounts/{account_id}/tags/{account_tag_id}",
         )
 
-    async def list(self, account_id: int) -> AccountTagsListResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[AccountTagsListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/tags
 
@@ -90,7 +91,7 @@ class AccountTag(BaseEntity, CRUDEntityMixin, ListEntityMixin):
         :return: List of tags in the organization.
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/tags")
-        return AccountTagsListResponse.model_validate(response.json())
+        return self._parse_response(AccountTagsListResponse, response)
 
 
 class ApplicantTag(BaseEntity, UpdateEntityMixin, ListEntityMixin):
@@ -99,7 +100,7 @@ class ApplicantTag(BaseEntity, UpdateEntityMixin, ListEntityMixin):
         account_id: int,
         applicant_id: int,
         data: UpdateApplicantTagsRequest,
-    ) -> ApplicantTagsListResponse:
+    ) -> ModelOrRaw[ApplicantTagsListResponse]:
         """
         API method reference
            https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/applicants/-applicant_id-/tags
@@ -112,11 +113,15 @@ class ApplicantTag(BaseEntity, UpdateEntityMixin, ListEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/applicants/{applicant_id}/tags",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return ApplicantTagsListResponse.model_validate(response.json())
+        return self._parse_response(ApplicantTagsListResponse, response)
 
-    async def list(self, account_id: int, applicant_id: int) -> ApplicantTagsListResponse:
+    async def list(
+        self,
+        account_id: int,
+        applicant_id: int,
+    ) -> ModelOrRaw[ApplicantTagsListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/applicants/-applicant_id-/tags
@@ -129,4 +134,4 @@ class ApplicantTag(BaseEntity, UpdateEntityMixin, ListEntityMixin):
             "GET",
             f"/accounts/{account_id}/applicants/{applicant_id}/tags",
         )
-        return ApplicantTagsListResponse.model_validate(response.json())
+        return self._parse_response(ApplicantTagsListResponse, response)
@@ -3,23 +3,24 @@ from huntflow_api_client.models.response.user_settings import (
     CalendarAccountsListResponse,
     EmailAccountsListResponse,
 )
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class UserSettings(BaseEntity):
-    async def get_email_accounts(self) -> EmailAccountsListResponse:
+    async def get_email_accounts(self) -> ModelOrRaw[EmailAccountsListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/email_accounts
 
         :return: List of user email accounts.
         """
         response = await self._api.request("GET", "/email_accounts")
-        return EmailAccountsListResponse.model_validate(response.json())
+        return self._parse_response(EmailAccountsListResponse, response)
 
-    async def get_calendar_accounts(self) -> CalendarAccountsListResponse:
+    async def get_calendar_accounts(self) -> ModelOrRaw[CalendarAccountsListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/calendar_accounts
 
         :return: List of user calendar accounts with associated calendars.
         """
         response = await self._api.request("GET", "/calendar_accounts")
-        return CalendarAccountsListResponse.model_validate(response.json())
+        return self._parse_response(CalendarAccountsListResponse, response)
@@ -1,9 +1,10 @@
 from huntflow_api_client.entities.base import BaseEntity, GetEntityMixin
 from huntflow_api_client.models.response.users import UserResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class User(BaseEntity, GetEntityMixin):
-    async def get(self, account_id: int, user_id: int) -> UserResponse:
+    async def get(self, account_id: int, user_id: int) -> ModelOrRaw[UserResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/users/-user_id-
@@ -13,4 +14,4 @@ class User(BaseEntity, GetEntityMixin):
         :return: The specified user with a list of his permissions
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/users/{user_id}")
-        return UserResponse.model_validate(response.json())
+        return self._parse_response(UserResponse, response)
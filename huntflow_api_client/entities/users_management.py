@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from huntflow_api_client.entities.base import BaseEntity
 from huntflow_api_client.models.request.users_management import ForeignUserRequest
@@ -9,6 +9,8 @@ from huntflow_api_client.models.response.users_management import (
     UserControlTaskResponse,
     UserInternalIDResponse,
 )
+from huntflow_api_client.pagination import paginate
+from huntflow_api_client.parsing import ModelOrRaw, get_field
 
 
 class UsersManagement(BaseEntity):
@@ -17,7 +19,7 @@ class UsersManagement(BaseEntity):
         account_id: int,
         count: Optional[int] = 30,
         page: Optional[int] = 1,
-    ) -> ForeignUsersListResponse:
+    ) -> ModelOrRaw[ForeignUsersListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/users/foreign
@@ -37,13 +39,40 @@ class UsersManagement(BaseEntity):
             f"/accounts/{account_id}/users/foreign",
             params=params,
         )
-        return ForeignUsersListResponse.model_validate(response.json())
+        return self._parse_response(ForeignUsersListResponse, response)
+
+    async def iter_users_with_foreign(
+        self,
+        account_id: int,
+        count: int = 30,
+        prefetch: bool = True,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ModelOrRaw[ForeignUserResponse]]:
+        """
+        Iterate over users of all pages of `get_users_with_foreign` method.
+
+        :param account_id: Organization ID
+        :param count: Number of items per page
+        :param prefetch: Request the next page while the current one is being processed
+        :param concurrency: Fetch pages concurrently, at most `concurrency` pages at once
+        :param ordered: Keep the order of pages when they are fetched concurrently
+
+        :return: Users with their foreign identifiers
+        """
+
+        async def fetch_page(page: int) -> ModelOrRaw[ForeignUsersListResponse]:
+            return await self.get_users_with_foreign(account_id, count, page)
+
+        async for page in paginate(fetch_page, prefetch, concurrency, ordered):
+            for item in get_field(page, "items"):
+                yield item
 
     async def get_user_by_foreign(
         self,
         account_id: int,
         foreign_user_id: str,
-    ) -> ForeignUserResponse:
+    ) -> ModelOrRaw[ForeignUserResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/users/foreign/-foreign_user_id-
@@ -58,9 +87,13 @@ class UsersManagement(BaseEntity):
             "GET",
             f"/accounts/{account_id}/users/foreign/{foreign_user_id}",
         )
-        return ForeignUserResponse.model_validate(response.json())
+        return self._parse_response(ForeignUserResponse, response)
 
-    async def get_user_control_task(self, account_id: int, task_id: str) -> UserControlTaskResponse:
+    async def get_user_control_task(
+        self,
+        account_id: int,
+        task_id: str,
+    ) -> ModelOrRaw[UserControlTaskResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/users/foreign/task/-task_id-
@@ -75,13 +108,13 @@ class UsersManagement(BaseEntity):
             "GET",
             f"/accounts/{account_id}/users/foreign/task/{task_id}",
         )
-        return UserControlTaskResponse.model_validate(response.json())
+        return self._parse_response(UserControlTaskResponse, response)
 
     async def create_user(
         self,
         account_id: int,
         data: ForeignUserRequest,
-    ) -> CreatedUserControlTaskResponse:
+    ) -> ModelOrRaw[CreatedUserControlTaskResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/users/foreign
@@ -96,13 +129,13 @@ class UsersManagement(BaseEntity):
             f"/accounts/{account_id}/users/foreign",
             content=data.model_dump_json(),
         )
-        return CreatedUserControlTaskResponse.model_validate(response.json())
+        return self._parse_response(CreatedUserControlTaskResponse, response)
 
     async def delete_user(
         self,
         account_id: int,
         foreign_user_id: str,
-    ) -> CreatedUserControlTaskResponse:
+    ) -> ModelOrRaw[CreatedUserControlTaskResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#delete-/accounts/-account_id-/users/foreign/-foreign_user_id-
@@ -114,13 +147,13 @@ class UsersManagement(BaseEntity):
             "DELETE",
             f"/accounts/{account_id}/users/foreign/{foreign_user_id}",
         )
-        return CreatedUserControlTaskResponse.model_validate(response.json())
+        return self._parse_response(CreatedUserControlTaskResponse, response)
 
     async def get_user_internal_id_by_foreign(
         self,
         account_id: int,
         foreign_user_id: str,
-    ) -> UserInternalIDResponse:
+    ) -> ModelOrRaw[UserInternalIDResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/users/foreign/-foreign_user_id-/id
@@ -135,14 +168,14 @@ class UsersManagement(BaseEntity):
             "GET",
             f"/accounts/{account_id}/users/foreign/{foreign_user_id}/id",
         )
-        return UserInternalIDResponse.model_validate(response.json())
+        return self._parse_response(UserInternalIDResponse, response)
 
     async def update_user(
         self,
         account_id: int,
         foreign_user_id: str,
         data: ForeignUserRequest,
-    ) -> CreatedUserControlTaskResponse:
+    ) -> ModelOrRaw[CreatedUserControlTaskResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/users/foreign/-foreign_user_id-
@@ -158,4 +191,4 @@ class UsersManagement(BaseEntity):
             f"/accounts/{account_id}/users/foreign/{foreign_user_id}",
             content=data.model_dump_json(),
         )
-        return CreatedUserControlTaskResponse.model_validate(response.json())
+        return self._parse_response(CreatedUserControlTaskResponse, response)
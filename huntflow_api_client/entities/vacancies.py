@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from huntflow_api_client.entities.base import BaseEntity, CRUDEntityMixin
 from huntflow_api_client.models.common import StatusResponse
@@ -16,18 +16,21 @@ from huntflow_api_client.models.response.vacancies import (
     VacancyCreateResponse,
     VacancyFrameQuotasResponse,
     VacancyFramesListResponse,
+    VacancyItem,
     VacancyListResponse,
     VacancyQuotasResponse,
     VacancyResponse,
     VacancyStatusGroupsResponse,
 )
+from huntflow_api_client.pagination import paginate
+from huntflow_api_client.parsing import ModelOrRaw, get_field
 
 
 class Vacancy(BaseEntity, CRUDEntityMixin):
     async def get_additional_fields_schema(
         self,
         account_id: int,
-    ) -> AdditionalFieldsSchemaResponse:
+    ) -> ModelOrRaw[AdditionalFieldsSchemaResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/additional_fields
@@ -39,7 +42,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
             "GET",
             f"/accounts/{account_id}/vacancies/additional_fields",
         )
-        return AdditionalFieldsSchemaResponse.model_validate(response.json())
+        return self._parse_response(AdditionalFieldsSchemaResponse, response)
 
     async def list(
         self,
@@ -48,7 +51,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         page: int = 1,
         mine: bool = False,
         state: Optional[Union[str, List[str]]] = None,
-    ) -> VacancyListResponse:
+    ) -> ModelOrRaw[VacancyListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies
 
@@ -71,9 +74,39 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
             f"/accounts/{account_id}/vacancies",
             params=params,
         )
-        return VacancyListResponse.model_validate(response.json())
+        return self._parse_response(VacancyListResponse, response)
 
-    async def get(self, account_id: int, vacancy_id: int) -> VacancyResponse:
+    async def iter_list(
+        self,
+        account_id: int,
+        count: int = 30,
+        mine: bool = False,
+        state: Optional[Union[str, List[str]]] = None,
+        prefetch: bool = True,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ModelOrRaw[VacancyItem]]:
+        """
+        Iterate over vacancies of all pages of `list` method.
+
+        :param account_id: Organization ID
+        :param count: Number of items per page
+        :param mine: Shows only vacancies that the current user is working on
+        :param state: The state of a vacancy
+        :param prefetch: Request the next page while the current one is being processed
+        :param concurrency: Fetch pages concurrently, at most `concurrency` pages at once
+        :param ordered: Keep the order of pages when they are fetched concurrently
+        :return: Vacancies
+        """
+
+        async def fetch_page(page: int) -> ModelOrRaw[VacancyListResponse]:
+            return await self.list(account_id, count, page, mine, state)
+
+        async for page in paginate(fetch_page, prefetch, concurrency, ordered):
+            for item in get_field(page, "items"):
+                yield item
+
+    async def get(self, account_id: int, vacancy_id: int) -> ModelOrRaw[VacancyResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/-vacancy_id-
@@ -83,9 +116,13 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         :return: The specified vacancy
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/vacancies/{vacancy_id}")
-        return VacancyResponse.model_validate(response.json())
+        return self._parse_response(VacancyResponse, response)
 
-    async def create(self, account_id: int, data: VacancyCreateRequest) -> VacancyCreateResponse:
+    async def create(
+        self,
+        account_id: int,
+        data: VacancyCreateRequest,
+    ) -> ModelOrRaw[VacancyCreateResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/vacancies
 
@@ -96,16 +133,16 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         response = await self._api.request(
             "POST",
             f"/accounts/{account_id}/vacancies",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return VacancyCreateResponse.model_validate(response.json())
+        return self._parse_response(VacancyCreateResponse, response)
 
     async def update(
         self,
         account_id: int,
         vacancy_id: int,
         data: VacancyUpdateRequest,
-    ) -> VacancyResponse:
+    ) -> ModelOrRaw[VacancyResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/vacancies/-vacancy_id-
@@ -118,9 +155,9 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/vacancies/{vacancy_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return VacancyResponse.model_validate(response.json())
+        return self._parse_response(VacancyResponse, response)
 
     async def delete(self, account_id: int, vacancy_id: int) -> None:
         """
@@ -137,7 +174,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         account_id: int,
         vacancy_id: int,
         data: VacancyUpdatePartialRequest,
-    ) -> VacancyResponse:
+    ) -> ModelOrRaw[VacancyResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#patch-/accounts/-account_id-/vacancies/-vacancy_id-
@@ -150,9 +187,9 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         response = await self._api.request(
             "PATCH",
             f"/accounts/{account_id}/vacancies/{vacancy_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return VacancyResponse.model_validate(response.json())
+        return self._parse_response(VacancyResponse, response)
 
     async def assign_coworker(
         self,
@@ -160,7 +197,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         vacancy_id: int,
         account_member_id: int,
         data: VacancyMemberCreateRequest,
-    ) -> StatusResponse:
+    ) -> ModelOrRaw[StatusResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#put-/accounts/-account_id-/vacancies/-vacancy_id-/members/-account_member_id-
@@ -174,9 +211,9 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         response = await self._api.request(
             "PUT",
             f"/accounts/{account_id}/vacancies/{vacancy_id}/members/{account_member_id}",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
-        return StatusResponse.model_validate(response.json())
+        return self._parse_response(StatusResponse, response)
 
     async def remove_coworker(
         self,
@@ -201,7 +238,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         self,
         account_id: int,
         vacancy_id: int,
-    ) -> VacancyFramesListResponse:
+    ) -> ModelOrRaw[VacancyFramesListResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/-vacancy_id-/frames
@@ -214,13 +251,13 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
             "GET",
             f"/accounts/{account_id}/vacancies/{vacancy_id}/frames",
         )
-        return VacancyFramesListResponse.model_validate(response.json())
+        return self._parse_response(VacancyFramesListResponse, response)
 
     async def get_last_frame(
         self,
         account_id: int,
         vacancy_id: int,
-    ) -> LastVacancyFrameResponse:
+    ) -> ModelOrRaw[LastVacancyFrameResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/-vacancy_id-/frame
@@ -233,14 +270,14 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
             "GET",
             f"/accounts/{account_id}/vacancies/{vacancy_id}/frame",
         )
-        return LastVacancyFrameResponse.model_validate(response.json())
+        return self._parse_response(LastVacancyFrameResponse, response)
 
     async def get_frame_quotas(
         self,
         account_id: int,
         vacancy_id: int,
         frame_id: int,
-    ) -> VacancyFrameQuotasResponse:
+    ) -> ModelOrRaw[VacancyFrameQuotasResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/-vacancy_id-/frames/-frame_id-/quotas
@@ -254,7 +291,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
             "GET",
             f"/accounts/{account_id}/vacancies/{vacancy_id}/frames/{frame_id}/quotas",
         )
-        return VacancyFrameQuotasResponse.model_validate(response.json())
+        return self._parse_response(VacancyFrameQuotasResponse, response)
 
     async def get_quotas(
         self,
@@ -262,7 +299,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         vacancy_id: int,
         count: int = 30,
         page: int = 1,
-    ) -> VacancyQuotasResponse:
+    ) -> ModelOrRaw[VacancyQuotasResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/-vacancy_id-/quotas
@@ -279,9 +316,12 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
             f"/accounts/{account_id}/vacancies/{vacancy_id}/quotas",
             params=params,
         )
-        return VacancyQuotasResponse.model_validate(response.json())
+        return self._parse_response(VacancyQuotasResponse, response)
 
-    async def get_vacancy_status_groups(self, account_id: int) -> VacancyStatusGroupsResponse:
+    async def get_vacancy_status_groups(
+        self,
+        account_id: int,
+    ) -> ModelOrRaw[VacancyStatusGroupsResponse]:
         """
         API method reference
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancies/status_groups
@@ -290,7 +330,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         :return: List of vacancy status groups.
         """
         response = await self._api.request("GET", f"/accounts/{account_id}/vacancies/status_groups")
-        return VacancyStatusGroupsResponse.model_validate(response.json())
+        return self._parse_response(VacancyStatusGroupsResponse, response)
 
     async def close(self, account_id: int, vacancy_id: int, data: VacancyCloseRequest) -> None:
         """
@@ -304,7 +344,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         await self._api.request(
             "POST",
             f"/accounts/{account_id}/vacancies/{vacancy_id}/state/close",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
 
     async def hold(self, account_id: int, vacancy_id: int, data: VacancyHoldRequest) -> None:
@@ -319,7 +359,7 @@ class Vacancy(BaseEntity, CRUDEntityMixin):
         await self._api.request(
             "POST",
             f"/accounts/{account_id}/vacancies/{vacancy_id}/state/hold",
-            json=data.jsonable_dict(exclude_none=True),
+            json=data.json_bytes(exclude_none=True),
         )
 
     async def resume(self, account_id: int, vacancy_id: int) -> None:
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from huntflow_api_client.entities.base import (
     BaseEntity,
@@ -7,10 +7,15 @@ from huntflow_api_client.entities.base import (
     ListEntityMixin,
 )
 from huntflow_api_client.models.request.vacancy_requests import CreateVacancyRequestRequest
+from huntflow_api_client.models.response.vacancy_requests import (
+    VacancyRequest as VacancyRequestItem,
+)
 from huntflow_api_client.models.response.vacancy_requests import (
     VacancyRequestListResponse,
     VacancyRequestResponse,
 )
+from huntflow_api_client.pagination import paginate
+from huntflow_api_client.parsing import ModelOrRaw, get_field
 
 
 class VacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin, CreateEntityMixin):
@@ -21,7 +26,7 @@ class VacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin, CreateEntityMi
         count: int = 30,
         page: int = 1,
         values: bool = False,
-    ) -> VacancyRequestListResponse:
+    ) -> ModelOrRaw[VacancyRequestListResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancy_requests
@@ -44,9 +49,44 @@ class VacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin, CreateEntityMi
             params["vacancy_id"] = vacancy_id
 
         response = await self._api.request("GET", path, params=params)
-        return VacancyRequestListResponse.model_validate(response.json())
+        return self._parse_response(VacancyRequestListResponse, response)
+
+    async def iter_list(
+        self,
+        account_id: int,
+        vacancy_id: Optional[int] = None,
+        count: int = 30,
+        values: bool = False,
+        prefetch: bool = True,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ModelOrRaw[VacancyRequestItem]]:
+        """
+        Iterate over vacancy requests of all pages of `list` method.
+
+        :param account_id: Organization ID
+        :param vacancy_id: Vacancy ID. If supplied,
+            only vacancy requests related to the specified vacancy will be returned
+        :param count: Number of items per page
+        :param values: Show values flag. If True, vacancy requests fields will be included
+        :param prefetch: Request the next page while the current one is being processed
+        :param concurrency: Fetch pages concurrently, at most `concurrency` pages at once
+        :param ordered: Keep the order of pages when they are fetched concurrently
+        :return: Vacancy requests
+        """
+
+        async def fetch_page(page: int) -> ModelOrRaw[VacancyRequestListResponse]:
+            return await self.list(account_id, vacancy_id, count, page, values)
+
+        async for page in paginate(fetch_page, prefetch, concurrency, ordered):
+            for item in get_field(page, "items"):
+                yield item
 
-    async def get(self, account_id: int, vacancy_request_id: int) -> VacancyRequestResponse:
+    async def get(
+        self,
+        account_id: int,
+        vacancy_request_id: int,
+    ) -> ModelOrRaw[VacancyRequestResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/vacancy_requests/-vacancy_request_id-
@@ -57,13 +97,13 @@ class VacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin, CreateEntityMi
         """
         path = f"/accounts/{account_id}/vacancy_requests/{vacancy_request_id}"
         response = await self._api.request("GET", path)
-        return VacancyRequestResponse.model_validate(response.json())
+        return self._parse_response(VacancyRequestResponse, response)
 
     async def create(
         self,
         account_id: int,
         request_data: CreateVacancyRequestRequest,
-    ) -> VacancyRequestResponse:
+    ) -> ModelOrRaw[VacancyRequestResponse]:
         """
         API method reference:
             https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/vacancy_requests
@@ -76,6 +116,6 @@ class VacancyRequest(BaseEntity, ListEntityMixin, GetEntityMixin, CreateEntityMi
         response = await self._api.request(
             "POST",
             path,
-            json=request_data.jsonable_dict(exclude_none=True),
+            json=request_data.json_bytes(exclude_none=True),
         )
-        return VacancyRequestResponse.model_validate(response.json())
+        return self._parse_response(VacancyRequestResponse, response)
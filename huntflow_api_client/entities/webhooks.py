@@ -6,10 +6,11 @@ from huntflow_api_client.entities.base import (
 )
 from huntflow_api_client.models.request.webhooks import WebhookRequest
 from huntflow_api_client.models.response.webhooks import WebhookResponse, WebhooksListResponse
+from huntflow_api_client.parsing import ModelOrRaw
 
 
 class Webhook(BaseEntity, ListEntityMixin, CreateEntityMixin, DeleteEntityMixin):
-    async def list(self, account_id: int) -> WebhooksListResponse:
+    async def list(self, account_id: int) -> ModelOrRaw[WebhooksListResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#get-/accounts/-account_id-/hooks
 
@@ -18,9 +19,9 @@ class Webhook(BaseEntity, ListEntityMixin, CreateEntityMixin, DeleteEntityMixin)
         """
         path = f"/accounts/{account_id}/hooks"
         response = await self._api.request("GET", path)
-        return WebhooksListResponse.model_validate(response.json())
+        return self._parse_response(WebhooksListResponse, response)
 
-    async def create(self, account_id: int, data: WebhookRequest) -> WebhookResponse:
+    async def create(self, account_id: int, data: WebhookRequest) -> ModelOrRaw[WebhookResponse]:
         """
         API method reference https://api.huntflow.ai/v2/docs#post-/accounts/-account_id-/hooks
 
@@ -29,8 +30,8 @@ class Webhook(BaseEntity, ListEntityMixin, CreateEntityMixin, DeleteEntityMixin)
         :return: Information about the webhook
         """
         path = f"/accounts/{account_id}/hooks"
-        response = await self._api.request("POST", path, json=data.jsonable_dict(exclude_none=True))
-        return WebhookResponse.model_validate(response.json())
+        response = await self._api.request("POST", path, json=data.json_bytes(exclude_none=True))
+        return self._parse_response(WebhookResponse, response)
 
     async def delete(self, account_id: int, webhook_id: int) -> None:
         """
@@ -60,3 +60,12 @@ class InvalidRefreshTokenError(ApiError):
 
 class TooManyRequestsError(ApiError):
     code = 429
+
+    def __init__(
+        self,
+        code: Optional[int] = None,
+        errors: Optional[List[Error]] = None,
+        retry_after: Optional[float] = None,
+    ):
+        self.retry_after = retry_after
+        super().__init__(code, errors)
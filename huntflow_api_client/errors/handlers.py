@@ -1,6 +1,7 @@
 import abc
+import time
 from json import JSONDecodeError
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import httpx
 
@@ -17,6 +18,7 @@ from huntflow_api_client.errors import (
     TokenExpiredError,
     TooManyRequestsError,
 )
+from huntflow_api_client.rate_limit.limiter import parse_retry_after
 
 
 class AbstractErrorHandler(abc.ABC):
@@ -122,7 +124,19 @@ class ErrorHandler429(AbstractErrorHandler):
         :param response: httpx.Response
         :raises TooManyRequestsError
         """
-        raise TooManyRequestsError(errors=self._parse_errors(response))
+        raise TooManyRequestsError(
+            errors=self._parse_errors(response),
+            retry_after=self._parse_retry_after(response),
+        )
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        now = time.time()
+        retry_at = parse_retry_after(value, now)
+        return None if retry_at is None else max(0.0, retry_at - now)
 
 
 ERROR_HANDLERS: Dict[int, AbstractErrorHandler] = {
@@ -0,0 +1,49 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+class AbstractJsonCodec(ABC):
+    """Encodes request bodies and decodes responses"""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        pass
+
+
+class StdlibJsonCodec(AbstractJsonCodec):
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(AbstractJsonCodec):
+    """Codec based on orjson (pip install huntflow-api-client[orjson])"""
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("orjson is not installed")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+def get_default_codec() -> AbstractJsonCodec:
+    """Returns orjson codec if orjson is installed, stdlib json codec otherwise"""
+    if orjson is not None:
+        return OrjsonCodec()
+    return StdlibJsonCodec()
@@ -0,0 +1,341 @@
+import asyncio
+import bisect
+import datetime
+from typing import Any, List, Optional, Sequence, Set, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment, unused-ignore]
+
+from huntflow_api_client.entities.production_calendars import ProductionCalendar
+from huntflow_api_client.models.request.production_calendars import (
+    DeadLineDatesBulkRequest,
+    NonWorkingDaysBulkRequest,
+    StartDatesBulkRequest,
+)
+from huntflow_api_client.models.response.production_calendars import (
+    DatesBulkResponse,
+    NonWorkingDays,
+    NonWorkingDaysBulkResponse,
+    NonWorkingDaysResponse,
+)
+from huntflow_api_client.parsing import fetch_validated
+
+# Ordinal of numpy datetime64 epoch (1970-01-01)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+DateArray = Union[Sequence[datetime.date], "np.ndarray[Any, Any]"]
+IntArray = Union[Sequence[int], "np.ndarray[Any, Any]"]
+
+
+def _to_dates(values: DateArray) -> "np.ndarray[Any, Any]":
+    if np is None:
+        raise RuntimeError("numpy is not installed")
+    return np.asarray(values, dtype="datetime64[D]")
+
+
+def _to_date(value: "np.datetime64") -> datetime.date:
+    return datetime.date.fromordinal(int(value.astype(int)) + _EPOCH_ORDINAL)
+
+
+class LocalProductionCalendar:
+    """Answers production calendar questions of `ProductionCalendar`
+    (non-working days in a period, deadline and start dates) without API calls.
+
+    Non-working days (weekends and holidays) of the calendar are downloaded once per year
+    with `ProductionCalendar.get_non_working_days_in_period(verbose=True)`
+    when a question needs the year, and are kept in memory.
+    Results are models whatever the client's response mode is.
+    Methods have the same parameters and return values as the `ProductionCalendar` ones:
+
+    * a period includes both `start` and `deadline` dates
+    * a deadline is the `days`-th working day after `start`
+    * a start date is the `days`-th working day before `deadline`
+    * `start` / `deadline` are today (local date) if not set
+
+    Batch methods (`*_batch`) take arrays of dates and answer the questions
+    for all of them at once with numpy business day functions
+    (pip install huntflow-api-client[numpy]).
+
+    :param calendar: Production calendar entity used to download non-working days
+    :param calendar_id: Calendar ID
+    """
+
+    def __init__(self, calendar: ProductionCalendar, calendar_id: int):
+        self._calendar = calendar
+        self.calendar_id = calendar_id
+        # Ordinals of non-working days of loaded years
+        self._non_working_days: List[int] = []
+        self._loaded_years: Set[int] = set()
+        self._lock = asyncio.Lock()
+        self._busdaycalendar: Optional["np.busdaycalendar"] = None
+
+    async def load(self, start: datetime.date, deadline: datetime.date) -> None:
+        """Downloads non-working days of years from `start` to `deadline`
+        unless they have been downloaded already
+        """
+        for year in range(start.year, deadline.year + 1):
+            if year in self._loaded_years:
+                continue
+            async with self._lock:
+                if year not in self._loaded_years:
+                    await self._load_year(year)
+
+    async def _load_year(self, year: int) -> None:
+        response = await fetch_validated(
+            self._calendar.get_non_working_days_in_period,
+            self.calendar_id,
+            deadline=datetime.date(year, 12, 31),
+            start=datetime.date(year, 1, 1),
+            verbose=True,
+        )
+        days = {day.toordinal() for day in response.items or ()}
+        self._non_working_days = sorted(days.union(self._non_working_days))
+        self._loaded_years.add(year)
+        self._busdaycalendar = None
+
+    def _count_non_working_days(self, first: int, last: int) -> int:
+        """Non-working days between `first` and `last` ordinals (inclusive)"""
+        days = self._non_working_days
+        return max(bisect.bisect_right(days, last) - bisect.bisect_left(days, first), 0)
+
+    async def _add_working_days(self, start: datetime.date, days: int) -> datetime.date:
+        """The smallest date with `days` working days after `start`:
+        the least fixed point of `date = start + days + non-working days till date`,
+        every iteration jumps over non-working days found since the previous one.
+        """
+        first = start.toordinal() + 1
+        date = start.toordinal() + days
+        while True:
+            await self.load(start, datetime.date.fromordinal(date))
+            next_date = start.toordinal() + days + self._count_non_working_days(first, date)
+            if next_date == date:
+                return datetime.date.fromordinal(date)
+            date = next_date
+
+    async def _subtract_working_days(self, deadline: datetime.date, days: int) -> datetime.date:
+        last = deadline.toordinal() - 1
+        date = deadline.toordinal() - days
+        while True:
+            await self.load(datetime.date.fromordinal(date), deadline)
+            next_date = deadline.toordinal() - days - self._count_non_working_days(date, last)
+            if next_date == date:
+                return datetime.date.fromordinal(date)
+            date = next_date
+
+    async def _get_non_working_days(
+        self,
+        deadline: datetime.date,
+        start: Optional[datetime.date],
+    ) -> NonWorkingDays:
+        start = start or datetime.date.today()
+        await self.load(start, deadline)
+        total_days = deadline.toordinal() - start.toordinal() + 1
+        return NonWorkingDays(
+            start=start,
+            deadline=deadline,
+            total_days=max(total_days, 0),
+            not_working_days=self._count_non_working_days(start.toordinal(), deadline.toordinal()),
+            production_calendar=self.calendar_id,
+        )
+
+    async def get_non_working_days_in_period(
+        self,
+        deadline: datetime.date,
+        start: Optional[datetime.date] = None,
+        verbose: Optional[bool] = True,
+    ) -> NonWorkingDaysResponse:
+        """
+        :param deadline: Deadline date
+        :param start: A date to start counting of non-working days
+        :param verbose: Extends the response with the items field —
+            list of weekends and holidays within given range
+        :return: The total number of non-working/working days and
+            a list of weekends and holidays within a range
+        """
+        period = await self._get_non_working_days(deadline, start)
+        items = None
+        if verbose:
+            days = self._non_working_days
+            first = bisect.bisect_left(days, period.start.toordinal())
+            last = bisect.bisect_right(days, deadline.toordinal())
+            items = [datetime.date.fromordinal(day) for day in days[first:last]]
+        return NonWorkingDaysResponse(**period.model_dump(), items=items)
+
+    async def get_non_working_days_for_multiple_period(
+        self,
+        data: NonWorkingDaysBulkRequest,
+    ) -> NonWorkingDaysBulkResponse:
+        """
+        :param data: List of dictionaries with deadline, start fields
+        :return: List of objects with the total number of non-working/working days for the
+            specified periods
+        """
+        items = [await self._get_non_working_days(item.deadline, item.start) for item in data.root]
+        return NonWorkingDaysBulkResponse(items=items)
+
+    async def get_deadline_date_with_non_working_days(
+        self,
+        days: int,
+        start: Optional[datetime.date] = None,
+    ) -> str:
+        """
+        :param days: Working days amount
+        :param start: A date to start counting
+        :return: Deadline after {days} working days (YYYY-MM-DD)
+        """
+        deadline = await self._add_working_days(start or datetime.date.today(), days)
+        return deadline.isoformat()
+
+    async def get_multiple_deadline_dates_with_non_working_days(
+        self,
+        data: DeadLineDatesBulkRequest,
+    ) -> DatesBulkResponse:
+        """
+        :param data: List of dictionaries with days, start fields
+        :return: List of deadlines
+        """
+        today = datetime.date.today()
+        items = [await self._add_working_days(item.start or today, item.days) for item in data.root]
+        return DatesBulkResponse(items=items)
+
+    async def get_start_date_with_non_working_days(
+        self,
+        days: int,
+        deadline: Optional[datetime.date] = None,
+    ) -> str:
+        """
+        :param days: Working days amount
+        :param deadline: A date to start reverse counting
+        :return: A date {days} working days before the deadline (YYYY-MM-DD)
+        """
+        start = await self._subtract_working_days(deadline or datetime.date.today(), days)
+        return start.isoformat()
+
+    async def get_multiple_start_dates_with_non_working_days(
+        self,
+        data: StartDatesBulkRequest,
+    ) -> DatesBulkResponse:
+        """
+        :param data: List of dictionaries with days, deadline fields
+        :return: List of start dates
+        """
+        today = datetime.date.today()
+        items = [
+            await self._subtract_working_days(item.deadline or today, item.days)
+            for item in data.root
+        ]
+        return DatesBulkResponse(items=items)
+
+    def _get_busdaycalendar(self) -> "np.busdaycalendar":
+        """All days are business days except the downloaded non-working days"""
+        if self._busdaycalendar is None:
+            holidays = np.array(self._non_working_days, dtype=np.int64) - _EPOCH_ORDINAL
+            self._busdaycalendar = np.busdaycalendar(
+                weekmask="1111111",
+                holidays=holidays.astype("datetime64[D]"),
+            )
+        return self._busdaycalendar
+
+    def _is_loaded(self, first: "np.datetime64", last: "np.datetime64") -> bool:
+        years = range(_to_date(first).year, _to_date(last).year + 1)
+        return all(year in self._loaded_years for year in years)
+
+    async def count_non_working_days_batch(
+        self,
+        starts: DateArray,
+        deadlines: DateArray,
+    ) -> "np.ndarray[Any, Any]":
+        """Vectorized `get_non_working_days_in_period(...).not_working_days`
+
+        :param starts: Start dates of periods
+        :param deadlines: Deadline dates of periods
+        :return: Array with the number of non-working days in every period
+        """
+        start_dates, deadline_dates = _to_dates(starts), _to_dates(deadlines)
+        if not start_dates.size:
+            return np.zeros(0, dtype=np.int64)
+        dates = np.concatenate([start_dates, deadline_dates])
+        await self.load(_to_date(dates.min()), _to_date(dates.max()))
+        total_days = (deadline_dates - start_dates).astype(np.int64) + 1
+        working_days = np.busday_count(
+            start_dates,
+            deadline_dates + 1,
+            busdaycal=self._get_busdaycalendar(),
+        )
+        return np.where(total_days > 0, total_days - working_days, 0)
+
+    async def count_working_days_batch(
+        self,
+        starts: DateArray,
+        deadlines: DateArray,
+    ) -> "np.ndarray[Any, Any]":
+        """Number of working days in every period, both dates are included,
+        e.g. `work_days_in_work` of vacancy quotas (from creation to closing)
+
+        :param starts: Start dates of periods
+        :param deadlines: Deadline dates of periods
+        """
+        start_dates, deadline_dates = _to_dates(starts), _to_dates(deadlines)
+        non_working_days = await self.count_non_working_days_batch(start_dates, deadline_dates)
+        total_days = (deadline_dates - start_dates).astype(np.int64) + 1
+        return np.maximum(total_days, 0) - non_working_days
+
+    async def get_deadline_dates_batch(
+        self,
+        starts: DateArray,
+        days: IntArray,
+    ) -> "np.ndarray[Any, Any]":
+        """Vectorized `get_deadline_date_with_non_working_days`
+
+        :param starts: Dates to start counting
+        :param days: Working days amounts
+        :return: Array of deadlines (datetime64[D])
+        """
+        start_dates, days_array = _to_dates(starts), np.asarray(days, dtype=np.int64)
+        if not start_dates.size:
+            return start_dates
+        first, last = start_dates.min(), start_dates.max()
+        while True:
+            await self.load(_to_date(first), _to_date(last))
+            # A non-working start is rolled back to a working day:
+            # there are no working days between them, so the result is the same
+            deadlines = np.busday_offset(
+                start_dates,
+                days_array,
+                roll="backward",
+                busdaycal=self._get_busdaycalendar(),
+            )
+            deadlines = np.where(days_array == 0, start_dates, deadlines)
+            last = max(last, deadlines.max())
+            if self._is_loaded(first, last):
+                return deadlines
+
+    async def get_start_dates_batch(
+        self,
+        deadlines: DateArray,
+        days: IntArray,
+    ) -> "np.ndarray[Any, Any]":
+        """Vectorized `get_start_date_with_non_working_days`
+
+        :param deadlines: Dates to start reverse counting
+        :param days: Working days amounts
+        :return: Array of start dates (datetime64[D])
+        """
+        deadline_dates, days_array = _to_dates(deadlines), np.asarray(days, dtype=np.int64)
+        if not deadline_dates.size:
+            return deadline_dates
+        first, last = deadline_dates.min(), deadline_dates.max()
+        while True:
+            await self.load(_to_date(first), _to_date(last))
+            starts = np.busday_offset(
+                deadline_dates,
+                -days_array,
+                roll="forward",
+                busdaycal=self._get_busdaycalendar(),
+            )
+            starts = np.where(days_array == 0, deadline_dates, starts)
+            first = min(first, starts.min())
+            if self._is_loaded(first, last):
+                return starts
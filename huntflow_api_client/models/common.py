@@ -1,4 +1,3 @@
-import json
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Set, Union
 
@@ -29,19 +28,43 @@ class JsonRequestModel(BaseModel):
         round_trip: bool = False,
         warnings: bool = True,
     ) -> Dict[str, Any]:
-        return json.loads(
-            self.model_dump_json(
-                include=include,
-                exclude=exclude,
-                by_alias=by_alias,
-                exclude_unset=exclude_unset,
-                exclude_defaults=exclude_defaults,
-                exclude_none=exclude_none,
-                round_trip=round_trip,
-                warnings=warnings,
-            ),
+        """Dict of JSON compatible values, the same as `json.loads(self.model_dump_json())`"""
+        return self.model_dump(
+            mode="json",
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=warnings,
         )
 
+    def json_bytes(
+        self,
+        *,
+        include: Optional[_FieldSet] = None,
+        exclude: Optional[_FieldSet] = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        warnings: bool = True,
+    ) -> bytes:
+        """Encoded JSON to pass as `json` argument of `HuntflowAPI.request`"""
+        return self.model_dump_json(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=warnings,
+        ).encode()
+
 
 class PaginatedResponse(BaseModel):
     page: PositiveInt = Field(..., description="Page number")
@@ -0,0 +1,261 @@
+import asyncio
+import functools
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
+
+from huntflow_api_client.parsing import RawData, get_field
+from huntflow_api_client.retry import RetryPolicy
+
+# A page model with `total_pages` or its raw data in RAW response mode
+PageT = TypeVar("PageT")
+ItemT = TypeVar("ItemT")
+ItemT_co = TypeVar("ItemT_co", covariant=True)
+
+FetchPage = Callable[[int], Awaitable[PageT]]
+
+
+class CursorPage(Protocol[ItemT_co]):
+    @property
+    def items(self) -> Sequence[ItemT_co]:
+        pass
+
+    @property
+    def next_page_cursor(self) -> Optional[str]:
+        pass
+
+
+FetchCursorPage = Callable[[Optional[str]], Awaitable[Union[CursorPage[ItemT], RawData]]]
+
+
+async def iter_pages(
+    fetch_page: FetchPage[PageT],
+    start_page: int = 1,
+    prefetch: bool = True,
+) -> AsyncGenerator[PageT, None]:
+    """Iterate over pages of a page/count list endpoint until `total_pages` is reached.
+    With `prefetch` the next page is requested in background while the caller
+    processes the current one.
+
+    :param fetch_page: Coroutine function which takes a page number and returns the page
+    :param start_page: Number of the first page
+    :param prefetch: Request the next page before the current one is processed
+    """
+    page_number = start_page
+    next_page: Optional["asyncio.Future[PageT]"] = None
+    page = await fetch_page(page_number)
+    try:
+        while True:
+            has_next = page_number < get_field(page, "total_pages")
+            if has_next and prefetch:
+                next_page = asyncio.ensure_future(fetch_page(page_number + 1))
+            yield page
+            if not has_next:
+                return
+            page_number += 1
+            if next_page is not None:
+                page, next_page = await next_page, None
+            else:
+                page = await fetch_page(page_number)
+    finally:
+        cancel_futures([next_page])
+
+
+async def fetch_pages(
+    fetch_page: FetchPage[PageT],
+    concurrency: int = 4,
+    ordered: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> AsyncGenerator[PageT, None]:
+    """Fetch the first page, then fetch the rest pages (up to `total_pages`) concurrently.
+    At most `concurrency` pages are requested at once, a new page is requested
+    as soon as one of them is done.
+
+    :param fetch_page: Coroutine function which takes a page number and returns the page
+    :param concurrency: Maximum number of pages requested at once
+    :param ordered: Yield pages in order of their numbers.
+        Otherwise pages are yielded as soon as they are fetched
+    :param retry_policy: Policy to retry a failed page without restarting the whole fetch.
+        Usually the client's `retry_policy` is enough
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def fetch(page_number: int) -> PageT:
+        attempt = functools.partial(fetch_page, page_number)
+        if retry_policy is None:
+            return await attempt()
+        return await retry_policy.run("GET", f"page {page_number}", attempt)
+
+    first_page = await fetch(1)
+    yield first_page
+    page_numbers = iter(range(2, get_field(first_page, "total_pages") + 1))
+
+    def start_next() -> Optional["asyncio.Future[PageT]"]:
+        page_number = next(page_numbers, None)
+        return None if page_number is None else asyncio.ensure_future(fetch(page_number))
+
+    fetch_rest = _fetch_ordered if ordered else _fetch_as_completed
+    pages = fetch_rest(start_next, concurrency)
+    try:
+        async for page in pages:
+            yield page
+    finally:
+        await pages.aclose()
+
+
+async def _fetch_ordered(
+    start_next: Callable[[], Optional["asyncio.Future[PageT]"]],
+    concurrency: int,
+) -> AsyncGenerator[PageT, None]:
+    queue: Deque["asyncio.Future[PageT]"] = deque()
+    try:
+        while True:
+            while len(queue) < concurrency and (future := start_next()) is not None:
+                queue.append(future)
+            if not queue:
+                return
+            page = await queue[0]
+            queue.popleft()
+            yield page
+    finally:
+        cancel_futures(queue)
+
+
+async def _fetch_as_completed(
+    start_next: Callable[[], Optional["asyncio.Future[PageT]"]],
+    concurrency: int,
+) -> AsyncGenerator[PageT, None]:
+    pending: Set["asyncio.Future[PageT]"] = set()
+    done: Set["asyncio.Future[PageT]"] = set()
+    try:
+        while True:
+            while len(pending) < concurrency and (future := start_next()) is not None:
+                pending.add(future)
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            while done:
+                yield done.pop().result()
+    finally:
+        cancel_futures(pending | done)
+
+
+def paginate(
+    fetch_page: FetchPage[PageT],
+    prefetch: bool = True,
+    concurrency: Optional[int] = None,
+    ordered: bool = True,
+) -> AsyncGenerator[PageT, None]:
+    """Iterate over all pages one by one (see `iter_pages`)
+    or concurrently if `concurrency` is set (see `fetch_pages`)
+    """
+    if concurrency is None:
+        return iter_pages(fetch_page, prefetch=prefetch)
+    return fetch_pages(fetch_page, concurrency=concurrency, ordered=ordered)
+
+
+class CursorPaginator(Generic[ItemT]):
+    """Async iterator over items of an endpoint with `next_page_cursor` pagination.
+    It follows the cursor until the last page, the next page is requested
+    in background while the items of the current one are processed.
+
+    `cursor` is the cursor of the page the last yielded item belongs to.
+    Save it as a checkpoint: a paginator created with this cursor continues
+    from the same page, so at most one page of items is repeated after a restart.
+
+    :param fetch_page: Coroutine function which takes a cursor (None for the first page)
+        and returns the page
+    :param cursor: Cursor to start from, e.g. a saved `cursor` value
+    :param max_items: Stop after this number of items
+    :param time_budget: Stop after this number of seconds.
+        The iteration ends without an error, check `is_exhausted` to know if all items are read
+    :param prefetch: Request the next page while the current one is being processed
+    """
+
+    def __init__(
+        self,
+        fetch_page: FetchCursorPage[ItemT],
+        cursor: Optional[str] = None,
+        max_items: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        prefetch: bool = True,
+    ):
+        self._fetch_page = fetch_page
+        self.cursor = cursor
+        self.next_cursor: Optional[str] = None
+        self.max_items = max_items
+        self.time_budget = time_budget
+        self.prefetch = prefetch
+        self.items_count = 0
+        self.is_exhausted = False
+
+    def __aiter__(self) -> AsyncIterator[ItemT]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncGenerator[ItemT, None]:
+        deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+        pages = self._iter_pages()
+        try:
+            async for page in pages:
+                for item in get_field(page, "items"):
+                    if self._is_limit_reached(deadline):
+                        return
+                    self.items_count += 1
+                    yield item
+                if self.next_cursor is None:
+                    self.is_exhausted = True
+                    return
+                self.cursor = self.next_cursor
+                if self._is_limit_reached(deadline):
+                    return
+        finally:
+            await pages.aclose()
+
+    async def _iter_pages(self) -> AsyncGenerator[Union[CursorPage[ItemT], RawData], None]:
+        next_page: Optional["asyncio.Future[Union[CursorPage[ItemT], RawData]]"] = None
+        page = await self._fetch_page(self.cursor)
+        try:
+            while True:
+                self.next_cursor = get_field(page, "next_page_cursor")
+                if self.next_cursor is None:
+                    yield page
+                    return
+                if self.prefetch:
+                    next_page = self._start_fetch(self.next_cursor)
+                yield page
+                if next_page is None:
+                    next_page = self._start_fetch(self.next_cursor)
+                page, next_page = await next_page, None
+        finally:
+            cancel_futures([next_page])
+
+    def _start_fetch(self, cursor: str) -> "asyncio.Future[Union[CursorPage[ItemT], RawData]]":
+        return asyncio.ensure_future(self._fetch_page(cursor))
+
+    def _is_limit_reached(self, deadline: Optional[float]) -> bool:
+        if self.max_items is not None and self.items_count >= self.max_items:
+            return True
+        return deadline is not None and time.monotonic() >= deadline
+
+
+def cancel_futures(futures: Iterable[Optional["asyncio.Future[Any]"]]) -> None:
+    for future in futures:
+        if future is not None and not future.cancel() and not future.cancelled():
+            # The future is already done, retrieve its error to avoid "never retrieved" warning
+            future.exception()
@@ -0,0 +1,100 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Type, TypeVar, Union, cast
+
+import httpx
+from pydantic import BaseModel
+
+from huntflow_api_client.json_codec import AbstractJsonCodec, get_default_codec
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+T = TypeVar("T")
+
+# Decoded JSON object returned instead of a model in RAW response mode
+RawData = Dict[str, Any]
+# Return type of entity methods: the model, or the decoded JSON in RAW response mode
+ModelOrRaw = Union[ModelT, RawData]
+
+
+class ResponseMode(str, Enum):
+    """How entity methods turn API responses into return values"""
+
+    # Validate responses with pydantic models
+    VALIDATE = "VALIDATE"
+    # Return decoded JSON objects as is, see `ModelOrRaw`
+    RAW = "RAW"
+
+
+_response_mode: ContextVar[Optional[ResponseMode]] = ContextVar(
+    "huntflow_response_mode",
+    default=None,
+)
+
+
+@contextmanager
+def use_response_mode(mode: ResponseMode) -> Iterator[None]:
+    """Overrides the client's response mode for calls made inside the block:
+
+    with use_response_mode(ResponseMode.RAW):
+        applicants = await Applicant(api).list(account_id)
+    """
+    token = _response_mode.set(mode)
+    try:
+        yield
+    finally:
+        _response_mode.reset(token)
+
+
+def get_response_mode(default_mode: ResponseMode = ResponseMode.VALIDATE) -> ResponseMode:
+    """The mode set by `use_response_mode` or `default_mode`"""
+    return _response_mode.get() or default_mode
+
+
+async def fetch_in_mode(
+    mode: ResponseMode,
+    fetch: Callable[..., Awaitable[T]],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Calls an entity method in the response mode whatever the current mode is"""
+    with use_response_mode(mode):
+        return await fetch(*args, **kwargs)
+
+
+async def fetch_validated(
+    fetch: Callable[..., Awaitable[ModelOrRaw[ModelT]]],
+    *args: Any,
+    **kwargs: Any,
+) -> ModelT:
+    """Calls an entity method with validated responses whatever the response mode is.
+    For library code which needs models (e.g. to compute dates or progress of tasks)
+    """
+    return cast(ModelT, await fetch_in_mode(ResponseMode.VALIDATE, fetch, *args, **kwargs))
+
+
+def get_field(data: Any, name: str) -> Any:
+    """Field of a model or of its raw data (RAW response mode).
+    For library code which works in both modes, e.g. reads `total_pages` of pages
+    """
+    if isinstance(data, dict):
+        return data[name]
+    return getattr(data, name)
+
+
+def parse_response(
+    model: Type[ModelT],
+    response: httpx.Response,
+    default_mode: ResponseMode = ResponseMode.VALIDATE,
+    json_codec: Optional[AbstractJsonCodec] = None,
+) -> ModelOrRaw[ModelT]:
+    """Converts a response to `model` according to the current response mode
+    (see `use_response_mode`) or `default_mode`.
+    The body is decoded with `json_codec` (`get_default_codec()` if not set).
+    """
+    mode = get_response_mode(default_mode)
+    json_codec = json_codec or get_default_codec()
+    data = json_codec.loads(response.content)
+    if mode == ResponseMode.VALIDATE:
+        return model.model_validate(data)
+    return cast(RawData, data)
@@ -0,0 +1,9 @@
+from .backend import AbstractRateLimitBackend, InMemoryRateLimitBackend, SQLiteRateLimitBackend
+from .limiter import RateLimiter
+
+__all__ = (
+    "AbstractRateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "RateLimiter",
+    "SQLiteRateLimitBackend",
+)
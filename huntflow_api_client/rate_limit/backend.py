@@ -0,0 +1,131 @@
+import asyncio
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+
+def reserve_slot(
+    tat: Optional[float],
+    now: float,
+    interval: float,
+    burst: int,
+) -> Tuple[float, float]:
+    """Token bucket in the form of GCRA (generic cell rate algorithm).
+    The bucket state is a single number: theoretical arrival time (TAT)
+    of the next request.
+    Returns new TAT and a delay the caller has to wait before sending a request.
+    """
+    tat = now if tat is None else max(tat, now)
+    new_tat = tat + interval
+    delay = max(0.0, new_tat - now - burst * interval)
+    return new_tat, delay
+
+
+def block_slots(tat: Optional[float], until: float, interval: float, burst: int) -> float:
+    """Returns TAT which doesn't allow to send requests before `until`.
+    After the block the bucket is empty: requests are paced without a burst.
+    """
+    return max(tat or 0.0, until + (burst - 1) * interval)
+
+
+class AbstractRateLimitBackend(ABC):
+    """Storage for token buckets.
+    Implementations must update a bucket atomically, so several limiters
+    (in different coroutines, threads or processes) can share the same bucket.
+    """
+
+    @abstractmethod
+    async def reserve(self, key: str, interval: float, burst: int) -> float:
+        """Reserve a slot for one request in the bucket `key`.
+        Returns delay (in seconds) the caller has to wait before sending the request.
+        """
+        pass
+
+    @abstractmethod
+    async def block(self, key: str, until: float, interval: float, burst: int) -> None:
+        """Don't give out slots of the bucket `key` until `until` timestamp"""
+        pass
+
+
+class InMemoryRateLimitBackend(AbstractRateLimitBackend):
+    """Buckets are kept in memory of the current process.
+    Share the backend object between limiters to share buckets.
+    """
+
+    def __init__(self) -> None:
+        self._tats: Dict[str, float] = {}
+
+    async def reserve(self, key: str, interval: float, burst: int) -> float:
+        self._tats[key], delay = reserve_slot(self._tats.get(key), time.time(), interval, burst)
+        return delay
+
+    async def block(self, key: str, until: float, interval: float, burst: int) -> None:
+        self._tats[key] = block_slots(self._tats.get(key), until, interval, burst)
+
+
+class SQLiteRateLimitBackend(AbstractRateLimitBackend):
+    """Buckets are kept in a SQLite database file.
+    Use it to share buckets between processes on the same host.
+    Database queries are run in a thread pool executor to not block the event loop.
+    """
+
+    def __init__(self, filename: str, timeout: float = 5.0) -> None:
+        self._filename = filename
+        self._timeout = timeout
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._filename, timeout=self._timeout, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL)",
+            )
+            self._initialized = True
+        return connection
+
+    def _update(
+        self,
+        key: str,
+        interval: float,
+        burst: int,
+        now: float,
+        until: Optional[float],
+    ) -> float:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT tat FROM rate_limits WHERE key = ?",
+                (key,),
+            ).fetchone()
+            tat = row[0] if row else None
+            if until is None:
+                tat, delay = reserve_slot(tat, now, interval, burst)
+            else:
+                tat, delay = block_slots(tat, until, interval, burst), 0.0
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limits (key, tat) VALUES (?, ?)",
+                (key, tat),
+            )
+            connection.execute("COMMIT")
+            return delay
+        finally:
+            connection.close()
+
+    async def reserve(self, key: str, interval: float, burst: int) -> float:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self._update,
+            key,
+            interval,
+            burst,
+            time.time(),
+            None,
+        )
+
+    async def block(self, key: str, until: float, interval: float, burst: int) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._update, key, interval, burst, time.time(), until)
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+import httpx
+
+from .backend import AbstractRateLimitBackend, InMemoryRateLimitBackend
+
+logger = logging.getLogger(__name__)
+
+# Values bigger than this are unix timestamps, not a number of seconds
+_MIN_TIMESTAMP = 10**9
+
+
+def parse_retry_after(value: str, now: float) -> Optional[float]:
+    """Parses value of Retry-After header: a number of seconds or an HTTP date.
+    Returns a timestamp before which requests must not be sent.
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return now + max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_reset(value: str, now: float) -> Optional[float]:
+    """Parses value of X-RateLimit-Reset / RateLimit-Reset header:
+    a number of seconds or a unix timestamp of the quota reset.
+    """
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(reset):
+        return None
+    return reset if reset > _MIN_TIMESTAMP else now + max(0.0, reset)
+
+
+def get_blocked_until(response: httpx.Response, now: float) -> Optional[float]:
+    """Returns a timestamp before which requests must not be sent
+    according to response headers, or None if there are no restrictions.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        return parse_retry_after(retry_after, now)
+    for prefix in ("X-RateLimit", "RateLimit"):
+        remaining = response.headers.get(f"{prefix}-Remaining")
+        reset = response.headers.get(f"{prefix}-Reset")
+        if remaining is None or reset is None:
+            continue
+        if remaining.strip() == "0":
+            return parse_rate_limit_reset(reset, now)
+    return None
+
+
+def get_token_key(headers: Mapping[str, str]) -> str:
+    """Bucket key of the token a request is authorized with"""
+    authorization = headers.get("Authorization")
+    if not authorization:
+        return "default"
+    return "token:" + hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+class RateLimiter:
+    """Client side rate limiter for HuntflowAPI.
+    It's a token bucket: up to `burst` requests may be sent at once,
+    then requests are paced to `requests_per_second`.
+    The limiter also reads `Retry-After` and rate limit headers
+    (`X-RateLimit-Remaining` / `X-RateLimit-Reset`) from responses and holds
+    requests until the server allows to continue.
+
+    The quota is counted by the server for a token, so by default requests are paced
+    in a bucket of the token they are sent with (see `get_token_key`).
+    With a shared backend (e.g. `SQLiteRateLimitBackend`) processes using the same token
+    share its quota. Set `key` to use one bucket for all requests of the limiter.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int = 1,
+        backend: Optional[AbstractRateLimitBackend] = None,
+        key: Optional[str] = None,
+    ):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._interval = 1.0 / requests_per_second
+        self._burst = burst
+        self._backend = backend or InMemoryRateLimitBackend()
+        self._key = key
+
+    async def acquire(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Wait until a request is allowed to be sent
+
+        :param headers: Headers of the request, the bucket is chosen by its token
+        """
+        key = self._get_key(headers or {})
+        delay = await self._backend.reserve(key, self._interval, self._burst)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def observe_response(self, response: httpx.Response) -> None:
+        """Response hook: holds further requests if the server asks to slow down"""
+        blocked_until = get_blocked_until(response, time.time())
+        if blocked_until is None:
+            return
+        logger.debug("Rate limit: requests are held for %.2fs", blocked_until - time.time())
+        key = self._get_key(response.request.headers)
+        await self._backend.block(key, blocked_until, self._interval, self._burst)
+
+    def _get_key(self, headers: Mapping[str, str]) -> str:
+        return self._key if self._key is not None else get_token_key(headers)
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Collection, Deque, Iterable, Optional, TypeVar
+
+import httpx
+
+from huntflow_api_client.errors import ApiError, TooManyRequestsError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# The request hasn't been sent if one of these errors has been raised,
+# so it's safe to retry a request with any method.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+TRANSIENT_ERRORS = (
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass(frozen=True)
+class RetryAttempt:
+    """Information about a failed attempt passed to retry hooks"""
+
+    method: str
+    path: str
+    attempt: int
+    error: Exception
+    delay: float
+    will_retry: bool
+
+
+RetryHook = Callable[[RetryAttempt], None]
+
+
+class RetryBudget:
+    """Limits the number of retries to a share of requests.
+    Within the sliding `window` (in seconds) retries are allowed while
+    `retries <= min_retries_per_second * window + ratio * requests`.
+    So retries can't multiply load on the API when it's down.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+    ):
+        self._ratio = ratio
+        self._min_retries = min_retries_per_second * window
+        self._window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] <= now - self._window:
+                timestamps.popleft()
+
+    def deposit(self) -> None:
+        """Register a request"""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Try to take a retry from the budget. Returns False if the budget is exhausted"""
+        now = time.monotonic()
+        self._prune(now)
+        if len(self._retries) + 1 > self._min_retries + self._ratio * len(self._requests):
+            return False
+        self._retries.append(now)
+        return True
+
+
+class RetryPolicy:
+    """Retries failed requests with exponential backoff and full jitter.
+
+    :param max_attempts: Maximum number of attempts (including the first one)
+    :param backoff_base: Base delay (in seconds) of exponential backoff.
+        A delay before attempt N+1 is a random value in
+        [0, min(backoff_max, backoff_base * 2 ** (N - 1))]
+    :param backoff_max: Maximum delay between attempts
+    :param deadline: Maximum total time (in seconds) for all attempts of a request.
+        A retry isn't started if it would begin after the deadline
+    :param methods: Methods which are safe to retry. POST isn't retried by default,
+        add it explicitly if your requests are idempotent
+    :param status_codes: Response status codes to retry
+    :param budget: Retry budget shared by all requests of the client
+    :param hooks: Callables which are called on every failed attempt
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        deadline: Optional[float] = 60.0,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        status_codes: Collection[int] = RETRY_STATUS_CODES,
+        budget: Optional[RetryBudget] = None,
+        hooks: Iterable[RetryHook] = (),
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.budget = budget if budget is not None else RetryBudget()
+        self.hooks = list(hooks)
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        if isinstance(error, NOT_SENT_ERRORS):
+            return True
+        if method.upper() not in self.methods:
+            return False
+        if isinstance(error, TRANSIENT_ERRORS):
+            return True
+        return isinstance(error, ApiError) and error.code in self.status_codes
+
+    def get_delay(self, attempt: int, error: Exception) -> float:
+        """Returns delay before the next attempt after failed attempt number `attempt`"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        if isinstance(error, TooManyRequestsError) and error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        return delay
+
+    async def run(
+        self,
+        method: str,
+        path: str,
+        send: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Calls `send` until it succeeds or the policy stops retrying"""
+        started_at = time.monotonic()
+        self.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return await send()
+            except (ApiError, httpx.TransportError) as error:
+                delay = self.get_delay(attempt, error)
+                will_retry = self._can_retry(method, attempt, error, started_at, delay)
+                self._call_hooks(RetryAttempt(method, path, attempt, error, delay, will_retry))
+                if not will_retry:
+                    raise
+            logger.debug("Retry %s %s in %.2fs (attempt %s)", method, path, delay, attempt + 1)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _can_retry(
+        self,
+        method: str,
+        attempt: int,
+        error: Exception,
+        started_at: float,
+        delay: float,
+    ) -> bool:
+        if attempt >= self.max_attempts or not self.is_retryable(method, error):
+            return False
+        if self.deadline is not None and time.monotonic() - started_at + delay > self.deadline:
+            return False
+        return self.budget.withdraw()
+
+    def _call_hooks(self, attempt: RetryAttempt) -> None:
+        for hook in self.hooks:
+            try:
+                hook(attempt)
+            except Exception:
+                logger.exception("Retry hook %r failed", hook)
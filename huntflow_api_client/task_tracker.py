@@ -0,0 +1,358 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Type, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.concurrency import is_overload_error
+from huntflow_api_client.entities.delayed_tasks import DelayedTask
+from huntflow_api_client.entities.users_management import UsersManagement
+from huntflow_api_client.models.consts import TaskState, UserControlTaskStatus
+from huntflow_api_client.models.response.delayed_tasks import DelayedTaskResponse
+from huntflow_api_client.models.response.users_management import UserControlTaskResponse
+from huntflow_api_client.pagination import cancel_futures
+from huntflow_api_client.parsing import ModelOrRaw, ResponseMode, fetch_in_mode, get_response_mode
+from huntflow_api_client.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+TaskId = Union[str, UUID]
+
+
+class TaskFailedError(Exception):
+    """A tracked task has reached the failed state
+
+    :param task_id: Task ID
+    :param comment: Comment of the failed state
+    :param task: The last task response
+    """
+
+    def __init__(self, task_id: str, comment: Optional[str], task: Any) -> None:
+        self.task_id = task_id
+        self.comment = comment
+        self.task = task
+        super().__init__(f"Task {task_id} failed: {comment}")
+
+
+@dataclass(frozen=True)
+class TaskProgress:
+    done: bool
+    failed: bool
+    # Unix timestamps of the task creation and its last state change
+    created: float
+    updated: float
+    comment: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskTrackerMetrics:
+    pending: int
+    polls: int
+    # Smoothed duration of finished tasks (seconds), None until a task is finished
+    estimated_duration: Optional[float]
+
+
+def delayed_task_progress(task: DelayedTaskResponse) -> TaskProgress:
+    last_log = max(task.states_log, key=lambda log: log.timestamp, default=None)
+    return TaskProgress(
+        done=task.state in (TaskState.success, TaskState.failed),
+        failed=task.state == TaskState.failed,
+        created=task.created,
+        updated=last_log.timestamp if last_log else task.updated or task.created,
+        comment=last_log.comment if last_log else None,
+    )
+
+
+def user_control_task_progress(task: UserControlTaskResponse) -> TaskProgress:
+    return TaskProgress(
+        done=task.status != UserControlTaskStatus.PENDING,
+        failed=task.status == UserControlTaskStatus.FAILED,
+        created=task.created.timestamp(),
+        updated=(task.completed or task.created).timestamp(),
+        comment=task.comment,
+    )
+
+
+class _TrackedTask:
+    def __init__(
+        self,
+        task_id: str,
+        fetch: Callable[[], Awaitable[Any]],
+        model: Type[BaseModel],
+        get_progress: Callable[[Any], TaskProgress],
+        response_mode: ResponseMode,
+        poll_at: float,
+        interval: float,
+    ) -> None:
+        self.task_id = task_id
+        self.fetch = fetch
+        self.model = model
+        self.get_progress = get_progress
+        self.response_mode = response_mode
+        self.future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self.poll_at = poll_at
+        self.interval = interval
+
+
+class DelayedTaskTracker:
+    """Waits for delayed tasks (dictionary and multivacancy updates, users management)
+    of an organization.
+
+    `track` returns a future which is resolved with the task response when the task succeeds
+    or fails with `TaskFailedError`. All tracked tasks are checked by a single background
+    poller, which is started on demand and stops when there are no pending tasks.
+    Polls are paced by `rate_limiter` (shared by all tasks) and at most `concurrency`
+    polls are in flight.
+
+    The polling interval of a task adapts to the task timing:
+
+    * durations of finished tasks (from creation to the last state change in `states_log`)
+      are smoothed into an estimated duration; a task isn't polled before it is expected
+      to be finished
+    * a task which takes longer is polled with an interval multiplied by `backoff_factor`
+      after every poll, from `min_interval` up to `max_interval`
+
+    Polls failed because the API is overloaded (429, 5xx, timeouts) are repeated later,
+    other errors (including unexpected task responses) fail the task future.
+    Task responses are models or raw data according to the response mode
+    which is current when the task is tracked.
+
+    :param api: API client
+    :param account_id: Organization ID
+    :param rate_limiter: Limiter of polling requests, 10 requests per second by default
+    :param concurrency: Maximum number of polling requests in flight
+    :param min_interval: Minimal delay (in seconds) between polls of a task
+    :param max_interval: Maximal delay (in seconds) between polls of a task
+    :param backoff_factor: Delay multiplier for polls of a task which isn't finished
+    :param duration_smoothing: Weight of the last finished task in the estimated duration
+    """
+
+    def __init__(
+        self,
+        api: HuntflowAPI,
+        account_id: int,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: int = 4,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+        duration_smoothing: float = 0.2,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        self._api = api
+        self._delayed_tasks = DelayedTask(api)
+        self._users_management = UsersManagement(api)
+        self._account_id = account_id
+        self._rate_limiter = rate_limiter or RateLimiter(requests_per_second=10, burst=10)
+        self._concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.duration_smoothing = duration_smoothing
+        self._estimated_duration: Optional[float] = None
+        self._tasks: Dict[str, _TrackedTask] = {}
+        self._wake_up_event: Optional[asyncio.Event] = None
+        self._poller: Optional["asyncio.Task[None]"] = None
+        self._polls = 0
+
+    @property
+    def _wake_up(self) -> asyncio.Event:
+        # Created in the running loop: before Python 3.10 an event is bound
+        # to the current loop when it is created
+        if self._wake_up_event is None:
+            self._wake_up_event = asyncio.Event()
+        return self._wake_up_event
+
+    @property
+    def metrics(self) -> TaskTrackerMetrics:
+        return TaskTrackerMetrics(
+            pending=len(self._tasks),
+            polls=self._polls,
+            estimated_duration=self._estimated_duration,
+        )
+
+    def track(self, task_id: TaskId) -> "asyncio.Future[ModelOrRaw[DelayedTaskResponse]]":
+        """Track a delayed task (`DelayedTask.get`)
+
+        :param task_id: Task ID returned by the method which created the task
+        :return: Future of the finished task response
+        """
+        account_id, task_id = self._account_id, str(task_id)
+        return self._track(
+            task_id,
+            lambda: self._delayed_tasks.get(account_id, task_id),
+            DelayedTaskResponse,
+            delayed_task_progress,
+        )
+
+    def track_user_control_task(
+        self,
+        task_id: TaskId,
+    ) -> "asyncio.Future[ModelOrRaw[UserControlTaskResponse]]":
+        """Track a users management task (`UsersManagement.get_user_control_task`)
+
+        :param task_id: Task ID returned by the users management method
+        :return: Future of the finished task response
+        """
+        account_id, task_id = self._account_id, str(task_id)
+        return self._track(
+            f"users/{task_id}",
+            lambda: self._users_management.get_user_control_task(account_id, task_id),
+            UserControlTaskResponse,
+            user_control_task_progress,
+        )
+
+    async def wait(
+        self,
+        task_id: TaskId,
+        timeout: Optional[float] = None,
+    ) -> ModelOrRaw[DelayedTaskResponse]:
+        """Wait for a delayed task. Cancelling the wait doesn't stop tracking of the task
+
+        :param task_id: Task ID
+        :param timeout: Maximum time to wait (in seconds)
+        """
+        return await asyncio.wait_for(asyncio.shield(self.track(task_id)), timeout)
+
+    async def close(self) -> None:
+        """Stop the poller and cancel futures of pending tasks"""
+        for task in self._tasks.values():
+            task.future.cancel()
+        self._tasks.clear()
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+
+    def _track(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        model: Type[BaseModel],
+        get_progress: Callable[[Any], TaskProgress],
+    ) -> "asyncio.Future[Any]":
+        task = self._tasks.get(key)
+        if task is None or task.future.done():
+            now = time.monotonic()
+            interval = max(self.min_interval, min(self._estimated_duration or 0, self.max_interval))
+            task = _TrackedTask(
+                key,
+                fetch,
+                model,
+                get_progress,
+                get_response_mode(self._api.response_mode),
+                now + interval,
+                self.min_interval,
+            )
+            self._tasks[key] = task
+            self._wake_up.set()
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll_forever())
+        return task.future
+
+    async def _poll_forever(self) -> None:
+        semaphore = asyncio.Semaphore(self._concurrency)
+        polls: Set["asyncio.Future[None]"] = set()
+
+        def on_poll_done(poll: "asyncio.Future[None]") -> None:
+            polls.discard(poll)
+            self._wake_up.set()
+
+        try:
+            while self._tasks or polls:
+                self._wake_up.clear()
+                now = time.monotonic()
+                for task in self._get_due_tasks(now):
+                    # The task isn't polled again until the current poll is done
+                    task.poll_at = float("inf")
+                    poll = asyncio.ensure_future(self._poll(task, semaphore))
+                    polls.add(poll)
+                    poll.add_done_callback(on_poll_done)
+                await self._sleep(now)
+        finally:
+            cancel_futures(polls)
+
+    def _get_due_tasks(self, now: float) -> List[_TrackedTask]:
+        for key in [key for key, task in self._tasks.items() if task.future.done()]:
+            # Futures cancelled by callers
+            del self._tasks[key]
+        return [task for task in self._tasks.values() if task.poll_at <= now]
+
+    async def _sleep(self, now: float) -> None:
+        """Sleep until the next poll, a new task or the end of a poll"""
+        poll_at = min((task.poll_at for task in self._tasks.values()), default=float("inf"))
+        timeout = None if poll_at == float("inf") else max(poll_at - now, 0)
+        try:
+            await asyncio.wait_for(self._wake_up.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _poll(self, task: _TrackedTask, semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                await self._rate_limiter.acquire()
+                self._polls += 1
+                response = await fetch_in_mode(task.response_mode, task.fetch)
+            self._handle_response(task, response)
+        except Exception as error:
+            if is_overload_error(error):
+                logger.debug("Task %s poll failed: %r, retrying later", task.task_id, error)
+                self._schedule(task, None)
+            else:
+                self._finish(task, error=error)
+
+    def _handle_response(self, task: _TrackedTask, response: Any) -> None:
+        # Progress is computed from a model, the response is returned as it is
+        model = response if isinstance(response, BaseModel) else task.model.model_validate(response)
+        progress = task.get_progress(model)
+        if not progress.done:
+            self._schedule(task, progress)
+            return
+        duration = max(progress.updated - progress.created, 0.0)
+        self._update_estimated_duration(duration)
+        if progress.failed:
+            self._finish(task, error=TaskFailedError(task.task_id, progress.comment, response))
+        else:
+            self._finish(task, result=response)
+
+    def _schedule(self, task: _TrackedTask, progress: Optional[TaskProgress]) -> None:
+        interval = task.interval
+        if progress is not None and self._estimated_duration is not None:
+            # Wait for the rest of the expected duration, if the task is expected to finish later
+            interval = max(interval, self._estimated_duration - (time.time() - progress.created))
+        interval = max(self.min_interval, min(interval, self.max_interval))
+        task.poll_at = time.monotonic() + interval
+        task.interval = min(task.interval * self.backoff_factor, self.max_interval)
+
+    def _finish(
+        self,
+        task: _TrackedTask,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if self._tasks.get(task.task_id) is task:
+            del self._tasks[task.task_id]
+        if task.future.done():
+            return
+        if error is not None:
+            task.future.set_exception(error)
+        else:
+            task.future.set_result(result)
+
+    def _update_estimated_duration(self, duration: float) -> None:
+        if self._estimated_duration is None:
+            self._estimated_duration = duration
+        else:
+            self._estimated_duration += self.duration_smoothing * (
+                duration - self._estimated_duration
+            )
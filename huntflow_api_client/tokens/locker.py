@@ -1,11 +1,23 @@
 import asyncio
+import json
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
 
 
 class AbstractLocker(ABC):
     @abstractmethod
     async def acquire(self) -> bool:
-        """Non-blocking lock aqcuire.
+        """Non-blocking lock acquire.
         If there is the lock already, then return False.
         If the lock is not acquired, then acquire the lock and return True
         """
@@ -37,7 +49,7 @@ class AsyncioLockLocker(AbstractLocker):
         self._lock: asyncio.Lock = asyncio.Lock()
 
     async def acquire(self) -> bool:
-        """Non-blocking lock aqcuire.
+        """Non-blocking lock acquire.
         If there is the lock already, then return False.
         If the lock is not acquired, then acquire the lock and return True
         """
@@ -57,3 +69,162 @@ class AsyncioLockLocker(AbstractLocker):
         if not self._lock.locked():
             return
         self._lock.release()
+
+
+class FileLocker(AbstractLocker):
+    """Locker based on OS file locks (`flock`).
+    It synchronizes token refresh across processes on the same host,
+    e.g. several gunicorn/uvicorn workers sharing one token file.
+    Use the same lock file in all processes (and the same locker object
+    for all token proxies within a process).
+    Available on POSIX systems only.
+
+    The lock is released by the OS if the holder process dies.
+    If the holder hangs, the lock is considered stale after `stale_timeout` seconds:
+    the lock file is removed and the lock can be acquired again
+    (using a new lock file). Holder records are written and stale files are removed
+    under a guard lock, so a lock acquired during the recovery is never removed.
+
+    :param filename: Path to the lock file
+    :param poll_interval: Interval (in seconds) to check the lock in `wait_for_lock`
+    :param stale_timeout: Time (in seconds) after which a held lock is considered stale.
+        None disables stale lock recovery
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        poll_interval: float = 0.05,
+        stale_timeout: Optional[float] = 60.0,
+    ):
+        if fcntl is None:
+            raise RuntimeError("FileLocker is supported on POSIX systems only")
+        self._filename = filename
+        self._guard_filename = filename + ".guard"
+        self._poll_interval = poll_interval
+        self._stale_timeout = stale_timeout
+        self._fd: Optional[int] = None
+
+    async def acquire(self) -> bool:
+        """Non-blocking lock acquire.
+        If there is the lock already, then return False.
+        If the lock is not acquired, then acquire the lock and return True
+        """
+        if self._fd is not None:
+            return False
+        fd = self._lock_and_record()
+        if fd is None and self._break_stale_lock():
+            fd = self._lock_and_record()
+        if fd is None:
+            return False
+        self._fd = fd
+        return True
+
+    async def wait_for_lock(self) -> None:
+        """Blocking lock check. If there is no locks, then return.
+        If the lock is set, then wait for it's release.
+        """
+        while True:
+            fd = self._try_lock(fcntl.LOCK_SH)
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+                return
+            if self._break_stale_lock():
+                continue
+            await asyncio.sleep(self._poll_interval)
+
+    async def release(self) -> None:
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _lock_and_record(self) -> Optional[int]:
+        """Locks the file exclusively and writes the holder record under the shared guard lock,
+        so a stale lock recovery never sees a fresh lock with an old record
+        """
+        guard_fd = os.open(self._guard_filename, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(guard_fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # A stale lock recovery is in progress
+                return None
+            fd = self._try_lock(fcntl.LOCK_EX)
+            if fd is not None:
+                os.ftruncate(fd, 0)
+                record = {"pid": os.getpid(), "acquired_at": time.time()}
+                os.write(fd, json.dumps(record).encode())
+            return fd
+        finally:
+            os.close(guard_fd)
+
+    def _try_lock(self, operation: int) -> Optional[int]:
+        """Returns a descriptor of the locked file or None if the lock is held by someone else"""
+        fd = os.open(self._filename, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        if not self._is_current_file(fd):
+            # The file has been removed as a stale lock after we opened it
+            os.close(fd)
+            return self._try_lock(operation)
+        return fd
+
+    def _is_current_file(self, fd: int) -> bool:
+        try:
+            return os.fstat(fd).st_ino == os.stat(self._filename).st_ino
+        except FileNotFoundError:
+            return False
+
+    def _break_stale_lock(self) -> bool:
+        """Removes the lock file if the lock is stale.
+        Returns True if the lock may be acquired again: the file was removed or the lock was freed.
+        Recovery holds the guard lock exclusively, so no lock is acquired in the meantime.
+        """
+        if self._stale_timeout is None:
+            return False
+        guard_fd = os.open(self._guard_filename, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(guard_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            try:
+                fd = os.open(self._filename, os.O_RDONLY)
+            except FileNotFoundError:
+                return True
+            try:
+                return self._remove_if_stale(fd, self._stale_timeout)
+            finally:
+                os.close(fd)
+        finally:
+            os.close(guard_fd)
+
+    def _remove_if_stale(self, fd: int, stale_timeout: float) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            pass
+        else:
+            # The holder has released the lock
+            return True
+        acquired_at = _read_acquired_at(fd)
+        if acquired_at is None or time.time() - acquired_at < stale_timeout:
+            return False
+        if not self._is_current_file(fd):
+            return True
+        logger.warning("Lock %s is held for too long, removing it", self._filename)
+        os.unlink(self._filename)
+        return True
+
+
+def _read_acquired_at(fd: int) -> Optional[float]:
+    try:
+        return float(json.loads(os.pread(fd, 4096, 0))["acquired_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
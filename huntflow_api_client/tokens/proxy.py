@@ -1,6 +1,6 @@
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Optional
 
 from .locker import AbstractLocker
 from .storage import AbstractHuntflowTokenStorage
@@ -40,6 +40,20 @@ class AbstractTokenProxy(ABC):
         """
         return False
 
+    async def get_expiration_timestamp(self) -> Optional[float]:
+        """Returns expiration timestamp of the current access token
+        or None if it's unknown.
+        Used by the background token refresher.
+        """
+        return None
+
+    async def reload(self) -> None:
+        """Re-read the token from a persistent storage, if the proxy keeps it in memory.
+        Used by the background token refresher to find out whether the token has been
+        refreshed by another client.
+        """
+        return
+
 
 def convert_refresh_result_to_hf_token(
     refresh_result: Dict[str, Any],
@@ -87,6 +101,9 @@ class DummyHuntflowTokenProxy(AbstractTokenProxy):
     async def update(self, refresh_result: Dict[str, Any]) -> None:
         self._token = convert_refresh_result_to_hf_token(refresh_result, self._token)
 
+    async def get_expiration_timestamp(self) -> Optional[float]:
+        return self._token.expiration_timestamp
+
 
 class HuntflowTokenProxy(AbstractTokenProxy):
     """Ready to use TokenProxy implementation.
@@ -94,6 +111,15 @@ class HuntflowTokenProxy(AbstractTokenProxy):
     AbstractHuntflowTokenStorage interface (e.g. HuntflowTokenFileStorage).
     Provide a lock object if you need to synchronize token updates across several
     coroutines (see `LocalLocker`), threads or processes.
+    Set `cache_ttl` to keep the token in memory: the storage is not touched
+    for `cache_ttl` seconds after the token was read. When the window expires,
+    the token is read again only if the storage version
+    (see `AbstractHuntflowTokenStorage.get_version`) has changed.
+    The version also allows `is_updated` to skip reading the whole token
+    when the storage has not been changed.
+    A refreshed token is written with `compare_and_swap` against the version read
+    with the refresh data. If someone else has updated the token in the meantime,
+    the proxy drops its refreshed token and reads the stored one.
     Also look at 'examples' directory for usage examples.
     """
 
@@ -101,17 +127,50 @@ class HuntflowTokenProxy(AbstractTokenProxy):
         self,
         storage: AbstractHuntflowTokenStorage,
         locker: Optional[AbstractLocker] = None,
+        cache_ttl: Optional[float] = None,
     ):
         self._token: Optional[ApiToken] = None
         self._locker = locker
         self._storage = storage
         self._last_read_timestamp: Optional[float] = None
+        self._cache_ttl = cache_ttl
+        self._cached_at: Optional[float] = None
+        self._version: Optional[Hashable] = None
+        self._read_version: Optional[Hashable] = None
+        self._refresh_version: Optional[Hashable] = None
 
     async def get_auth_header(self) -> Dict[str, str]:
         await self._wait_for_free_lock()
-        self._token = await self._storage.get()
+        token = await self._get_token()
+        return get_auth_headers(token)
+
+    async def _get_token(self) -> ApiToken:
+        if self._cache_ttl is None:
+            return await self._read_token()
+        now = time.monotonic()
+        if self._token is not None and self._cached_at is not None:
+            if now - self._cached_at < self._cache_ttl:
+                return self._token
+            version = await self._storage.get_version()
+            if version is not None and version == self._version:
+                self._cached_at = now
+                return self._token
+        return await self._read_token()
+
+    async def _read_token(self) -> ApiToken:
+        self._token, version = await self._storage.get_with_version()
         self._last_read_timestamp = time.time()
-        return get_auth_headers(self._token)
+        self._read_version = version
+        self._cache_token(version)
+        return self._token
+
+    def _cache_token(self, version: Optional[Hashable]) -> None:
+        self._version = version
+        self._cached_at = time.monotonic()
+
+    def invalidate_cache(self) -> None:
+        """Force reading the token from the storage on the next request"""
+        self._cached_at = None
 
     async def _wait_for_free_lock(self) -> bool:  # type: ignore[return]
         if self._locker is None:
@@ -119,13 +178,30 @@ class HuntflowTokenProxy(AbstractTokenProxy):
         await self._locker.wait_for_lock()
 
     async def get_refresh_data(self) -> Dict[str, str]:
-        self._token = await self._storage.get()
+        # The version is kept with the refresh data, `update` writes the new token
+        # only if the stored token is still the one it is based on
+        self._token, self._refresh_version = await self._storage.get_with_version()
+        self.invalidate_cache()
         return get_refresh_token_data(self._token)
 
     async def update(self, refresh_result: Dict[str, Any]) -> None:
         assert self._token
-        self._token = convert_refresh_result_to_hf_token(refresh_result, self._token)
-        await self._storage.update(self._token)
+        token = convert_refresh_result_to_hf_token(refresh_result, self._token)
+        expected_version, self._refresh_version = self._refresh_version, None
+        if not await self._storage.compare_and_swap(token, expected_version):
+            # Another writer has refreshed the token first, its token is used from now on
+            self._token = None
+            self.invalidate_cache()
+            await self._read_token()
+            return
+        self._token = token
+        if self._cache_ttl is not None:
+            # The written token is the stored one, as if it has just been read,
+            # so `is_updated` doesn't report our own refresh as a change
+            version = await self._storage.get_version()
+            self._last_read_timestamp = time.time()
+            self._read_version = version
+            self._cache_token(version)
 
     async def lock_for_update(self) -> bool:
         """Non-blocking method to acquire lock before token refresh.
@@ -143,8 +219,26 @@ class HuntflowTokenProxy(AbstractTokenProxy):
         await self._locker.release()
 
     async def is_updated(self) -> bool:
-        if self._last_read_timestamp is None:
+        if self._last_read_timestamp is None or self._token is None:
             return False
-        token = await self._storage.get()
-        last_refresh_timestamp = token.last_refresh_timestamp or 0.0
-        return last_refresh_timestamp > self._last_read_timestamp
+        if self._read_version is not None:
+            # Versions change on every update, the token itself isn't read
+            is_updated = await self._storage.get_version() != self._read_version
+        else:
+            token = await self._storage.get()
+            last_refresh_timestamp = token.last_refresh_timestamp or 0.0
+            is_updated = last_refresh_timestamp > self._last_read_timestamp
+            if token.access_token != self._token.access_token:
+                # Timestamps may be inaccurate if the token is refreshed by another process
+                is_updated = True
+        if is_updated:
+            # The cached token is outdated, the next request must use the new one
+            self.invalidate_cache()
+        return is_updated
+
+    async def get_expiration_timestamp(self) -> Optional[float]:
+        token = await self._get_token()
+        return token.expiration_timestamp
+
+    async def reload(self) -> None:
+        await self._read_token()
@@ -1,8 +1,16 @@
+import asyncio
 import json
+import os
+import sqlite3
+import stat
+import tempfile
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
 
 from .token import ApiToken
 
+T = TypeVar("T")
+
 
 class AbstractHuntflowTokenStorage(ABC):
     @abstractmethod
@@ -13,16 +21,195 @@ class AbstractHuntflowTokenStorage(ABC):
     async def update(self, token: ApiToken) -> None:
         pass
 
+    async def get_version(self) -> Optional[Hashable]:
+        """Cheap change signal of the stored token.
+        Returns a value which changes every time the token is updated,
+        or None if the storage can't provide such value.
+        """
+        return None
+
+    async def get_with_version(self) -> Tuple[ApiToken, Optional[Hashable]]:
+        """Returns the token with its version (see `get_version`).
+        The version is read first, so it's never newer than the token.
+        """
+        version = await self.get_version()
+        return await self.get(), version
+
+    async def compare_and_swap(self, token: ApiToken, expected_version: Optional[Hashable]) -> bool:
+        """Write the token if the stored version equals `expected_version`
+        (returned by `get_with_version` with the token the new one is based on).
+        Returns True if the token has been written.
+        Storages which don't support versions write the token unconditionally.
+        """
+        await self.update(token)
+        return True
+
 
 class HuntflowTokenFileStorage(AbstractHuntflowTokenStorage):
+    """Keeps the token in a JSON file.
+    File operations are run in a thread pool executor, so they don't block the event loop.
+    The file is updated atomically (a temporary file is written and then renamed),
+    so concurrent readers never see a partially written token.
+    The decoded content is cached and reused while the file is not changed
+    (inode, mtime and size are the same).
+    """
+
     def __init__(self, filename: str) -> None:
         self._filename = filename
+        self._cache: Optional[Tuple[Hashable, Dict[str, Any]]] = None
 
     async def get(self) -> ApiToken:
+        token, _ = await self.get_with_version()
+        return token
+
+    async def get_with_version(self) -> Tuple[ApiToken, Optional[Hashable]]:
+        version, data = await self._run_in_executor(self._read)
+        return ApiToken.from_dict(data), version
+
+    async def update(self, token: ApiToken) -> None:
+        await self._run_in_executor(self._write, token.dict())
+
+    async def get_version(self) -> Optional[Hashable]:
+        return await self._run_in_executor(self._get_version)
+
+    @staticmethod
+    async def _run_in_executor(func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _get_version(self) -> Hashable:
+        st = os.stat(self._filename)
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read(self) -> Tuple[Hashable, Dict[str, Any]]:
+        version = self._get_version()
+        if self._cache is not None and self._cache[0] == version:
+            return self._cache
         with open(self._filename) as fin:
             data = json.load(fin)
-        return ApiToken.from_dict(data)
+        self._cache = (version, data)
+        return self._cache
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        fd, tmp_filename = tempfile.mkstemp(dir=directory, prefix=".tmp-token-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as fout:
+                json.dump(data, fout, indent=4)
+                fout.flush()
+                os.fsync(fout.fileno())
+            self._copy_mode(tmp_filename)
+            os.replace(tmp_filename, self._filename)
+        except BaseException:
+            os.unlink(tmp_filename)
+            raise
+
+    def _copy_mode(self, tmp_filename: str) -> None:
+        try:
+            mode = os.stat(self._filename).st_mode
+        except FileNotFoundError:
+            return
+        os.chmod(tmp_filename, stat.S_IMODE(mode))
+
+
+class HuntflowTokenSQLiteStorage(AbstractHuntflowTokenStorage):
+    """Keeps the token in a SQLite database with a version number.
+    The version is incremented on every update, so `get_version` is a cheap way
+    to check if the token has been changed.
+    `compare_and_swap` writes the token only if the stored version is the same
+    as the version the caller has read with the token (see `get_with_version`).
+    So several processes on the same host can't overwrite a newer token with an older one.
+    `update` writes the token unconditionally.
+    The database works in WAL mode for fast concurrent reads.
+    Queries are run in a thread pool executor.
+
+    :param filename: Path to the database file
+    :param key: Token name, allows to keep several tokens in one database
+    :param timeout: Time (in seconds) to wait for a database lock
+    """
+
+    def __init__(self, filename: str, key: str = "default", timeout: float = 5.0) -> None:
+        self._filename = filename
+        self._key = key
+        self._timeout = timeout
+        self._initialized = False
+
+    async def get(self) -> ApiToken:
+        token, _ = await self.get_with_version()
+        return token
+
+    async def get_with_version(self) -> Tuple[ApiToken, Optional[Hashable]]:
+        row = await self._run_in_executor(self._select, "SELECT version, data")
+        if row is None:
+            raise LookupError(f"Token {self._key!r} is not found in {self._filename}")
+        version, data = row
+        return ApiToken.from_dict(json.loads(data)), version
 
     async def update(self, token: ApiToken) -> None:
-        with open(self._filename, "w") as fout:
-            json.dump(token.dict(), fout, indent=4)
+        await self._run_in_executor(self._upsert, json.dumps(token.dict()))
+
+    async def get_version(self) -> Optional[Hashable]:
+        row = await self._run_in_executor(self._select, "SELECT version")
+        return None if row is None else row[0]
+
+    async def compare_and_swap(self, token: ApiToken, expected_version: Optional[Hashable]) -> bool:
+        """Write the token if the stored version equals `expected_version`
+        (None means that there must be no stored token).
+        Returns True if the token has been written.
+        """
+        if expected_version is not None and not isinstance(expected_version, int):
+            return False
+        data = json.dumps(token.dict())
+        return await self._run_in_executor(self._compare_and_swap, data, expected_version)
+
+    @staticmethod
+    async def _run_in_executor(func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._filename, timeout=self._timeout, isolation_level=None)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "key TEXT PRIMARY KEY, version INTEGER NOT NULL, data TEXT NOT NULL)",
+            )
+            self._initialized = True
+        return connection
+
+    def _select(self, query: str) -> Optional[Tuple[Any, ...]]:
+        connection = self._connect()
+        try:
+            return connection.execute(f"{query} FROM tokens WHERE key = ?", (self._key,)).fetchone()
+        finally:
+            connection.close()
+
+    def _upsert(self, data: str) -> None:
+        connection = self._connect()
+        try:
+            connection.execute(
+                "INSERT INTO tokens (key, version, data) VALUES (?, 1, ?) "
+                "ON CONFLICT (key) DO UPDATE SET version = version + 1, data = excluded.data",
+                (self._key, data),
+            )
+        finally:
+            connection.close()
+
+    def _compare_and_swap(self, data: str, expected_version: Optional[int]) -> bool:
+        connection = self._connect()
+        try:
+            if expected_version is None:
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO tokens (key, version, data) VALUES (?, 1, ?)",
+                    (self._key, data),
+                )
+            else:
+                cursor = connection.execute(
+                    "UPDATE tokens SET version = version + 1, data = ? "
+                    "WHERE key = ? AND version = ?",
+                    (data, self._key, expected_version),
+                )
+            return cursor.rowcount == 1
+        finally:
+            connection.close()
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import httpx
+
+# The default timeout of httpx clients
+DEFAULT_TIMEOUT = 5.0
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection settings for the http client used by HuntflowAPI.
+
+    :param http2: Enable HTTP/2. Many concurrent requests are multiplexed over
+        a few connections then. Requires `h2` package (`pip install httpx[http2]`)
+    :param max_connections: Maximum number of connections in the pool
+    :param max_keepalive_connections: Maximum number of idle connections kept alive
+    :param keepalive_expiry: Time (in seconds) to keep an idle connection alive
+    :param connect_timeout: Timeout (in seconds) to establish a connection.
+        Timeouts are 5 seconds by default as in httpx, None disables a timeout
+    :param read_timeout: Timeout (in seconds) to receive a chunk of response data
+    :param write_timeout: Timeout (in seconds) to send a chunk of request data
+    :param pool_timeout: Timeout (in seconds) to wait for a free connection in the pool
+    :param retries: Number of retries for failed connection attempts.
+        Only connection errors are retried at this level
+    :param local_address: Local IP address to bind outgoing connections to
+    :param transport: Custom transport. If it's set, then connection options above
+        (except timeouts) are ignored: the transport is responsible for them.
+        The transport is closed together with the http client, so HuntflowAPI can't be used
+        after `aclose` then. Use `transport_factory` to allow that
+    :param transport_factory: Creates a custom transport for every new http client
+        (the client is recreated after `aclose`). Connection options are ignored as well
+    """
+
+    http2: bool = False
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    connect_timeout: Optional[float] = DEFAULT_TIMEOUT
+    read_timeout: Optional[float] = DEFAULT_TIMEOUT
+    write_timeout: Optional[float] = DEFAULT_TIMEOUT
+    pool_timeout: Optional[float] = DEFAULT_TIMEOUT
+    retries: int = 0
+    local_address: Optional[str] = None
+    transport: Optional[httpx.AsyncBaseTransport] = None
+    transport_factory: Optional[Callable[[], httpx.AsyncBaseTransport]] = None
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def create_transport(self) -> httpx.AsyncBaseTransport:
+        if self.transport_factory is not None:
+            return self.transport_factory()
+        if self.transport is not None:
+            return self.transport
+        return httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            limits=self.limits,
+            retries=self.retries,
+            local_address=self.local_address,
+        )
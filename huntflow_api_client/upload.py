@@ -0,0 +1,194 @@
+import asyncio
+import mimetypes
+import mmap
+import os
+import stat
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Optional,
+    Union,
+    cast,
+)
+
+import httpx
+
+# Sent and total bytes of the file, total is None if the size is unknown
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+PathLike = Union[str, "os.PathLike[str]"]
+FileSource = Union[bytes, BinaryIO, PathLike, mmap.mmap, AsyncIterable[bytes]]
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _get_filename(source: FileSource) -> Optional[str]:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None)
+    return os.path.basename(name) if isinstance(name, str) else None
+
+
+def _is_file_object(source: FileSource) -> bool:
+    return not isinstance(source, (bytes, mmap.mmap, str, os.PathLike, AsyncIterable))
+
+
+def _get_size(source: FileSource) -> Optional[int]:
+    if isinstance(source, (bytes, mmap.mmap)):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if isinstance(source, AsyncIterable) or not source.seekable():
+        # Pipes, sockets, etc. are sent with chunked transfer encoding
+        return None
+    position = source.tell()
+    try:
+        file_stat = os.fstat(source.fileno())
+    except (AttributeError, OSError):
+        file_stat = None
+    if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+        return file_stat.st_size - position
+    size = source.seek(0, os.SEEK_END) - position
+    source.seek(position)
+    return size
+
+
+class MultipartFileStream:
+    """multipart/form-data request body with form fields and one file,
+    the file is read and sent in chunks of `chunk_size` bytes, so it isn't loaded into memory.
+
+    The file may be:
+
+    * a path, the file is opened and read in a thread pool executor
+    * a binary file object, it's read in a thread pool executor from the current position.
+      Non-seekable files (pipes, sockets) are sent with chunked transfer encoding
+      unless `size` is set, and can be read once
+    * a memory-mapped file (`mmap.mmap`) or bytes
+    * an async iterable of bytes. Set `size` to send the body with `Content-Length`,
+      otherwise it's sent with chunked transfer encoding.
+      The iterable is read once, so the body can't be sent again (e.g. on retries)
+
+    The body may be iterated several times (for retries and token refresh),
+    except the async iterable and non-seekable file cases.
+
+    :param source: File
+    :param fields: Form fields sent before the file
+    :param field_name: Name of the file field
+    :param filename: File name, the source name by default
+    :param content_type: File content type, guessed by the file name by default
+    :param size: File size in bytes, required to know the body size of async iterables
+    :param chunk_size: Size of chunks the file is read by
+    :param progress: Called after every sent chunk with sent and total bytes of the file
+    """
+
+    def __init__(
+        self,
+        source: FileSource,
+        fields: Optional[Dict[str, str]] = None,
+        field_name: str = "file",
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        self._source = source
+        self._chunk_size = chunk_size
+        self._progress = progress
+        self._is_consumed = False
+        self._file_position = 0
+        if _is_file_object(source) and cast(BinaryIO, source).seekable():
+            self._file_position = cast(BinaryIO, source).tell()
+        self.size = size if size is not None else _get_size(source)
+        self.boundary = os.urandom(16).hex()
+        filename = filename or _get_filename(source) or "upload"
+        content_type = (
+            content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
+        parts = [
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            f"{value}\r\n"
+            for name, value in (fields or {}).items()
+        ]
+        parts.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field_name)}"; '
+            f'filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n",
+        )
+        self._head = "".join(parts).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_length(self) -> Optional[int]:
+        if self.size is None:
+            return None
+        return len(self._head) + self.size + len(self._tail)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if self.content_length is not None:
+            headers["Content-Length"] = str(self.content_length)
+        return headers
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        sent = 0
+        async for chunk in self._iter_file():
+            sent += len(chunk)
+            yield chunk
+            if self._progress is not None:
+                self._progress(sent, self.size)
+        if self.size is not None and sent != self.size:
+            raise ValueError(f"File size is {sent} bytes, expected {self.size}")
+        yield self._tail
+
+    def _iter_file(self) -> AsyncIterator[bytes]:
+        source = self._source
+        if isinstance(source, (bytes, mmap.mmap)):
+            return self._iter_buffer(source)
+        if isinstance(source, (str, os.PathLike)):
+            return self._iter_path(source)
+        if not isinstance(source, AsyncIterable):
+            return self._iter_file_object(source)
+        if self._is_consumed:
+            raise httpx.StreamConsumed()
+        self._is_consumed = True
+        return source.__aiter__()
+
+    async def _iter_buffer(self, buffer: Union[bytes, mmap.mmap]) -> AsyncIterator[bytes]:
+        for start in range(0, len(buffer), self._chunk_size):
+            end = start + self._chunk_size
+            yield buffer[start:end]
+
+    async def _iter_path(self, path: PathLike) -> AsyncIterator[bytes]:
+        file_object = await _run(open, path, "rb")
+        try:
+            async for chunk in self._read(file_object):
+                yield chunk
+        finally:
+            await _run(file_object.close)
+
+    async def _iter_file_object(self, file_object: BinaryIO) -> AsyncIterator[bytes]:
+        if file_object.seekable():
+            file_object.seek(self._file_position)
+        async for chunk in self._read(file_object):
+            yield chunk
+
+    async def _read(self, file_object: BinaryIO) -> AsyncIterator[bytes]:
+        while chunk := await _run(file_object.read, self._chunk_size):
+            yield chunk
+
+
+async def _run(func: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
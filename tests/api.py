@@ -1,3 +1,5 @@
+import asyncio
+import fcntl
 import json
 import uuid
 from typing import Any, Callable, Dict, Optional
@@ -34,8 +36,11 @@ class Router:
         cls._api = api
 
     def __call__(self, api_handler: Callable) -> Callable:
-        def inner(*args: Any, **kwargs: Any) -> Any:
-            return api_handler(self._api, *args, **kwargs)
+        async def inner(*args: Any, **kwargs: Any) -> Any:
+            # Yield to the event loop like a real network round trip does,
+            # so concurrent requests interleave as they would with a real server
+            await asyncio.sleep(0)
+            return self._api.dispatch(api_handler, *args, **kwargs)
 
         respx.request(
             method=self.method,
@@ -55,6 +60,9 @@ class FakeAPIServer:
         self.is_expired_token = False
         Router.register_api(self)
 
+    def dispatch(self, handler: Callable, *args: Any, **kwargs: Any) -> httpx.Response:
+        return handler(self, *args, **kwargs)
+
     @classmethod
     def access_token_is_valid(cls, _: httpx.Request) -> httpx.Response:
         return httpx.Response(200)
@@ -133,6 +141,62 @@ class FakeAPIServer:
         self.is_expired_token = False
 
 
+class SharedStateFakeAPIServer(FakeAPIServer):
+    """Fake server which keeps its state in a file, so it can be used by several processes.
+    Requests are handled one at a time across all processes.
+    """
+
+    def __init__(self, state_filename: str) -> None:
+        self.state_filename = state_filename
+        self.refresh_count = 0
+        Router.register_api(self)
+        self._load()
+
+    @classmethod
+    def create(cls, state_filename: str, token_pair: TokenPair) -> "SharedStateFakeAPIServer":
+        state = {
+            "access_token": token_pair.access_token,
+            "refresh_token": token_pair.refresh_token,
+            "is_expired_token": False,
+            "refresh_count": 0,
+        }
+        with open(state_filename, "w") as fout:
+            json.dump(state, fout)
+        return cls(state_filename)
+
+    def _load(self) -> None:
+        with open(self.state_filename) as fin:
+            state = json.load(fin)
+        self.token_pair = TokenPair(state["access_token"], state["refresh_token"])
+        self.is_expired_token = state["is_expired_token"]
+        self.refresh_count = state["refresh_count"]
+
+    def _save(self) -> None:
+        state = {
+            "access_token": self.token_pair.access_token,
+            "refresh_token": self.token_pair.refresh_token,
+            "is_expired_token": self.is_expired_token,
+            "refresh_count": self.refresh_count,
+        }
+        with open(self.state_filename, "w") as fout:
+            json.dump(state, fout)
+
+    def dispatch(self, handler: Callable, *args: Any, **kwargs: Any) -> httpx.Response:
+        with open(self.state_filename + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._load()
+            response = handler(self, *args, **kwargs)
+            if handler.__name__ == "token_refresh" and response.status_code == 200:
+                self.refresh_count += 1
+            self._save()
+        return response
+
+    def expire_token(self) -> None:
+        self._load()
+        super().expire_token()
+        self._save()
+
+
 def new_token_storage(file_name: str, token_pair: TokenPair) -> HuntflowTokenFileStorage:
     token_data = {
         "access_token": token_pair.access_token,
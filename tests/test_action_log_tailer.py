@@ -0,0 +1,154 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, cast
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.action_log_tailer import (
+    ActionLogTailer,
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+)
+from huntflow_api_client.parsing import ResponseMode, get_field
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from tests.api import BASE_URL
+
+ACCOUNT_ID = 1
+
+
+class FakeActionLogs:
+    """Emulates `next_id` / `previous_id` filtering of action logs endpoint"""
+
+    def __init__(self, httpx_mock: HTTPXMock, last_id: int = 0) -> None:
+        self.ids = list(range(1, last_id + 1))
+        self.requests: List[Dict[str, str]] = []
+        httpx_mock.add_callback(self.handle)
+
+    def add(self, count: int) -> None:
+        last_id = self.ids[-1] if self.ids else 0
+        self.ids.extend(range(last_id + 1, last_id + count + 1))
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        ids = sorted(self.ids, reverse=True)
+        if "next_id" in params:
+            ids = [log_id for log_id in ids if log_id <= int(params["next_id"])]
+        if "previous_id" in params:
+            ids = [log_id for log_id in ids if log_id > int(params["previous_id"])]
+        count = int(params["count"])
+        next_id = ids[count] if len(ids) > count else None
+        return httpx.Response(
+            200,
+            json={"items": [self._log(log_id) for log_id in ids[:count]], "next_id": next_id},
+        )
+
+    @staticmethod
+    def _log(log_id: int) -> Dict[str, Any]:
+        return {
+            "id": log_id,
+            "user": {"id": 1, "name": "John Joe", "email": "user@example.com", "meta": {}},
+            "log_type": "SUCCESS_LOGIN",
+            "created": "2020-01-01T00:00:00+03:00",
+            "action": "create",
+            "ipv4": "127.0.0.1",
+            "data": {},
+        }
+
+
+@pytest.fixture
+def api_client(token_proxy: HuntflowTokenProxy) -> HuntflowAPI:
+    return HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+
+
+async def test_poll__starts_from_latest_log(httpx_mock: HTTPXMock, api_client: HuntflowAPI) -> None:
+    logs = FakeActionLogs(httpx_mock, last_id=10)
+    store = InMemoryCheckpointStore()
+    tailer = ActionLogTailer(api_client, ACCOUNT_ID, store, count=3)
+
+    assert await tailer.poll() == []
+    assert await store.get() == 10
+
+    logs.add(7)
+    new_logs = await tailer.poll()
+    assert [get_field(log, "id") for log in new_logs] == list(range(11, 18))
+    assert [request.get("previous_id") for request in logs.requests[1:]] == ["10"] * 4
+
+
+async def test_poll__starts_from_checkpoint(httpx_mock: HTTPXMock, api_client: HuntflowAPI) -> None:
+    FakeActionLogs(httpx_mock, last_id=10)
+    tailer = ActionLogTailer(api_client, ACCOUNT_ID, InMemoryCheckpointStore(8))
+
+    assert [get_field(log, "id") for log in await tailer.poll()] == [9, 10]
+
+
+async def test_tail__commits_and_backs_off(
+    httpx_mock: HTTPXMock,
+    api_client: HuntflowAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    logs = FakeActionLogs(httpx_mock, last_id=2)
+    store = InMemoryCheckpointStore()
+    tailer = ActionLogTailer(
+        api_client,
+        ACCOUNT_ID,
+        store,
+        initial_id=0,
+        min_interval=1,
+        max_interval=4,
+    )
+    delays: List[float] = []
+    original_sleep = asyncio.sleep
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == 4:
+            logs.add(1)
+        await original_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    received = []
+    async for log in tailer.tail():
+        received.append(get_field(log, "id"))
+        if get_field(log, "id") == 3:
+            break
+
+    assert received == [1, 2, 3]
+    assert delays == [1, 1, 2, 4]
+    assert await store.get() == 2
+
+
+async def test_backfill(httpx_mock: HTTPXMock, api_client: HuntflowAPI) -> None:
+    logs = FakeActionLogs(httpx_mock, last_id=50)
+    tailer = ActionLogTailer(api_client, ACCOUNT_ID, count=4)
+
+    backfilled = [get_field(log, "id") async for log in tailer.backfill(to_id=5, concurrency=3)]
+
+    assert sorted(backfilled) == list(range(6, 51))
+    assert len(backfilled) == len(set(backfilled))
+    assert {request.get("previous_id") for request in logs.requests[1:]} == {"5", "20", "35"}
+
+
+async def test_file_checkpoint_store(tmp_path: Path) -> None:
+    store = FileCheckpointStore(str(tmp_path / "checkpoint"))
+
+    assert await store.get() is None
+    await store.update(42)
+    assert await FileCheckpointStore(str(tmp_path / "checkpoint")).get() == 42
+
+
+async def test_backfill_in_raw_mode(httpx_mock: HTTPXMock, token_proxy: HuntflowTokenProxy) -> None:
+    FakeActionLogs(httpx_mock, last_id=10)
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy, response_mode=ResponseMode.RAW)
+    tailer = ActionLogTailer(api_client, ACCOUNT_ID, count=4)
+
+    backfilled: List[Dict[str, Any]] = [
+        cast(Dict[str, Any], log) async for log in tailer.backfill(concurrency=2)
+    ]
+
+    assert sorted(log["id"] for log in backfilled) == list(range(1, 11))
+    assert backfilled[0] == FakeActionLogs._log(backfilled[0]["id"])
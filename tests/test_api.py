@@ -0,0 +1,133 @@
+from typing import List
+
+import httpx
+import pytest
+import respx
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from huntflow_api_client.transport import TransportConfig
+from tests.api import BASE_URL, VERSIONED_BASE_URL, FakeAPIServer
+
+
+@respx.mock
+async def test_http_client_is_reused_between_requests(
+    fake_server: FakeAPIServer,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+
+    http_client = api.http_client
+    await api.request("GET", "/me")
+    await api.request("GET", "/me")
+
+    assert api.http_client is http_client
+    assert not http_client.is_closed
+    assert respx.routes["/me"].call_count == 2
+
+
+@respx.mock
+async def test_context_manager_closes_http_client(
+    fake_server: FakeAPIServer,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy) as api:
+        await api.request("GET", "/me")
+        http_client = api.http_client
+
+    assert http_client.is_closed
+
+
+@respx.mock
+async def test_http_client_is_recreated_after_close(
+    fake_server: FakeAPIServer,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+    http_client = api.http_client
+    await api.aclose()
+
+    response = await api.request("GET", "/me")
+
+    assert response.status_code == 200
+    assert api.http_client is not http_client
+
+
+async def test_transport_config(token_proxy: HuntflowTokenProxy) -> None:
+    config = TransportConfig(
+        max_connections=5,
+        max_keepalive_connections=3,
+        keepalive_expiry=10,
+        read_timeout=30,
+        retries=2,
+        local_address="0.0.0.0",
+    )
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy, transport_config=config) as api:
+        assert api.http_client.timeout.read == 30
+        assert api.http_client.timeout.connect == 5
+        pool = api.http_client._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 10
+        assert pool._retries == 2
+        assert pool._local_address == "0.0.0.0"
+
+
+async def test_custom_transport(token_proxy: HuntflowTokenProxy) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    config = TransportConfig(transport=httpx.MockTransport(handler))
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy, transport_config=config) as api:
+        response = await api.request("GET", "/me")
+
+    assert response.status_code == 200
+    assert len(requests) == 1
+    assert requests[0].url == f"{VERSIONED_BASE_URL}/me"
+
+
+async def test_default_timeouts(token_proxy: HuntflowTokenProxy) -> None:
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy) as api:
+        assert api.http_client.timeout == httpx.Timeout(5.0)
+
+
+async def test_custom_transport_is_not_reused_after_close(
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    config = TransportConfig(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy, transport_config=config)
+    await api.request("GET", "/me")
+    await api.aclose()
+
+    with pytest.raises(RuntimeError):
+        await api.request("GET", "/me")
+
+
+async def test_transport_factory(token_proxy: HuntflowTokenProxy) -> None:
+    transports: List[httpx.AsyncBaseTransport] = []
+
+    def create_transport() -> httpx.AsyncBaseTransport:
+        transports.append(httpx.MockTransport(lambda _: httpx.Response(200)))
+        return transports[-1]
+
+    config = TransportConfig(transport_factory=create_transport)
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy, transport_config=config)
+    await api.request("GET", "/me")
+    await api.aclose()
+
+    response = await api.request("GET", "/me")
+    await api.aclose()
+
+    assert response.status_code == 200
+    assert len(transports) == 2
+
+
+async def test_http2_transport(token_proxy: HuntflowTokenProxy) -> None:
+    pytest.importorskip("h2")
+    config = TransportConfig(http2=True)
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy, transport_config=config) as api:
+        pool = api.http_client._transport._pool  # type: ignore[attr-defined]
+        assert pool._http2 is True
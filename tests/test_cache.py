@@ -0,0 +1,254 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Type
+
+import httpx
+import pytest
+from freezegun import freeze_time
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.cache import (
+    PERSISTENT_CACHE_RULES,
+    AbstractResponseCache,
+    CachedResponse,
+    CacheRule,
+    InMemoryResponseCache,
+    SQLiteResponseCache,
+)
+from huntflow_api_client.entities.tags import AccountTag
+from huntflow_api_client.models.request.tags import CreateAccountTagRequest
+from huntflow_api_client.models.response.tags import AccountTagsListResponse
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import BASE_URL, VERSIONED_BASE_URL
+from tests.test_entities.test_tags import (
+    ACCOUNT_TAG_RESPONSE,
+    ACCOUNT_TAGS_LIST_RESPONSE,
+    CREATE_ACCOUNT_TAG_REQUEST,
+)
+
+ACCOUNT_ID = 1
+TAGS_URL = f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/tags"
+
+
+def make_api(cache: AbstractResponseCache, access_token: str = "token") -> HuntflowAPI:
+    return HuntflowAPI(BASE_URL, token=ApiToken(access_token=access_token), response_cache=cache)
+
+
+async def test_cached_response(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=TAGS_URL, json=ACCOUNT_TAGS_LIST_RESPONSE)
+    tags = AccountTag(make_api(InMemoryResponseCache()))
+
+    first = await tags.list(ACCOUNT_ID)
+    second = await tags.list(ACCOUNT_ID)
+
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_cache_expiration(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=TAGS_URL, json=ACCOUNT_TAGS_LIST_RESPONSE)
+    cache = InMemoryResponseCache([CacheRule("/accounts/{account_id}/tags", ttl=60)])
+    tags = AccountTag(make_api(cache))
+
+    with freeze_time(datetime.now()) as frozen_time:
+        await tags.list(ACCOUNT_ID)
+        frozen_time.tick(timedelta(seconds=59))
+        await tags.list(ACCOUNT_ID)
+        assert len(httpx_mock.get_requests()) == 1
+
+        frozen_time.tick(timedelta(seconds=2))
+        await tags.list(ACCOUNT_ID)
+        assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_cache_key_includes_token(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=TAGS_URL, json=ACCOUNT_TAGS_LIST_RESPONSE)
+    cache = InMemoryResponseCache()
+
+    await AccountTag(make_api(cache, "first")).list(ACCOUNT_ID)
+    await AccountTag(make_api(cache, "second")).list(ACCOUNT_ID)
+    await AccountTag(make_api(cache, "first")).list(ACCOUNT_ID)
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_not_cached_path(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=f"{TAGS_URL}/2", json=ACCOUNT_TAG_RESPONSE)
+    tags = AccountTag(make_api(InMemoryResponseCache()))
+
+    await tags.get(ACCOUNT_ID, 2)
+    await tags.get(ACCOUNT_ID, 2)
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+async def test_write_invalidates_list(httpx_mock: HTTPXMock, write: str) -> None:
+    httpx_mock.add_response(url=TAGS_URL, method="GET", json=ACCOUNT_TAGS_LIST_RESPONSE)
+    httpx_mock.add_response(
+        method={"create": "POST", "update": "PUT"}.get(write, "DELETE"),
+        json=ACCOUNT_TAG_RESPONSE,
+    )
+    cache = InMemoryResponseCache()
+    tags = AccountTag(make_api(cache))
+    data = CreateAccountTagRequest(**CREATE_ACCOUNT_TAG_REQUEST)
+
+    await tags.list(ACCOUNT_ID)
+    assert len(cache) == 1
+    if write == "create":
+        await tags.create(ACCOUNT_ID, data)
+    elif write == "update":
+        await tags.update(ACCOUNT_ID, 2, data)
+    else:
+        await tags.delete(ACCOUNT_ID, 2)
+    assert len(cache) == 0
+
+    await tags.list(ACCOUNT_ID)
+    assert len(httpx_mock.get_requests(method="GET")) == 2
+
+
+@pytest.mark.parametrize("query", ["days", "deadline", "start"])
+async def test_calendar_queries_dont_invalidate_calendar(query: str) -> None:
+    cache = InMemoryResponseCache(PERSISTENT_CACHE_RULES)
+    response = CachedResponse(200, [], b"{}")
+    key = ("GET", "/production_calendars/1", (), "token")
+    await cache.set(key, response, ttl=60)
+
+    await cache.invalidate_for_write(f"/production_calendars/1/{query}")
+
+    assert await cache.get(key) == response
+
+
+async def test_lru_eviction() -> None:
+    cache = InMemoryResponseCache(max_size=2)
+    response = CachedResponse(200, [], b"{}")
+    keys = [("GET", f"/accounts/{i}/tags", (), "token") for i in range(3)]
+
+    await cache.set(keys[0], response, ttl=60)
+    await cache.set(keys[1], response, ttl=60)
+    assert await cache.get(keys[0]) == response
+    await cache.set(keys[2], response, ttl=60)
+
+    assert await cache.get(keys[0]) == response
+    assert await cache.get(keys[1]) is None
+    assert await cache.get(keys[2]) == response
+
+
+async def test_explicit_invalidation() -> None:
+    cache = InMemoryResponseCache()
+    response = CachedResponse(200, [], b"{}")
+    await cache.set(("GET", "/accounts/1/tags", (), "token"), response, ttl=60)
+    await cache.set(("GET", "/accounts/1/tags", (("page", "2"),), "token"), response, ttl=60)
+    await cache.set(("GET", "/accounts/1/regions", (), "token"), response, ttl=60)
+
+    await cache.invalidate("/accounts/1/tags")
+    assert len(cache) == 1
+
+    await cache.clear()
+    assert len(cache) == 0
+
+
+async def test_cached_compressed_response(httpx_mock: HTTPXMock) -> None:
+    content = gzip.compress(json.dumps(ACCOUNT_TAGS_LIST_RESPONSE).encode())
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            stream=httpx.ByteStream(content),
+        ),
+        url=TAGS_URL,
+    )
+    tags = AccountTag(make_api(InMemoryResponseCache()))
+
+    first = await tags.list(ACCOUNT_ID)
+    second = await tags.list(ACCOUNT_ID)
+
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+
+
+class FakeVersionedResource:
+    """Returns 304 if the client has the current version (ETag) of the resource"""
+
+    def __init__(self, httpx_mock: HTTPXMock, url: str) -> None:
+        self.version = 1
+        self.requests: List[httpx.Request] = []
+        httpx_mock.add_callback(self.handle, url=url)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        items = [{"id": self.version, "name": "Blacklist", "color": "000000"}]
+        return httpx.Response(200, json={"items": items}, headers={"ETag": etag})
+
+
+@pytest.mark.parametrize("cache_class", [InMemoryResponseCache, SQLiteResponseCache])
+async def test_revalidation(
+    httpx_mock: HTTPXMock,
+    tmp_path: Path,
+    cache_class: Type[AbstractResponseCache],
+) -> None:
+    resource = FakeVersionedResource(httpx_mock, TAGS_URL)
+    rules = [CacheRule("/accounts/{account_id}/tags", ttl=60)]
+    if cache_class is SQLiteResponseCache:
+        cache: AbstractResponseCache = SQLiteResponseCache(str(tmp_path / "cache.db"), rules)
+    else:
+        cache = InMemoryResponseCache(rules)
+    tags = AccountTag(make_api(cache))
+
+    with freeze_time(datetime.now()) as frozen_time:
+        first = await tags.list(ACCOUNT_ID)
+        frozen_time.tick(timedelta(seconds=61))
+        assert await tags.list(ACCOUNT_ID) == first
+        assert resource.requests[-1].headers["If-None-Match"] == '"1"'
+        assert len(resource.requests) == 2
+
+        # The response is fresh again after revalidation
+        await tags.list(ACCOUNT_ID)
+        assert len(resource.requests) == 2
+
+        resource.version = 2
+        frozen_time.tick(timedelta(seconds=61))
+        updated = await tags.list(ACCOUNT_ID)
+        assert isinstance(updated, AccountTagsListResponse)
+        assert updated.items[0].id == 2
+        assert len(resource.requests) == 3
+
+
+async def test_sqlite_cache_is_persistent(httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    httpx_mock.add_response(url=TAGS_URL, json=ACCOUNT_TAGS_LIST_RESPONSE)
+    filename = str(tmp_path / "cache.db")
+
+    first = await AccountTag(make_api(SQLiteResponseCache(filename))).list(ACCOUNT_ID)
+    second = await AccountTag(make_api(SQLiteResponseCache(filename))).list(ACCOUNT_ID)
+
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_sqlite_cache_size_limit(tmp_path: Path) -> None:
+    cache = SQLiteResponseCache(str(tmp_path / "cache.db"), max_size=120, compression_level=0)
+    response = CachedResponse(200, [("ETag", '"1"')], b"x" * 40)
+    keys = [("GET", f"/accounts/{i}/tags", (), "token") for i in range(3)]
+
+    with freeze_time(datetime.now()) as frozen_time:
+        for key in keys[:2]:
+            await cache.set(key, response, ttl=60)
+            frozen_time.tick()
+        assert await cache.get(keys[0]) == response
+        frozen_time.tick()
+        await cache.set(keys[2], response, ttl=60)
+
+    assert await cache.get(keys[0]) == response
+    assert await cache.get(keys[1]) is None
+    assert await cache.get(keys[2]) == response
+
+    await cache.invalidate("/accounts/0/tags")
+    assert await cache.get_stale(keys[0]) is None
+    await cache.clear()
+    assert await cache.get_stale(keys[2]) is None
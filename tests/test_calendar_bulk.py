@@ -0,0 +1,143 @@
+import asyncio
+import datetime
+import json
+from typing import List
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.calendar_bulk import ProductionCalendarBulk
+from huntflow_api_client.entities.production_calendars import ProductionCalendar
+from huntflow_api_client.models.request.production_calendars import (
+    DeadLineDate,
+    NonWorkingDays,
+    StartDate,
+)
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import BASE_URL
+
+CALENDAR_ID = 1
+START = datetime.date(2023, 1, 1)
+TODAY = "2024-01-01"
+
+
+class FakeBulkAPI:
+    """Every day is a working one, requests are answered after a delay"""
+
+    def __init__(self, httpx_mock: HTTPXMock, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.chunks: List[List[dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        httpx_mock.add_callback(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        chunk = json.loads(request.content)
+        self.chunks.append(chunk)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if request.url.path.endswith("/days"):
+            return httpx.Response(200, json={"items": [self.period(item) for item in chunk]})
+        sign = 1 if request.url.path.endswith("/deadline") else -1
+        items = []
+        for item in chunk:
+            date = datetime.date.fromisoformat(item.get("start") or item.get("deadline") or TODAY)
+            items.append((date + datetime.timedelta(days=sign * item["days"])).isoformat())
+        return httpx.Response(200, json={"items": items})
+
+    @staticmethod
+    def period(item: dict) -> dict:
+        start = datetime.date.fromisoformat(item["start"])
+        deadline = datetime.date.fromisoformat(item["deadline"])
+        return {
+            "start": item["start"],
+            "deadline": item["deadline"],
+            "total_days": (deadline - start).days + 1,
+            "not_working_days": 0,
+            "production_calendar": CALENDAR_ID,
+        }
+
+    @property
+    def items_count(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+def make_bulk(chunk_size: int = 10, concurrency: int = 2) -> ProductionCalendarBulk:
+    api = HuntflowAPI(BASE_URL, token=ApiToken(access_token="token"))
+    return ProductionCalendarBulk(
+        ProductionCalendar(api),
+        CALENDAR_ID,
+        chunk_size=chunk_size,
+        concurrency=concurrency,
+    )
+
+
+async def test_chunks_are_sent_concurrently_and_results_are_ordered(
+    httpx_mock: HTTPXMock,
+) -> None:
+    api = FakeBulkAPI(httpx_mock)
+    bulk = make_bulk(chunk_size=10, concurrency=3)
+    days = list(range(95, 0, -1))
+
+    deadlines = await bulk.get_deadline_dates(DeadLineDate(days=n, start=START) for n in days)
+
+    assert deadlines == [START + datetime.timedelta(days=n) for n in days]
+    assert [len(chunk) for chunk in api.chunks] == [10] * 9 + [5]
+    assert api.max_in_flight == 3
+
+
+async def test_duplicates_are_sent_once(httpx_mock: HTTPXMock) -> None:
+    api = FakeBulkAPI(httpx_mock)
+    bulk = make_bulk()
+    periods = [
+        NonWorkingDays(start=START, deadline=START + datetime.timedelta(days=i % 5))
+        for i in range(50)
+    ]
+
+    results = await bulk.get_non_working_days(periods)
+
+    assert api.items_count == 5
+    assert [result.total_days for result in results] == [i % 5 + 1 for i in range(50)]
+
+
+async def test_results_are_memoized_across_calls(httpx_mock: HTTPXMock) -> None:
+    api = FakeBulkAPI(httpx_mock)
+    bulk = make_bulk()
+
+    await bulk.get_start_dates(StartDate(days=n, deadline=START) for n in range(20))
+    starts = await bulk.get_start_dates(StartDate(days=n, deadline=START) for n in range(10, 30))
+
+    assert starts == [START - datetime.timedelta(days=n) for n in range(10, 30)]
+    assert api.items_count == 30
+
+    bulk.clear()
+    await bulk.get_start_dates([StartDate(days=1, deadline=START)])
+    assert api.items_count == 31
+
+
+async def test_items_without_dates_are_not_memoized(httpx_mock: HTTPXMock) -> None:
+    api = FakeBulkAPI(httpx_mock)
+    bulk = make_bulk()
+
+    await bulk.get_deadline_dates([DeadLineDate(days=1), DeadLineDate(days=1)])
+    await bulk.get_deadline_dates([DeadLineDate(days=1)])
+
+    assert api.items_count == 2
+
+
+async def test_empty_items(httpx_mock: HTTPXMock) -> None:
+    assert await make_bulk().get_deadline_dates([]) == []
+    assert httpx_mock.get_requests() == []
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        make_bulk(chunk_size=0)
+    with pytest.raises(ValueError):
+        make_bulk(concurrency=0)
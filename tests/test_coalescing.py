@@ -0,0 +1,105 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.coalescing import RequestCoalescer
+from huntflow_api_client.entities.vacancies import Vacancy
+from huntflow_api_client.errors import NotFoundError
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import BASE_URL, VERSIONED_BASE_URL
+from tests.test_entities.test_vacancies import GET_VACANCY_RESPONSE
+
+ACCOUNT_ID = 1
+VACANCY_ID = 2
+VACANCY_URL = f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/vacancies/{VACANCY_ID}"
+
+
+def make_api(coalescer: Optional[RequestCoalescer]) -> HuntflowAPI:
+    return HuntflowAPI(BASE_URL, token=ApiToken(access_token="token"), request_coalescer=coalescer)
+
+
+async def test_concurrent_requests_are_coalesced(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=VACANCY_URL, json=GET_VACANCY_RESPONSE)
+    coalescer = RequestCoalescer()
+    vacancies = Vacancy(make_api(coalescer))
+
+    results = await asyncio.gather(
+        *(vacancies.get(ACCOUNT_ID, VACANCY_ID) for _ in range(100)),
+    )
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(result == results[0] for result in results)
+    metrics = coalescer.metrics
+    assert (metrics.requests, metrics.coalesced, metrics.in_flight) == (100, 99, 0)
+    assert metrics.hit_rate == 0.99
+
+
+async def test_sequential_requests_are_not_coalesced(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=VACANCY_URL, json=GET_VACANCY_RESPONSE)
+    vacancies = Vacancy(make_api(RequestCoalescer()))
+
+    await vacancies.get(ACCOUNT_ID, VACANCY_ID)
+    await vacancies.get(ACCOUNT_ID, VACANCY_ID)
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_different_requests_are_not_coalesced(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json=GET_VACANCY_RESPONSE)
+    vacancies = Vacancy(make_api(RequestCoalescer()))
+
+    await asyncio.gather(vacancies.get(ACCOUNT_ID, VACANCY_ID), vacancies.get(ACCOUNT_ID, 3))
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_error_is_shared(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=VACANCY_URL, status_code=404)
+    vacancies = Vacancy(make_api(RequestCoalescer()))
+
+    results = await asyncio.gather(
+        *(vacancies.get(ACCOUNT_ID, VACANCY_ID) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, NotFoundError) for result in results)
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.parametrize(
+    "coalescer",
+    [
+        RequestCoalescer(paths=["/accounts/{account_id}/vacancies"]),
+        RequestCoalescer(exclude_paths=["/accounts/{account_id}/vacancies/{vacancy_id}"]),
+    ],
+)
+async def test_path_is_not_coalesced(httpx_mock: HTTPXMock, coalescer: RequestCoalescer) -> None:
+    httpx_mock.add_response(url=VACANCY_URL, json=GET_VACANCY_RESPONSE)
+    vacancies = Vacancy(make_api(coalescer))
+
+    await asyncio.gather(*(vacancies.get(ACCOUNT_ID, VACANCY_ID) for _ in range(3)))
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert coalescer.metrics.requests == 0
+
+
+async def test_cancelled_request() -> None:
+    coalescer = RequestCoalescer()
+    started = asyncio.Event()
+
+    async def send() -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    key = ("GET", "/path", (), "token")
+    waiter = asyncio.create_task(coalescer.run(key, send))  # type: ignore[arg-type]
+    await started.wait()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0)
+
+    assert coalescer.metrics.in_flight == 0
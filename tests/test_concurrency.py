@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyMetrics
+from huntflow_api_client.errors import ApiError, NotFoundError
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from huntflow_api_client.transport import TransportConfig
+from tests.api import BASE_URL
+
+
+async def test_requests_above_limit_wait_in_queue() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=None)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.metrics == ConcurrencyMetrics(limit=2, in_flight=2, queue_depth=1)
+
+    limiter.release(time.monotonic(), latency=0.01)
+    await waiter
+    assert limiter.metrics == ConcurrencyMetrics(limit=2, in_flight=2, queue_depth=0)
+
+
+async def test_cancelled_waiter_leaves_queue() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 1
+
+
+async def test_additive_increase_when_saturated() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=None)
+
+    for _ in range(3):
+        await asyncio.gather(*(limiter.acquire() for _ in range(2)))
+        for _ in range(2):
+            limiter.release(time.monotonic(), latency=0.01)
+
+    assert limiter.limit == 3
+
+
+async def test_no_increase_when_not_saturated() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=5, latency_tolerance=None)
+
+    for _ in range(20):
+        async with limiter.slot():
+            pass
+
+    assert limiter.limit == 5
+
+
+async def test_multiplicative_decrease_once_per_burst() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=1)
+    started_at = time.monotonic()
+    for _ in range(4):
+        await limiter.acquire()
+
+    for _ in range(4):
+        limiter.release(started_at, overloaded=True)
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_limit"),
+    [
+        (ApiError(502), 4),
+        (ApiError(429), 4),
+        (httpx.ReadTimeout("timeout"), 4),
+        (NotFoundError(), 8),
+    ],
+)
+async def test_slot_classifies_errors(error: Exception, expected_limit: int) -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+    with pytest.raises(type(error)):
+        async with limiter.slot():
+            raise error
+
+    assert limiter.limit == expected_limit
+    assert limiter.in_flight == 0
+
+
+async def test_latency_spike_decreases_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2.0)
+
+    await limiter.acquire()
+    limiter.release(time.monotonic(), latency=0.1)
+    await limiter.acquire()
+    limiter.release(time.monotonic(), latency=0.5)
+
+    assert limiter.limit == 4
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(decrease_factor=1)
+
+
+async def test_api_requests_respect_limit(token_proxy: HuntflowTokenProxy) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    config = TransportConfig(transport=httpx.MockTransport(handler))
+    api = HuntflowAPI(
+        BASE_URL,
+        token_proxy=token_proxy,
+        transport_config=config,
+        concurrency_limiter=limiter,
+    )
+
+    await asyncio.gather(*(api.request("GET", "/me") for _ in range(20)))
+
+    assert max_in_flight == 3
+    assert limiter.metrics == ConcurrencyMetrics(limit=3, in_flight=0, queue_depth=0)
@@ -49,3 +49,24 @@ async def test_applicant_response_list(
     assert response == ApplicantResponsesListResponse.model_validate(
         APPLICANT_RESPONSE_LIST_RESPONSE,
     )
+
+
+async def test_applicant_response_iter_list(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    url = f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/applicants/{APPLICANT_ID}/responses"
+    httpx_mock.add_response(url=f"{url}?count=30", json=APPLICANT_RESPONSE_LIST_RESPONSE)
+    httpx_mock.add_response(
+        url=f"{url}?count=30&next_page_cursor=string",
+        json={**APPLICANT_RESPONSE_LIST_RESPONSE, "next_page_cursor": None},
+    )
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+    applicant_response = ApplicantResponse(api_client)
+
+    responses = applicant_response.iter_list(account_id=ACCOUNT_ID, applicant_id=APPLICANT_ID)
+    items = [item async for item in responses]
+
+    expected = ApplicantResponsesListResponse.model_validate(APPLICANT_RESPONSE_LIST_RESPONSE)
+    assert items == expected.items * 2
+    assert responses.is_exhausted
@@ -285,6 +285,32 @@ async def test_list_applicant(
     assert response == ApplicantListResponse(**APPLICANT_LIST_RESPONSE)
 
 
+async def test_iter_list_applicant(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    first_item, second_item = APPLICANT_LIST_RESPONSE["items"]
+    for page, item in enumerate((first_item, second_item), start=1):
+        httpx_mock.add_response(
+            url=f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/applicants?count=1&page={page}",
+            json={
+                **APPLICANT_LIST_RESPONSE,
+                "page": page,
+                "count": 1,
+                "total_pages": 2,
+                "items": [item],
+            },
+        )
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+    applicants = Applicant(api_client)
+
+    items = [item async for item in applicants.iter_list(ACCOUNT_ID, count=1)]
+    assert items == [ApplicantItem(**first_item), ApplicantItem(**second_item)]
+
+    items = [item async for item in applicants.iter_list(ACCOUNT_ID, count=1, concurrency=2)]
+    assert items == [ApplicantItem(**first_item), ApplicantItem(**second_item)]
+
+
 async def test_get_applicant(
     httpx_mock: HTTPXMock,
     token_proxy: HuntflowTokenProxy,
@@ -371,6 +397,7 @@ async def test_applicant_search_by_cursor(
         vacancy=[],
         account_source=[1],
     )
+    assert isinstance(response, ApplicantSearchByCursorResponse)
     assert response == ApplicantSearchByCursorResponse.model_validate(
         APPLICANT_SEARCH_BY_CURSOR_RESPONSE,
     )
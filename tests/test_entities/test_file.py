@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from pytest_httpx import HTTPXMock
 
@@ -53,3 +54,36 @@ async def test_upload_file(
 
     response = await files.upload(ACCOUNT_ID, headers, upload_data)
     assert response == UploadResponse(**UPLOAD_FILE_RESPONSE)
+
+
+async def test_upload_file_from_path(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+    tmp_path: Path,
+) -> None:
+    httpx_mock.add_response(
+        url=f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/upload",
+        json=UPLOAD_FILE_RESPONSE,
+    )
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+    files = File(api_client)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF" * 100_000)
+    progress: List[Tuple[int, Optional[int]]] = []
+
+    response = await files.upload(
+        ACCOUNT_ID,
+        UploadFileHeaders(file_parse=True),
+        path,
+        preset="preset",
+        progress=lambda sent, total: progress.append((sent, total)),
+    )
+
+    assert response == UploadResponse(**UPLOAD_FILE_RESPONSE)
+    request = httpx_mock.get_requests()[0]
+    body = await request.aread()
+    assert request.headers["Content-Length"] == str(len(body))
+    assert "X-File-Parse" in request.headers
+    assert b'name="preset"\r\n\r\npreset\r\n' in body
+    assert b'filename="resume.pdf"\r\nContent-Type: application/pdf\r\n\r\n%PDF' in body
+    assert progress[-1] == (400_000, 400_000)
@@ -1,3 +1,5 @@
+import json
+
 from pytest_httpx import HTTPXMock
 
 from huntflow_api_client import HuntflowAPI
@@ -212,6 +214,10 @@ async def test_create_survey_questionary(
     assert response == SurveyQuestionaryResponse.model_validate(
         APPLICANT_SURVEY_QUESTIONARY_RESPONSE,
     )
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == request_data.jsonable_dict()
 
 
 async def test_get_survey_questionary(
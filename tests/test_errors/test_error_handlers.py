@@ -232,6 +232,23 @@ class TestErrorHandler429:
         assert exc.value.errors == [
             Error(type="too_many_requests", title="Answer request created too frequently"),
         ]
+        assert exc.value.retry_after is None
+
+    async def test_too_many_requests_error_retry_after(
+        self,
+        httpx_mock: HTTPXMock,
+        api_client: HuntflowAPI,
+    ) -> None:
+        httpx_mock.add_response(
+            url=self.url,
+            method="GET",
+            status_code=429,
+            headers={"Retry-After": "15"},
+        )
+        with pytest.raises(TooManyRequestsError) as exc:
+            await api_client.request("GET", "/me")
+
+        assert exc.value.retry_after == 15
 
 
 class TestDefaultErrorHandler:
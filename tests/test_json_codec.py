@@ -0,0 +1,84 @@
+import json
+from datetime import date
+from typing import Any, List, Type, Union
+
+import httpx
+import pytest
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.json_codec import (
+    AbstractJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_default_codec,
+)
+from huntflow_api_client.models.request.applicants import ApplicantCreateRequest
+from huntflow_api_client.models.response.applicants import ApplicantListResponse
+from huntflow_api_client.parsing import ResponseMode, parse_response
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from huntflow_api_client.transport import TransportConfig
+from tests.api import BASE_URL
+from tests.test_entities.test_applicants import APPLICANT_LIST_RESPONSE
+
+
+@pytest.mark.parametrize("codec_class", [StdlibJsonCodec, OrjsonCodec])
+def test_codec_round_trip(codec_class: Type[AbstractJsonCodec]) -> None:
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    codec = codec_class()
+    data = {"name": "Иван", "ids": [1, 2], "nested": {"value": None, "flag": True}}
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == data
+    assert json.loads(encoded) == data
+
+
+def test_default_codec_is_orjson() -> None:
+    pytest.importorskip("orjson")
+    assert isinstance(get_default_codec(), OrjsonCodec)
+
+
+def test_default_codec_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("huntflow_api_client.json_codec.orjson", None)
+
+    assert isinstance(get_default_codec(), StdlibJsonCodec)
+    with pytest.raises(RuntimeError):
+        OrjsonCodec()
+
+
+def test_parse_response_raw_mode_uses_codec() -> None:
+    class CountingCodec(StdlibJsonCodec):
+        calls = 0
+
+        def loads(self, data: Union[bytes, str]) -> Any:
+            self.calls += 1
+            return super().loads(data)
+
+    codec = CountingCodec()
+    response = httpx.Response(200, json=APPLICANT_LIST_RESPONSE)
+
+    raw = parse_response(ApplicantListResponse, response, ResponseMode.RAW, codec)
+
+    assert raw == APPLICANT_LIST_RESPONSE
+    assert codec.calls == 1
+
+
+async def test_request_sends_encoded_json(token_proxy: HuntflowTokenProxy) -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    transport = TransportConfig(transport=httpx.MockTransport(handler))
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy, transport_config=transport)
+    model = ApplicantCreateRequest(first_name="John", last_name="Doe", birthday=date(2000, 1, 2))
+
+    await api.request("POST", "/dict", json={"date": "2000-01-02"})
+    await api.request("POST", "/model", json=model.json_bytes(exclude_none=True))
+
+    assert [request.headers["Content-Type"] for request in requests] == ["application/json"] * 2
+    assert json.loads(requests[0].content) == {"date": "2000-01-02"}
+    assert json.loads(requests[1].content) == model.jsonable_dict(exclude_none=True)
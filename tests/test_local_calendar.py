@@ -0,0 +1,251 @@
+import asyncio
+import datetime
+import random
+from typing import Any, Dict, List, Set, Tuple
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.entities.production_calendars import ProductionCalendar
+from huntflow_api_client.local_calendar import LocalProductionCalendar
+from huntflow_api_client.models.request.production_calendars import (
+    DeadLineDatesBulkRequest,
+    NonWorkingDaysBulkRequest,
+    StartDatesBulkRequest,
+)
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from tests.api import BASE_URL
+
+CALENDAR_ID = 1
+
+# Holidays of Russian Federation production calendar,
+# weekends are added by `non_working_days`
+HOLIDAYS = {
+    2023: "01-02 01-03 01-04 01-05 01-06 02-23 02-24 03-08 05-01 05-08 05-09 06-12 11-06",
+    2024: (
+        "01-01 01-02 01-03 01-04 01-05 01-08 02-23 03-08 04-29 04-30 05-01 05-09 05-10 "
+        "06-12 11-04 12-30 12-31"
+    ),
+}
+# Saturdays which are working days because of moved holidays
+WORKING_WEEKENDS = {2024: "04-27 11-02 12-28"}
+
+
+def non_working_days(year: int) -> Set[datetime.date]:
+    days = {datetime.date.fromisoformat(f"{year}-{day}") for day in HOLIDAYS.get(year, "").split()}
+    working = {
+        datetime.date.fromisoformat(f"{year}-{day}")
+        for day in WORKING_WEEKENDS.get(year, "").split()
+    }
+    day = datetime.date(year, 1, 1)
+    while day.year == year:
+        if day.weekday() >= 5 and day not in working:
+            days.add(day)
+        day += datetime.timedelta(days=1)
+    return days
+
+
+# Expected answers: (method, arguments) -> response body the API is expected to return.
+# The bodies are written by hand from HOLIDAYS and WORKING_WEEKENDS above, they aren't
+# recorded API responses. So these cases check the local engine against the holiday tables
+# and the semantics of the API methods as documented, not against the live API.
+EXPECTED_ANSWERS: List[Tuple[str, Dict[str, Any], Any]] = [
+    (
+        "get_non_working_days_in_period",
+        {"start": datetime.date(2023, 2, 20), "deadline": datetime.date(2023, 2, 26)},
+        {
+            "start": "2023-02-20",
+            "deadline": "2023-02-26",
+            "total_days": 7,
+            "not_working_days": 4,
+            "production_calendar": CALENDAR_ID,
+            "items": ["2023-02-23", "2023-02-24", "2023-02-25", "2023-02-26"],
+        },
+    ),
+    (
+        "get_non_working_days_in_period",
+        {
+            "start": datetime.date(2024, 4, 26),
+            "deadline": datetime.date(2024, 5, 1),
+            "verbose": False,
+        },
+        {
+            "start": "2024-04-26",
+            "deadline": "2024-05-01",
+            "total_days": 6,
+            "not_working_days": 4,
+            "production_calendar": CALENDAR_ID,
+            "items": None,
+        },
+    ),
+    (
+        "get_deadline_date_with_non_working_days",
+        {"days": 3, "start": datetime.date(2023, 2, 21)},
+        "2023-02-28",
+    ),
+    (
+        "get_deadline_date_with_non_working_days",
+        {"days": 1, "start": datetime.date(2023, 1, 6)},
+        "2023-01-09",
+    ),
+    (
+        "get_deadline_date_with_non_working_days",
+        {"days": 5, "start": datetime.date(2023, 5, 5)},
+        "2023-05-16",
+    ),
+    (
+        "get_deadline_date_with_non_working_days",
+        {"days": 2, "start": datetime.date(2023, 12, 29)},
+        "2024-01-10",
+    ),
+    (
+        "get_deadline_date_with_non_working_days",
+        {"days": 1, "start": datetime.date(2024, 4, 26)},
+        "2024-04-27",
+    ),
+    (
+        "get_start_date_with_non_working_days",
+        {"days": 2, "deadline": datetime.date(2023, 6, 13)},
+        "2023-06-08",
+    ),
+    (
+        "get_start_date_with_non_working_days",
+        {"days": 3, "deadline": datetime.date(2023, 11, 8)},
+        "2023-11-02",
+    ),
+    (
+        "get_non_working_days_for_multiple_period",
+        {
+            "data": NonWorkingDaysBulkRequest.model_validate(
+                [{"start": "2023-05-01", "deadline": "2023-05-14"}],
+            ),
+        },
+        {
+            "items": [
+                {
+                    "start": "2023-05-01",
+                    "deadline": "2023-05-14",
+                    "total_days": 14,
+                    "not_working_days": 7,
+                    "production_calendar": CALENDAR_ID,
+                },
+            ],
+        },
+    ),
+    (
+        "get_multiple_deadline_dates_with_non_working_days",
+        {
+            "data": DeadLineDatesBulkRequest.model_validate(
+                [{"days": 3, "start": "2023-02-21"}, {"days": 10, "start": "2023-12-25"}],
+            ),
+        },
+        {"items": ["2023-02-28", "2024-01-16"]},
+    ),
+    (
+        "get_multiple_start_dates_with_non_working_days",
+        {
+            "data": StartDatesBulkRequest.model_validate(
+                [{"days": 2, "deadline": "2023-06-13"}, {"days": 1, "deadline": "2024-01-09"}],
+            ),
+        },
+        {"items": ["2023-06-08", "2023-12-29"]},
+    ),
+]
+
+
+class FakeCalendarAPI:
+    """Returns non-working days of the calendar for verbose period requests"""
+
+    def __init__(self, httpx_mock: HTTPXMock) -> None:
+        self.requests: List[httpx.Request] = []
+        httpx_mock.add_callback(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        start = datetime.date.fromisoformat(request.url.params["start"])
+        deadline = datetime.date.fromisoformat(request.url.path.rsplit("/", 1)[1])
+        years = range(start.year, deadline.year + 1)
+        days = set().union(*(non_working_days(year) for year in years))
+        items = sorted(day for day in days if start <= day <= deadline)
+        return httpx.Response(
+            200,
+            json={
+                "start": start.isoformat(),
+                "deadline": deadline.isoformat(),
+                "total_days": (deadline - start).days + 1,
+                "not_working_days": len(items),
+                "production_calendar": CALENDAR_ID,
+                "items": [day.isoformat() for day in items],
+            },
+        )
+
+
+@pytest.fixture
+def local_calendar(token_proxy: HuntflowTokenProxy) -> LocalProductionCalendar:
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+    return LocalProductionCalendar(ProductionCalendar(api_client), CALENDAR_ID)
+
+
+@pytest.mark.parametrize(("method", "kwargs", "expected_response"), EXPECTED_ANSWERS)
+async def test_expected_answers(
+    httpx_mock: HTTPXMock,
+    local_calendar: LocalProductionCalendar,
+    method: str,
+    kwargs: Dict[str, Any],
+    expected_response: Any,
+) -> None:
+    FakeCalendarAPI(httpx_mock)
+
+    result = await getattr(local_calendar, method)(**kwargs)
+
+    if isinstance(expected_response, str):
+        assert result == expected_response
+    else:
+        assert result == type(result).model_validate(expected_response)
+
+
+async def test_years_are_downloaded_once(
+    httpx_mock: HTTPXMock,
+    local_calendar: LocalProductionCalendar,
+) -> None:
+    api = FakeCalendarAPI(httpx_mock)
+
+    await asyncio.gather(
+        *(
+            local_calendar.get_deadline_date_with_non_working_days(days, datetime.date(2023, 1, 1))
+            for days in range(1, 300)
+        ),
+    )
+
+    assert [request.url.params["start"] for request in api.requests] == ["2023-01-01", "2024-01-01"]
+
+
+async def test_batch_methods_match_single_ones(
+    httpx_mock: HTTPXMock,
+    local_calendar: LocalProductionCalendar,
+) -> None:
+    pytest.importorskip("numpy")
+    FakeCalendarAPI(httpx_mock)
+    rng = random.Random(0)
+    first_day = datetime.date(2023, 1, 1)
+    dates = [first_day + datetime.timedelta(days=rng.randrange(730)) for _ in range(200)]
+    other_dates = [date + datetime.timedelta(days=rng.randrange(-5, 100)) for date in dates]
+    days = [rng.randrange(0, 400) for _ in dates]
+
+    non_working_days = await local_calendar.count_non_working_days_batch(dates, other_dates)
+    working_days = await local_calendar.count_working_days_batch(dates, other_dates)
+    deadlines = await local_calendar.get_deadline_dates_batch(dates, days)
+    starts = await local_calendar.get_start_dates_batch(dates, days)
+
+    for i, (date, other_date, days_count) in enumerate(zip(dates, other_dates, days)):
+        period = await local_calendar.get_non_working_days_in_period(other_date, date)
+        assert non_working_days[i] == period.not_working_days
+        assert working_days[i] == period.total_days - period.not_working_days
+        assert str(deadlines[i]) == (
+            await local_calendar.get_deadline_date_with_non_working_days(days_count, date)
+        )
+        assert str(starts[i]) == (
+            await local_calendar.get_start_date_with_non_working_days(days_count, date)
+        )
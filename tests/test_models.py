@@ -0,0 +1,42 @@
+import datetime
+import json
+from typing import Any, Dict
+
+import pytest
+
+from huntflow_api_client.models.common import FillQuota, JsonRequestModel
+from huntflow_api_client.models.request.applicants import ApplicantCreateRequest
+from huntflow_api_client.models.request.divisions import BatchDivisionsRequest
+from huntflow_api_client.models.request.file import UploadFileHeaders
+from huntflow_api_client.models.request.vacancies import VacancyCreateRequest
+from huntflow_api_client.models.request.vacancy_requests import CreateVacancyRequestRequest
+from tests.test_entities.test_account_divisions import BATCH_ACCOUNT_DIVISIONS_REQUEST
+from tests.test_entities.test_applicants import APPLICANT_CREATE_REQUEST
+from tests.test_entities.test_vacancy_request import VACANCY_REQUEST_CREATE_REQUEST
+
+REQUEST_MODELS = [
+    ApplicantCreateRequest(**APPLICANT_CREATE_REQUEST),
+    BatchDivisionsRequest.model_validate(BATCH_ACCOUNT_DIVISIONS_REQUEST),
+    CreateVacancyRequestRequest.model_validate(VACANCY_REQUEST_CREATE_REQUEST),
+    UploadFileHeaders(file_parse=True, ignore_email="user@example.com"),
+    VacancyCreateRequest(
+        position="Python developer",
+        company="Google Inc.",
+        money="$100000",
+        priority=1,
+        coworkers=[1, 2],
+        fill_quotas=[FillQuota(deadline=datetime.date(2023, 7, 1), applicants_to_hire=3)],
+    ),
+]
+
+
+@pytest.mark.parametrize("model", REQUEST_MODELS, ids=lambda model: type(model).__name__)
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"exclude_none": True}, {"exclude_none": True, "by_alias": True}],
+)
+def test_jsonable_dict_equals_decoded_json(model: JsonRequestModel, kwargs: Dict[str, Any]) -> None:
+    expected = json.loads(model.model_dump_json(**kwargs))
+
+    assert model.jsonable_dict(**kwargs) == expected
+    assert json.loads(model.json_bytes(**kwargs)) == expected
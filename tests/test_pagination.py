@@ -0,0 +1,242 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Sequence
+
+import pytest
+from pydantic import BaseModel
+
+from huntflow_api_client.errors import ApiError
+from huntflow_api_client.models.common import PaginatedResponse
+from huntflow_api_client.pagination import CursorPaginator, fetch_pages, iter_pages
+from huntflow_api_client.retry import RetryPolicy
+
+
+class PageFetcher:
+    def __init__(
+        self,
+        total_pages: int,
+        delay: float = 0.0,
+        fail_on: int = 0,
+        delays: Optional[Dict[int, float]] = None,
+    ) -> None:
+        self.total_pages = total_pages
+        self.delay = delay
+        self.delays = delays or {}
+        self.fail_on = fail_on
+        self.started: List[int] = []
+        self.finished: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, page: int) -> PaginatedResponse:
+        self.started.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(page, self.delay))
+        finally:
+            self.in_flight -= 1
+        if page == self.fail_on:
+            raise RuntimeError(f"Page {page} failed")
+        self.finished.append(page)
+        return PaginatedResponse(page=page, count=10, total_pages=self.total_pages)
+
+
+class CursorPage(BaseModel):
+    items: List[int]
+    next_page_cursor: Optional[str] = None
+
+
+class CursorPageFetcher:
+    def __init__(self, pages: Sequence[List[int]], delay: float = 0.0) -> None:
+        self.pages = pages
+        self.delay = delay
+        self.requested: List[Optional[str]] = []
+
+    async def __call__(self, cursor: Optional[str]) -> CursorPage:
+        self.requested.append(cursor)
+        await asyncio.sleep(self.delay)
+        index = 0 if cursor is None else int(cursor)
+        next_cursor = str(index + 1) if index + 1 < len(self.pages) else None
+        return CursorPage(items=self.pages[index], next_page_cursor=next_cursor)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_iter_pages__stops_on_total_pages(prefetch: bool) -> None:
+    fetch_page = PageFetcher(total_pages=3)
+
+    pages = [page.page async for page in iter_pages(fetch_page, prefetch=prefetch)]
+
+    assert pages == [1, 2, 3]
+    assert fetch_page.started == [1, 2, 3]
+
+
+async def test_iter_pages__empty_result() -> None:
+    fetch_page = PageFetcher(total_pages=0)
+
+    pages = [page.page async for page in iter_pages(fetch_page)]
+
+    assert pages == [1]
+
+
+async def test_iter_pages__start_page() -> None:
+    fetch_page = PageFetcher(total_pages=3)
+
+    pages = [page.page async for page in iter_pages(fetch_page, start_page=2)]
+
+    assert pages == [2, 3]
+
+
+async def test_iter_pages__prefetch_overlaps_processing() -> None:
+    fetch_page = PageFetcher(total_pages=2, delay=0.01)
+
+    async for page in iter_pages(fetch_page):
+        if page.page == 1:
+            # The next page is being fetched while the caller processes the current one
+            await asyncio.sleep(0.05)
+            assert fetch_page.finished == [1, 2]
+
+
+async def test_iter_pages__error_is_raised_after_previous_page() -> None:
+    fetch_page = PageFetcher(total_pages=3, fail_on=2)
+    pages = []
+
+    with pytest.raises(RuntimeError, match="Page 2 failed"):
+        async for page in iter_pages(fetch_page):
+            pages.append(page.page)
+
+    assert pages == [1]
+
+
+async def test_iter_pages__prefetch_is_cancelled_on_close() -> None:
+    fetch_page = PageFetcher(total_pages=3, delay=0.05)
+
+    pages = iter_pages(fetch_page)
+    await pages.__anext__()
+    await asyncio.sleep(0)
+    await pages.aclose()
+    await asyncio.sleep(0.1)
+
+    assert fetch_page.started == [1, 2]
+    assert fetch_page.finished == [1]
+
+
+async def test_fetch_pages__ordered() -> None:
+    fetch_page = PageFetcher(total_pages=6, delays={2: 0.03, 3: 0.01})
+
+    pages = [page.page async for page in fetch_pages(fetch_page, concurrency=3)]
+
+    assert pages == [1, 2, 3, 4, 5, 6]
+    assert fetch_page.max_in_flight == 3
+
+
+async def test_fetch_pages__as_completed() -> None:
+    fetch_page = PageFetcher(total_pages=4, delays={2: 0.05, 3: 0.01, 4: 0.03})
+
+    pages = [page.page async for page in fetch_pages(fetch_page, concurrency=3, ordered=False)]
+
+    assert pages == [1, 3, 4, 2]
+
+
+async def test_fetch_pages__single_page() -> None:
+    fetch_page = PageFetcher(total_pages=1)
+
+    pages = [page.page async for page in fetch_pages(fetch_page)]
+
+    assert pages == [1]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_fetch_pages__error_cancels_other_pages(ordered: bool) -> None:
+    fetch_page = PageFetcher(total_pages=4, fail_on=2, delays={3: 0.05, 4: 0.05})
+
+    with pytest.raises(RuntimeError, match="Page 2 failed"):
+        async for _ in fetch_pages(fetch_page, concurrency=3, ordered=ordered):
+            pass
+    await asyncio.sleep(0.1)
+
+    assert fetch_page.finished == [1]
+
+
+async def test_fetch_pages__retries_failed_page() -> None:
+    attempts: Dict[int, int] = {}
+
+    async def fetch_page(page: int) -> PaginatedResponse:
+        attempts[page] = attempts.get(page, 0) + 1
+        if page == 2 and attempts[page] == 1:
+            raise ApiError(503)
+        return PaginatedResponse(page=page, count=10, total_pages=3)
+
+    retry_policy = RetryPolicy(backoff_base=0)
+    pages = [page.page async for page in fetch_pages(fetch_page, retry_policy=retry_policy)]
+
+    assert pages == [1, 2, 3]
+    assert attempts == {1: 1, 2: 2, 3: 1}
+
+
+async def test_fetch_pages__pending_pages_are_cancelled_on_close() -> None:
+    fetch_page = PageFetcher(total_pages=4, delays={3: 0.05, 4: 0.05})
+
+    pages = fetch_pages(fetch_page, concurrency=3)
+    assert (await pages.__anext__()).page == 1
+    assert (await pages.__anext__()).page == 2
+    await pages.aclose()
+    await asyncio.sleep(0.1)
+
+    assert fetch_page.finished == [1, 2]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_cursor_paginator__follows_cursor(prefetch: bool) -> None:
+    fetch_page = CursorPageFetcher([[1, 2], [3], [4, 5]])
+
+    paginator = CursorPaginator(fetch_page, prefetch=prefetch)
+    items = [item async for item in paginator]
+
+    assert items == [1, 2, 3, 4, 5]
+    assert fetch_page.requested == [None, "1", "2"]
+    assert paginator.is_exhausted
+    assert paginator.cursor == "2"
+
+
+async def test_cursor_paginator__prefetch_overlaps_processing() -> None:
+    fetch_page = CursorPageFetcher([[1], [2]], delay=0.01)
+
+    async for item in CursorPaginator(fetch_page):
+        if item == 1:
+            await asyncio.sleep(0.05)
+            assert fetch_page.requested == [None, "1"]
+
+
+async def test_cursor_paginator__max_items_and_resume() -> None:
+    fetch_page = CursorPageFetcher([[1, 2], [3, 4], [5]])
+
+    paginator = CursorPaginator(fetch_page, max_items=3)
+    items = [item async for item in paginator]
+    assert items == [1, 2, 3]
+    assert not paginator.is_exhausted
+    assert paginator.cursor == "1"
+
+    resumed = CursorPaginator(fetch_page, cursor=paginator.cursor)
+    assert [item async for item in resumed] == [3, 4, 5]
+
+
+async def test_cursor_paginator__cursor_moves_after_whole_page() -> None:
+    fetch_page = CursorPageFetcher([[1, 2], [3, 4]])
+
+    paginator = CursorPaginator(fetch_page, max_items=2)
+    assert [item async for item in paginator] == [1, 2]
+    assert paginator.cursor == "1"
+
+
+async def test_cursor_paginator__time_budget() -> None:
+    fetch_page = CursorPageFetcher([[1], [2], [3]], delay=0.05)
+
+    started_at = time.monotonic()
+    paginator = CursorPaginator(fetch_page, time_budget=0.12)
+    items = [item async for item in paginator]
+
+    assert items == [1, 2]
+    assert time.monotonic() - started_at < 0.2
+    assert not paginator.is_exhausted
+    assert paginator.cursor == "2"
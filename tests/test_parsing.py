@@ -0,0 +1,117 @@
+from typing import Any
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.entities.applicant_reponse import ApplicantResponse
+from huntflow_api_client.entities.applicants import Applicant
+from huntflow_api_client.models.response.applicants import ApplicantItem, ApplicantListResponse
+from huntflow_api_client.parsing import ResponseMode, parse_response, use_response_mode
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from tests.api import BASE_URL, VERSIONED_BASE_URL
+from tests.test_entities.test_applicant_response import (
+    APPLICANT_ID,
+    APPLICANT_RESPONSE_LIST_RESPONSE,
+)
+from tests.test_entities.test_applicants import ACCOUNT_ID, APPLICANT_LIST_RESPONSE
+
+
+def test_parse_response__modes() -> None:
+    response = httpx.Response(200, json=APPLICANT_LIST_RESPONSE)
+
+    validated = parse_response(ApplicantListResponse, response)
+    assert validated == ApplicantListResponse.model_validate(APPLICANT_LIST_RESPONSE)
+
+    assert parse_response(ApplicantListResponse, response, ResponseMode.RAW) == (
+        APPLICANT_LIST_RESPONSE
+    )
+
+
+def test_use_response_mode__overrides_default() -> None:
+    response = httpx.Response(200, json=APPLICANT_LIST_RESPONSE)
+
+    with use_response_mode(ResponseMode.RAW):
+        assert parse_response(ApplicantListResponse, response) == APPLICANT_LIST_RESPONSE
+        with use_response_mode(ResponseMode.VALIDATE):
+            result = parse_response(ApplicantListResponse, response, ResponseMode.RAW)
+            assert isinstance(result, ApplicantListResponse)
+    assert isinstance(parse_response(ApplicantListResponse, response), ApplicantListResponse)
+
+
+async def test_entity_uses_client_response_mode(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_response(
+        url=f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/applicants?count=30&page=1",
+        json=APPLICANT_LIST_RESPONSE,
+    )
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy, response_mode=ResponseMode.RAW)
+    applicants = Applicant(api_client)
+
+    assert await applicants.list(ACCOUNT_ID) == APPLICANT_LIST_RESPONSE
+    with use_response_mode(ResponseMode.VALIDATE):
+        response = await applicants.list(ACCOUNT_ID)
+    assert response == ApplicantListResponse.model_validate(APPLICANT_LIST_RESPONSE)
+
+
+async def test_iter_list_in_raw_mode(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    items = APPLICANT_LIST_RESPONSE["items"]
+    for page, item in enumerate(items, start=1):
+        httpx_mock.add_response(
+            url=f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/applicants?count=1&page={page}",
+            json={**APPLICANT_LIST_RESPONSE, "page": page, "total_pages": 2, "items": [item]},
+        )
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy, response_mode=ResponseMode.RAW)
+    applicants = Applicant(api_client)
+
+    assert [item async for item in applicants.iter_list(ACCOUNT_ID, count=1)] == items
+    with use_response_mode(ResponseMode.VALIDATE):
+        validated = [item async for item in applicants.iter_list(ACCOUNT_ID, count=1)]
+    assert validated == [ApplicantItem.model_validate(item) for item in items]
+
+
+async def test_iter_list_in_raw_mode__pages_are_not_validated(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    httpx_mock.add_response(
+        url=f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/applicants?count=30&page=1",
+        json=APPLICANT_LIST_RESPONSE,
+    )
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("RAW pages must not be validated")
+
+    monkeypatch.setattr(ApplicantListResponse, "model_validate", fail)
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy, response_mode=ResponseMode.RAW)
+
+    items = [item async for item in Applicant(api_client).iter_list(ACCOUNT_ID)]
+
+    assert items == APPLICANT_LIST_RESPONSE["items"]
+
+
+async def test_cursor_paginator_in_raw_mode(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    url = f"{VERSIONED_BASE_URL}/accounts/{ACCOUNT_ID}/applicants/{APPLICANT_ID}/responses"
+    httpx_mock.add_response(url=f"{url}?count=30", json=APPLICANT_RESPONSE_LIST_RESPONSE)
+    httpx_mock.add_response(
+        url=f"{url}?count=30&next_page_cursor=string",
+        json={**APPLICANT_RESPONSE_LIST_RESPONSE, "next_page_cursor": None},
+    )
+    api_client = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+    responses = ApplicantResponse(api_client).iter_list(ACCOUNT_ID, APPLICANT_ID)
+
+    with use_response_mode(ResponseMode.RAW):
+        items = [item async for item in responses]
+
+    assert items == APPLICANT_RESPONSE_LIST_RESPONSE["items"] * 2
+    assert responses.is_exhausted
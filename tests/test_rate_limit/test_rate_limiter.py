@@ -0,0 +1,154 @@
+import time
+from datetime import datetime, timezone
+from email.utils import formatdate
+from pathlib import Path
+
+import httpx
+import pytest
+from freezegun import freeze_time
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.errors import TooManyRequestsError
+from huntflow_api_client.rate_limit import (
+    AbstractRateLimitBackend,
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+)
+from huntflow_api_client.rate_limit.limiter import get_blocked_until, get_token_key
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from tests.api import BASE_URL, VERSIONED_BASE_URL
+
+NOW = 1_700_000_000.0
+FROZEN_TIME = datetime.fromtimestamp(NOW, timezone.utc)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> AbstractRateLimitBackend:
+    if request.param == "memory":
+        return InMemoryRateLimitBackend()
+    return SQLiteRateLimitBackend(str(tmp_path / "rate_limits.sqlite"))
+
+
+@freeze_time(FROZEN_TIME)
+async def test_backend_reserve_burst_then_pace(backend: AbstractRateLimitBackend) -> None:
+    delays = [await backend.reserve("token", 0.5, 3) for _ in range(5)]
+
+    assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+
+@freeze_time(FROZEN_TIME)
+async def test_backend_buckets_are_separated_by_key(backend: AbstractRateLimitBackend) -> None:
+    assert await backend.reserve("first", 1.0, 1) == 0.0
+    assert await backend.reserve("second", 1.0, 1) == 0.0
+    assert await backend.reserve("first", 1.0, 1) == 1.0
+
+
+@freeze_time(FROZEN_TIME)
+async def test_backend_block(backend: AbstractRateLimitBackend) -> None:
+    await backend.block("token", NOW + 10, 0.5, 3)
+
+    assert await backend.reserve("token", 0.5, 3) == 10.0
+    assert await backend.reserve("token", 0.5, 3) == 10.5
+
+
+@freeze_time(FROZEN_TIME)
+async def test_sqlite_backend_is_shared_between_instances(tmp_path: Path) -> None:
+    filename = str(tmp_path / "rate_limits.sqlite")
+    first, second = SQLiteRateLimitBackend(filename), SQLiteRateLimitBackend(filename)
+
+    assert await first.reserve("token", 1.0, 1) == 0.0
+    assert await second.reserve("token", 1.0, 1) == 1.0
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "7"}, NOW + 7),
+        ({"Retry-After": formatdate(NOW + 30, usegmt=True)}, NOW + 30),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}, NOW + 12),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(NOW + 60)}, NOW + 60),
+        ({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "12"}, None),
+        ({"RateLimit-Remaining": "0", "RateLimit-Reset": "3"}, NOW + 3),
+        ({"Retry-After": "inf"}, None),
+        ({"Retry-After": "nan"}, None),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "inf"}, None),
+    ],
+)
+def test_get_blocked_until(headers: dict, expected: float) -> None:
+    response = httpx.Response(200, headers=headers)
+    assert get_blocked_until(response, NOW) == expected
+
+
+def test_rate_limiter_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+    with pytest.raises(ValueError):
+        RateLimiter(1, burst=0)
+
+
+@freeze_time(FROZEN_TIME)
+async def test_rate_limiter_buckets_are_separated_by_token(
+    backend: AbstractRateLimitBackend,
+) -> None:
+    limiter = RateLimiter(requests_per_second=1, backend=backend)
+    first, second = {"Authorization": "Bearer first"}, {"Authorization": "Bearer second"}
+    await limiter.acquire(first)
+    await limiter.acquire(second)
+
+    response = httpx.Response(429, headers={"Retry-After": "30"})
+    response.request = httpx.Request("GET", BASE_URL, headers=first)
+    await limiter.observe_response(response)
+
+    assert await backend.reserve(get_token_key(first), 1.0, 1) == 30.0
+    assert await backend.reserve(get_token_key(second), 1.0, 1) == 1.0
+
+
+def test_get_token_key() -> None:
+    first = get_token_key({"Authorization": "Bearer first"})
+
+    assert first == get_token_key({"Authorization": "Bearer first"})
+    assert first != get_token_key({"Authorization": "Bearer second"})
+    assert "first" not in first
+    assert get_token_key({}) == "default"
+
+
+async def test_rate_limiter_paces_requests(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    for _ in range(4):
+        httpx_mock.add_response(url=f"{VERSIONED_BASE_URL}/me")
+    limiter = RateLimiter(requests_per_second=20, burst=2)
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy, rate_limiter=limiter)
+
+    start = time.monotonic()
+    for _ in range(4):
+        await api.request("GET", "/me")
+
+    # 2 requests go immediately (burst), the rest are sent with 50ms interval
+    assert time.monotonic() - start >= 0.1
+
+
+async def test_rate_limiter_honours_retry_after(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_response(
+        url=f"{VERSIONED_BASE_URL}/me",
+        status_code=429,
+        headers={"Retry-After": "0.2"},
+    )
+    httpx_mock.add_response(url=f"{VERSIONED_BASE_URL}/me")
+    limiter = RateLimiter(requests_per_second=100, burst=10)
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy, rate_limiter=limiter)
+
+    with pytest.raises(TooManyRequestsError):
+        await api.request("GET", "/me")
+    start = time.monotonic()
+    response = await api.request("GET", "/me")
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.19
@@ -0,0 +1,143 @@
+from typing import List
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.errors import ApiError, NotFoundError, TooManyRequestsError
+from huntflow_api_client.retry import RetryAttempt, RetryBudget, RetryPolicy
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from tests.api import BASE_URL, VERSIONED_BASE_URL
+
+URL = f"{VERSIONED_BASE_URL}/me"
+
+
+def make_api(token_proxy: HuntflowTokenProxy, **policy_kwargs: object) -> HuntflowAPI:
+    policy_kwargs.setdefault("backoff_base", 0.001)
+    policy = RetryPolicy(**policy_kwargs)  # type: ignore[arg-type]
+    return HuntflowAPI(BASE_URL, token_proxy=token_proxy, retry_policy=policy)
+
+
+async def test_retry_on_server_error(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_response(url=URL, status_code=502)
+    httpx_mock.add_response(url=URL, status_code=503)
+    httpx_mock.add_response(url=URL, json={})
+    attempts: List[RetryAttempt] = []
+    api = make_api(token_proxy, hooks=[attempts.append])
+
+    response = await api.request("GET", "/me")
+
+    assert response.status_code == 200
+    assert len(httpx_mock.get_requests()) == 3
+    assert [(a.attempt, a.will_retry) for a in attempts] == [(1, True), (2, True)]
+    assert [a.error.code for a in attempts] == [502, 503]  # type: ignore[attr-defined]
+
+
+async def test_retry_on_transport_error(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_exception(httpx.ReadTimeout("timeout"), url=URL)
+    httpx_mock.add_response(url=URL, json={})
+    api = make_api(token_proxy)
+
+    response = await api.request("GET", "/me")
+
+    assert response.status_code == 200
+
+
+async def test_max_attempts(httpx_mock: HTTPXMock, token_proxy: HuntflowTokenProxy) -> None:
+    for _ in range(2):
+        httpx_mock.add_response(url=URL, status_code=500)
+    attempts: List[RetryAttempt] = []
+    api = make_api(token_proxy, max_attempts=2, hooks=[attempts.append])
+
+    with pytest.raises(ApiError):
+        await api.request("GET", "/me")
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert [a.will_retry for a in attempts] == [True, False]
+
+
+async def test_client_errors_are_not_retried(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_response(url=URL, status_code=404)
+    api = make_api(token_proxy)
+
+    with pytest.raises(NotFoundError):
+        await api.request("GET", "/me")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_post_is_not_retried_by_default(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_response(url=URL, status_code=502)
+    api = make_api(token_proxy)
+
+    with pytest.raises(ApiError):
+        await api.request("POST", "/me")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_post_retry_opt_in(httpx_mock: HTTPXMock, token_proxy: HuntflowTokenProxy) -> None:
+    httpx_mock.add_response(url=URL, status_code=502)
+    httpx_mock.add_response(url=URL, json={})
+    api = make_api(token_proxy, methods={"GET", "POST"})
+
+    response = await api.request("POST", "/me")
+
+    assert response.status_code == 200
+
+
+async def test_post_is_retried_if_not_sent(
+    httpx_mock: HTTPXMock,
+    token_proxy: HuntflowTokenProxy,
+) -> None:
+    httpx_mock.add_exception(httpx.ConnectError("refused"), url=URL)
+    httpx_mock.add_response(url=URL, json={})
+    api = make_api(token_proxy)
+
+    response = await api.request("POST", "/me")
+
+    assert response.status_code == 200
+
+
+async def test_deadline(httpx_mock: HTTPXMock, token_proxy: HuntflowTokenProxy) -> None:
+    httpx_mock.add_response(url=URL, status_code=429, headers={"Retry-After": "10"})
+    api = make_api(token_proxy, deadline=1)
+
+    with pytest.raises(TooManyRequestsError):
+        await api.request("GET", "/me")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+async def test_budget_exhausted(httpx_mock: HTTPXMock, token_proxy: HuntflowTokenProxy) -> None:
+    httpx_mock.add_response(url=URL, status_code=502)
+    httpx_mock.add_response(url=URL, status_code=502)
+    budget = RetryBudget(ratio=0, min_retries_per_second=0.1)
+    api = make_api(token_proxy, budget=budget)
+
+    # The budget allows exactly one retry within the window
+    with pytest.raises(ApiError):
+        await api.request("GET", "/me")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_delay_uses_full_jitter_and_retry_after() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+    for attempt, upper_bound in ((1, 1), (2, 2), (3, 4), (10, 4)):
+        assert 0 <= policy.get_delay(attempt, ApiError(500)) <= upper_bound
+    assert policy.get_delay(1, TooManyRequestsError(retry_after=7)) == 7
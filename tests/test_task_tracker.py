@@ -0,0 +1,236 @@
+import asyncio
+import datetime
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Type
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.errors import NotFoundError
+from huntflow_api_client.models.consts import TaskState, UserControlTaskStatus
+from huntflow_api_client.models.response.delayed_tasks import DelayedTaskResponse
+from huntflow_api_client.models.response.users_management import UserControlTaskResponse
+from huntflow_api_client.parsing import ModelT, ResponseMode, use_response_mode
+from huntflow_api_client.rate_limit import RateLimiter
+from huntflow_api_client.task_tracker import DelayedTaskTracker, TaskFailedError, TaskProgress
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import BASE_URL
+
+ACCOUNT_ID = 1
+
+
+def state_log(state: str, timestamp: float, comment: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "state": state,
+        "timestamp": timestamp,
+        "datetime": datetime.datetime.fromtimestamp(timestamp).isoformat(),
+        "comment": comment,
+    }
+
+
+class FakeTasksAPI:
+    """A task reaches `final_state` after `polls_to_finish` polls"""
+
+    def __init__(
+        self,
+        httpx_mock: HTTPXMock,
+        polls_to_finish: int = 2,
+        final_state: str = TaskState.success,
+        errors: Optional[List[int]] = None,
+    ) -> None:
+        self.polls_to_finish = polls_to_finish
+        self.final_state = final_state
+        self.errors = errors or []
+        self.polls: Dict[str, int] = {}
+        self.created = time.time()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        httpx_mock.add_callback(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+        if self.errors:
+            return httpx.Response(self.errors.pop(0), json={"errors": []})
+        task_id = request.url.path.rsplit("/", 1)[1]
+        self.polls[task_id] = self.polls.get(task_id, 0) + 1
+        done = self.polls[task_id] >= self.polls_to_finish
+        if "/users/foreign/task/" in request.url.path:
+            return httpx.Response(200, json=self.user_control_task(task_id, done))
+        return httpx.Response(200, json=self.delayed_task(task_id, done))
+
+    def delayed_task(self, task_id: str, done: bool) -> Dict[str, Any]:
+        states_log = [state_log(TaskState.enqueued, self.created)]
+        if done:
+            states_log.append(state_log(self.final_state, self.created + 0.5, "Task comment"))
+        return {
+            "task_id": task_id,
+            "state": states_log[-1]["state"],
+            "created": self.created,
+            "updated": states_log[-1]["timestamp"],
+            "created_datetime": states_log[0]["datetime"],
+            "updated_datetime": states_log[-1]["datetime"],
+            "states_log": states_log,
+        }
+
+    def user_control_task(self, task_id: str, done: bool) -> Dict[str, Any]:
+        created = datetime.datetime.fromtimestamp(self.created, datetime.timezone.utc)
+        return {
+            "id": task_id,
+            "account_id": ACCOUNT_ID,
+            "action": "CREATE",
+            "status": UserControlTaskStatus.SUCCESS if done else UserControlTaskStatus.PENDING,
+            "data": {},
+            "comment": None,
+            "created": created.isoformat(),
+            "completed": (created + datetime.timedelta(seconds=2)).isoformat() if done else None,
+        }
+
+
+def make_tracker(
+    response_mode: ResponseMode = ResponseMode.VALIDATE,
+    **kwargs: Any,
+) -> DelayedTaskTracker:
+    api = HuntflowAPI(BASE_URL, token=ApiToken(access_token="token"), response_mode=response_mode)
+    kwargs.setdefault("min_interval", 0.001)
+    kwargs.setdefault("max_interval", 0.01)
+    kwargs.setdefault("rate_limiter", RateLimiter(requests_per_second=10000, burst=100))
+    return DelayedTaskTracker(api, ACCOUNT_ID, **kwargs)
+
+
+def as_model(task: Any, model: Type[ModelT]) -> ModelT:
+    assert isinstance(task, model)
+    return task
+
+
+async def test_many_tasks_are_polled_by_one_poller(httpx_mock: HTTPXMock) -> None:
+    api = FakeTasksAPI(httpx_mock, polls_to_finish=3)
+    tracker = make_tracker(concurrency=5)
+    task_ids = [uuid.uuid4() for _ in range(200)]
+
+    responses = await asyncio.gather(*(tracker.track(task_id) for task_id in task_ids))
+    tasks = [as_model(task, DelayedTaskResponse) for task in responses]
+
+    assert [task.task_id for task in tasks] == task_ids
+    assert all(task.state == TaskState.success for task in tasks)
+    assert set(api.polls.values()) == {3}
+    assert api.max_in_flight <= 5
+    assert tracker.metrics.pending == 0
+    assert tracker.metrics.polls == 600
+    assert tracker.metrics.estimated_duration == pytest.approx(0.5)
+
+
+async def test_same_task_is_tracked_once(httpx_mock: HTTPXMock) -> None:
+    api = FakeTasksAPI(httpx_mock)
+    tracker = make_tracker()
+    task_id = str(uuid.uuid4())
+
+    assert tracker.track(task_id) is tracker.track(task_id)
+    await tracker.wait(task_id)
+
+    assert api.polls == {task_id: 2}
+
+
+async def test_failed_task(httpx_mock: HTTPXMock) -> None:
+    FakeTasksAPI(httpx_mock, final_state=TaskState.failed)
+    tracker = make_tracker()
+    task_id = str(uuid.uuid4())
+
+    with pytest.raises(TaskFailedError) as error:
+        await tracker.wait(task_id)
+
+    assert error.value.task_id == task_id
+    assert error.value.comment == "Task comment"
+
+
+async def test_user_control_task(httpx_mock: HTTPXMock) -> None:
+    FakeTasksAPI(httpx_mock)
+    tracker = make_tracker()
+    task_id = uuid.uuid4()
+
+    task = as_model(await tracker.track_user_control_task(task_id), UserControlTaskResponse)
+
+    assert task.id == task_id
+    assert task.status == UserControlTaskStatus.SUCCESS
+    assert tracker.metrics.estimated_duration == pytest.approx(2)
+
+
+async def test_overload_errors_are_retried(httpx_mock: HTTPXMock) -> None:
+    api = FakeTasksAPI(httpx_mock, errors=[503, 429])
+    tracker = make_tracker()
+    task_id = str(uuid.uuid4())
+
+    task = as_model(await tracker.wait(task_id), DelayedTaskResponse)
+
+    assert task.state == TaskState.success
+    assert tracker.metrics.polls == 4
+    assert api.polls == {task_id: 2}
+
+
+async def test_other_errors_fail_the_task(httpx_mock: HTTPXMock) -> None:
+    FakeTasksAPI(httpx_mock, errors=[404])
+    tracker = make_tracker()
+
+    with pytest.raises(NotFoundError):
+        await tracker.wait(str(uuid.uuid4()))
+
+
+async def test_progress_errors_fail_the_task(
+    httpx_mock: HTTPXMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def get_progress(task: DelayedTaskResponse) -> TaskProgress:
+        raise ValueError("Unexpected task")
+
+    monkeypatch.setattr("huntflow_api_client.task_tracker.delayed_task_progress", get_progress)
+    FakeTasksAPI(httpx_mock)
+    tracker = make_tracker()
+
+    with pytest.raises(ValueError, match="Unexpected task"):
+        await tracker.wait(str(uuid.uuid4()), timeout=1)
+    assert tracker.metrics.pending == 0
+
+
+async def test_raw_response_mode(httpx_mock: HTTPXMock) -> None:
+    api = FakeTasksAPI(httpx_mock)
+    tracker = make_tracker(response_mode=ResponseMode.RAW)
+    task_id = uuid.uuid4()
+
+    task = await tracker.wait(task_id, timeout=1)
+
+    assert task == api.delayed_task(str(task_id), done=True)
+    with use_response_mode(ResponseMode.VALIDATE):
+        validated = await tracker.wait(uuid.uuid4(), timeout=1)
+    assert isinstance(validated, DelayedTaskResponse)
+
+
+def test_tracker_created_outside_event_loop(httpx_mock: HTTPXMock) -> None:
+    FakeTasksAPI(httpx_mock)
+    tracker = make_tracker()
+
+    task = asyncio.run(tracker.wait(uuid.uuid4(), timeout=1))
+
+    assert as_model(task, DelayedTaskResponse).state == TaskState.success
+
+
+async def test_wait_timeout_and_close(httpx_mock: HTTPXMock) -> None:
+    FakeTasksAPI(httpx_mock, polls_to_finish=1000)
+    tracker = make_tracker()
+    task_id = str(uuid.uuid4())
+
+    with pytest.raises(asyncio.TimeoutError):
+        await tracker.wait(task_id, timeout=0.05)
+    future = tracker.track(task_id)
+    assert not future.done()
+
+    await tracker.close()
+
+    assert future.cancelled()
+    assert tracker.metrics.pending == 0
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 
 import pytest
 import respx
@@ -13,6 +14,7 @@ from huntflow_api_client.errors.errors import (
 from huntflow_api_client.tokens.locker import AsyncioLockLocker
 from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
 from huntflow_api_client.tokens.storage import HuntflowTokenFileStorage
+from huntflow_api_client.tokens.token import ApiToken
 from tests.api import BASE_URL, FakeAPIServer, TokenPair
 
 
@@ -190,3 +192,134 @@ async def test_auto_refresh_tokens_several_api_several_proxies__ok(
     assert all(response.status_code == 200 for response in responses)
     assert respx.routes["/token/refresh"].call_count == 1
     assert fake_server.is_expired_token is False
+
+
+@respx.mock
+async def test_auto_refresh_tokens_with_cached_token__ok(
+    fake_server: FakeAPIServer,
+    token_storage: HuntflowTokenFileStorage,
+) -> None:
+    token_proxy = HuntflowTokenProxy(token_storage, AsyncioLockLocker(), cache_ttl=60)
+    api_count = 10
+    apis = [
+        HuntflowAPI(BASE_URL, token_proxy=token_proxy, auto_refresh_tokens=True)
+        for _ in range(api_count)
+    ]
+    await apis[0].request("GET", "/me")
+    fake_server.expire_token()
+
+    responses = await asyncio.gather(*(api.request("GET", "/me") for api in apis))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert respx.routes["/token/refresh"].call_count == 1
+    assert fake_server.is_expired_token is False
+
+
+def write_token_file(token_filename: str, token_pair: TokenPair, expires_in: float) -> None:
+    token_data = {
+        "access_token": token_pair.access_token,
+        "refresh_token": token_pair.refresh_token,
+        "expiration_timestamp": time.time() + expires_in,
+    }
+    with open(token_filename, "w") as fout:
+        json.dump(token_data, fout)
+
+
+@respx.mock
+async def test_background_token_refresh_before_expiration__ok(
+    fake_server: FakeAPIServer,
+    token_filename: str,
+    token_pair: TokenPair,
+) -> None:
+    write_token_file(token_filename, token_pair, expires_in=30)
+    token_proxy = HuntflowTokenProxy(HuntflowTokenFileStorage(token_filename), AsyncioLockLocker())
+    # The server allows to refresh the token, the client must do it in advance
+    fake_server.expire_token()
+
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy, token_refresh_margin=60) as api:
+        for _ in range(100):
+            if respx.routes["/token/refresh"].called:
+                break
+            await asyncio.sleep(0.01)
+        response = await api.request("GET", "/me")
+
+    assert response.status_code == 200
+    assert respx.routes["/me"].call_count == 1
+    assert respx.routes["/token/refresh"].call_count == 1
+    with open(token_filename) as fin:
+        assert json.load(fin)["access_token"] == fake_server.token_pair.access_token
+
+
+@respx.mock
+async def test_background_token_refresh_waits_for_margin__ok(
+    fake_server: FakeAPIServer,
+    token_filename: str,
+    token_pair: TokenPair,
+) -> None:
+    write_token_file(token_filename, token_pair, expires_in=3600)
+    token_proxy = HuntflowTokenProxy(HuntflowTokenFileStorage(token_filename), AsyncioLockLocker())
+
+    async with HuntflowAPI(BASE_URL, token_proxy=token_proxy, token_refresh_margin=60) as api:
+        await api.request("GET", "/me")
+        await asyncio.sleep(0.05)
+
+    assert respx.routes["/token/refresh"].call_count == 0
+
+
+@respx.mock
+async def test_background_token_refresh_skips_refreshed_token__ok(
+    fake_server: FakeAPIServer,
+    token_pair: TokenPair,
+) -> None:
+    token = ApiToken(
+        access_token=token_pair.access_token,
+        refresh_token=token_pair.refresh_token,
+        expiration_timestamp=time.time() + 3600,
+    )
+    api = HuntflowAPI(BASE_URL, token=token)
+
+    await api._run_proactive_token_refresh(margin=60)
+
+    assert respx.routes["/token/refresh"].call_count == 0
+
+
+@respx.mock
+async def test_background_token_refresh_reloads_cached_token__ok(
+    fake_server: FakeAPIServer,
+    token_filename: str,
+    token_pair: TokenPair,
+) -> None:
+    write_token_file(token_filename, token_pair, expires_in=10)
+    token_proxy = HuntflowTokenProxy(HuntflowTokenFileStorage(token_filename), cache_ttl=3600)
+    await token_proxy.get_auth_header()
+    # Another client has refreshed the token, but the proxy keeps the old one in memory
+    new_token_pair = TokenPair()
+    write_token_file(token_filename, new_token_pair, expires_in=3600)
+    api = HuntflowAPI(BASE_URL, token_proxy=token_proxy)
+
+    await api._run_proactive_token_refresh(margin=60)
+
+    assert respx.routes["/token/refresh"].call_count == 0
+    assert await token_proxy.get_auth_header() == {
+        "Authorization": f"Bearer {new_token_pair.access_token}",
+    }
+
+
+@respx.mock
+async def test_auto_refresh_tokens_with_cache__ok(
+    fake_server: FakeAPIServer,
+    token_storage: HuntflowTokenFileStorage,
+) -> None:
+    token_proxy = HuntflowTokenProxy(token_storage, AsyncioLockLocker(), cache_ttl=60)
+    huntflow_api = HuntflowAPI(
+        BASE_URL,
+        token_proxy=token_proxy,
+        auto_refresh_tokens=True,
+    )
+
+    for _ in range(2):
+        fake_server.expire_token()
+        response = await huntflow_api.request("GET", "/me")
+        assert response.status_code == 200
+
+    assert respx.routes["/token/refresh"].call_count == 2
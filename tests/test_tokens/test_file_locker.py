@@ -0,0 +1,157 @@
+import asyncio
+import fcntl
+import json
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import List
+
+import respx
+
+from huntflow_api_client import HuntflowAPI
+from huntflow_api_client.tokens.locker import FileLocker
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from huntflow_api_client.tokens.storage import HuntflowTokenFileStorage
+from tests.api import BASE_URL, SharedStateFakeAPIServer, TokenPair, new_token_storage
+
+WORKER_COUNT = 8
+REQUESTS_PER_WORKER = 5
+
+
+async def test_acquire_release(tmp_path: Path) -> None:
+    lock_filename = str(tmp_path / "token.lock")
+    first, second = FileLocker(lock_filename), FileLocker(lock_filename)
+
+    assert await first.acquire()
+    assert not await first.acquire()
+    assert not await second.acquire()
+
+    await first.release()
+    assert await second.acquire()
+    await second.release()
+    await second.release()
+
+
+async def test_wait_for_lock(tmp_path: Path) -> None:
+    lock_filename = str(tmp_path / "token.lock")
+    holder, waiter = FileLocker(lock_filename), FileLocker(lock_filename, poll_interval=0.01)
+
+    await asyncio.wait_for(waiter.wait_for_lock(), timeout=1)
+
+    assert await holder.acquire()
+    wait_task = asyncio.create_task(waiter.wait_for_lock())
+    await asyncio.sleep(0.05)
+    assert not wait_task.done()
+
+    await holder.release()
+    await asyncio.wait_for(wait_task, timeout=1)
+
+
+async def test_stale_lock_recovery(tmp_path: Path) -> None:
+    lock_filename = str(tmp_path / "token.lock")
+    holder = FileLocker(lock_filename)
+    other = FileLocker(lock_filename, poll_interval=0.01, stale_timeout=10)
+    assert await holder.acquire()
+
+    assert not await other.acquire()
+
+    # Pretend that the holder hangs for a long time
+    with open(lock_filename, "w") as fout:
+        json.dump({"pid": 1, "acquired_at": time.time() - 60}, fout)
+    await asyncio.wait_for(other.wait_for_lock(), timeout=1)
+    assert await other.acquire()
+
+    # Release of the broken lock doesn't affect the new holder
+    await holder.release()
+    assert not await FileLocker(lock_filename).acquire()
+    await other.release()
+
+
+async def test_stale_lock_is_not_removed_while_acquiring(tmp_path: Path) -> None:
+    lock_filename = str(tmp_path / "token.lock")
+    holder = FileLocker(lock_filename)
+    other = FileLocker(lock_filename, stale_timeout=10)
+    assert await holder.acquire()
+    with open(lock_filename, "w") as fout:
+        json.dump({"pid": 1, "acquired_at": time.time() - 60}, fout)
+    inode = os.stat(lock_filename).st_ino
+
+    # Another process is acquiring the lock and writing its record
+    with open(lock_filename + ".guard", "w") as guard:
+        fcntl.flock(guard, fcntl.LOCK_SH)
+        assert not await other.acquire()
+    assert os.stat(lock_filename).st_ino == inode
+
+    assert await other.acquire()
+    assert os.stat(lock_filename).st_ino != inode
+    await other.release()
+    await holder.release()
+
+
+async def test_released_stale_lock_is_not_removed(tmp_path: Path) -> None:
+    lock_filename = str(tmp_path / "token.lock")
+    holder = FileLocker(lock_filename)
+    assert await holder.acquire()
+    with open(lock_filename, "w") as fout:
+        json.dump({"pid": 1, "acquired_at": time.time() - 60}, fout)
+    await holder.release()
+    inode = os.stat(lock_filename).st_ino
+
+    # The holder has released the lock after the recovery had found its old record
+    assert FileLocker(lock_filename, stale_timeout=10)._break_stale_lock()
+
+    assert os.stat(lock_filename).st_ino == inode
+
+
+def run_worker(
+    token_filename: str,
+    lock_filename: str,
+    state_filename: str,
+    start: "multiprocessing.synchronize.Event",
+) -> None:
+    async def main() -> None:
+        locker = FileLocker(lock_filename)
+        storage = HuntflowTokenFileStorage(token_filename)
+        token_proxy = HuntflowTokenProxy(storage, locker)
+        async with HuntflowAPI(BASE_URL, token_proxy=token_proxy, auto_refresh_tokens=True) as api:
+            start.wait()
+            for _ in range(REQUESTS_PER_WORKER):
+                await api.request("GET", "/me")
+
+    with respx.mock:
+        SharedStateFakeAPIServer(state_filename)
+        asyncio.run(main())
+
+
+def run_workers(tmp_path: Path) -> List[int]:
+    token_pair = TokenPair()
+    token_filename = str(tmp_path / "token.json")
+    new_token_storage(token_filename, token_pair)
+    server = SharedStateFakeAPIServer.create(str(tmp_path / "server.json"), token_pair)
+    server.expire_token()
+
+    context = multiprocessing.get_context("spawn")
+    start = context.Event()
+    args = (token_filename, str(tmp_path / "token.lock"), server.state_filename)
+    processes = [
+        context.Process(target=run_worker, args=(*args, start)) for _ in range(WORKER_COUNT)
+    ]
+    for process in processes:
+        process.start()
+    # Give the workers time to start up, then let them send requests at the same moment
+    time.sleep(0.5)
+    start.set()
+    for process in processes:
+        process.join(timeout=60)
+
+    server = SharedStateFakeAPIServer(server.state_filename)
+    assert not server.is_expired_token
+    return [server.refresh_count] + [process.exitcode or 0 for process in processes]
+
+
+def test_multiprocess_refresh_with_file_locker(tmp_path: Path) -> None:
+    refresh_count, *exit_codes = run_workers(tmp_path)
+
+    assert refresh_count == 1
+    assert exit_codes == [0] * WORKER_COUNT
@@ -1,12 +1,14 @@
 import json
 from datetime import datetime, timedelta
+from typing import Hashable, Optional, Tuple
 
 from freezegun import freeze_time
 
 from huntflow_api_client.tokens.locker import AsyncioLockLocker
 from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
 from huntflow_api_client.tokens.storage import HuntflowTokenFileStorage
-from tests.api import TokenPair, get_token_refresh_data
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import TokenPair, get_token_refresh_data, new_token_storage
 
 
 async def test_get_auth_header__ok(
@@ -52,3 +54,93 @@ async def test_update_token__ok(
             "expiration_timestamp": tomorrow_ts + refresh_token_data["expires_in"],
             "last_refresh_timestamp": tomorrow_ts,
         }
+
+
+class CountingFileStorage(HuntflowTokenFileStorage):
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename)
+        self.get_count = 0
+
+    async def get_with_version(self) -> Tuple[ApiToken, Optional[Hashable]]:
+        self.get_count += 1
+        return await super().get_with_version()
+
+
+async def test_cached_token_is_not_read_within_ttl(
+    token_storage: HuntflowTokenFileStorage,
+    token_filename: str,
+    token_pair: TokenPair,
+) -> None:
+    storage = CountingFileStorage(token_filename)
+    token_proxy = HuntflowTokenProxy(storage, AsyncioLockLocker(), cache_ttl=60)
+
+    with freeze_time(datetime.now()) as frozen_time:
+        for _ in range(10):
+            auth_header = await token_proxy.get_auth_header()
+        assert auth_header == {"Authorization": f"Bearer {token_pair.access_token}"}
+        assert storage.get_count == 1
+
+        # The window has expired, but the file has not changed
+        frozen_time.tick(61)
+        await token_proxy.get_auth_header()
+        assert storage.get_count == 1
+
+
+async def test_cached_token_is_reread_after_storage_change(
+    token_storage: HuntflowTokenFileStorage,
+    token_filename: str,
+) -> None:
+    storage = CountingFileStorage(token_filename)
+    token_proxy = HuntflowTokenProxy(storage, AsyncioLockLocker(), cache_ttl=60)
+    new_token_pair = TokenPair()
+
+    with freeze_time(datetime.now()) as frozen_time:
+        await token_proxy.get_auth_header()
+        new_token_storage(token_filename, new_token_pair)
+
+        # The change is not visible within the window
+        auth_header = await token_proxy.get_auth_header()
+        assert auth_header["Authorization"] != f"Bearer {new_token_pair.access_token}"
+
+        frozen_time.tick(61)
+        auth_header = await token_proxy.get_auth_header()
+        assert auth_header == {"Authorization": f"Bearer {new_token_pair.access_token}"}
+        assert storage.get_count == 2
+
+
+async def test_cache_is_invalidated_when_token_is_updated_by_another_proxy(
+    token_storage: HuntflowTokenFileStorage,
+    token_filename: str,
+) -> None:
+    locker = AsyncioLockLocker()
+    token_proxy = HuntflowTokenProxy(token_storage, locker, cache_ttl=60)
+    another_proxy = HuntflowTokenProxy(HuntflowTokenFileStorage(token_filename), locker)
+    await token_proxy.get_auth_header()
+    await another_proxy.get_auth_header()
+
+    tomorrow = datetime.now() + timedelta(days=1)
+    with freeze_time(tomorrow):
+        new_token_pair = TokenPair()
+        await another_proxy.update(get_token_refresh_data(new_token_pair))
+
+        assert await token_proxy.is_updated()
+        auth_header = await token_proxy.get_auth_header()
+        assert auth_header == {"Authorization": f"Bearer {new_token_pair.access_token}"}
+
+
+async def test_cache_is_updated_after_refresh(
+    token_storage: HuntflowTokenFileStorage,
+    token_filename: str,
+) -> None:
+    storage = CountingFileStorage(token_filename)
+    token_proxy = HuntflowTokenProxy(storage, AsyncioLockLocker(), cache_ttl=60)
+    await token_proxy.get_auth_header()
+    await token_proxy.get_refresh_data()
+
+    new_token_pair = TokenPair()
+    await token_proxy.update(get_token_refresh_data(new_token_pair))
+    get_count = storage.get_count
+
+    auth_header = await token_proxy.get_auth_header()
+    assert auth_header == {"Authorization": f"Bearer {new_token_pair.access_token}"}
+    assert storage.get_count == get_count
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from huntflow_api_client.tokens.storage import HuntflowTokenFileStorage
+from huntflow_api_client.tokens.token import ApiToken
+from tests.api import TokenPair
+
+
+async def test_get__ok(token_storage: HuntflowTokenFileStorage, token_pair: TokenPair) -> None:
+    token = await token_storage.get()
+
+    assert token == ApiToken(
+        access_token=token_pair.access_token,
+        refresh_token=token_pair.refresh_token,
+    )
+
+
+async def test_get_uses_cache_while_file_is_not_changed(
+    token_storage: HuntflowTokenFileStorage,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    load_count = 0
+    original_load = json.load
+
+    def counting_load(*args: Any, **kwargs: Any) -> Any:
+        nonlocal load_count
+        load_count += 1
+        return original_load(*args, **kwargs)
+
+    monkeypatch.setattr(json, "load", counting_load)
+
+    first = await token_storage.get()
+    second = await token_storage.get()
+    assert first == second
+    assert load_count == 1
+
+    new_token = ApiToken(access_token="new", refresh_token="new")
+    await token_storage.update(new_token)
+    assert await token_storage.get() == new_token
+    assert load_count == 2
+
+
+async def test_update_is_atomic(token_storage: HuntflowTokenFileStorage, tmp_path: Path) -> None:
+    token_filename = next(tmp_path.iterdir())
+    os.chmod(token_filename, 0o640)
+    version = await token_storage.get_version()
+    token = ApiToken(access_token="new", refresh_token="new", expiration_timestamp=1.0)
+
+    await token_storage.update(token)
+
+    assert list(tmp_path.iterdir()) == [token_filename]
+    assert oct(os.stat(token_filename).st_mode & 0o777) == oct(0o640)
+    assert await token_storage.get_version() != version
+    with open(token_filename) as fin:
+        assert json.load(fin) == token.dict()
+
+
+async def test_concurrent_reads_never_see_partial_token(
+    token_storage: HuntflowTokenFileStorage,
+    token_filename: str,
+) -> None:
+    writer = HuntflowTokenFileStorage(token_filename)
+
+    async def write() -> None:
+        for i in range(100):
+            await writer.update(ApiToken(access_token=f"token-{i}" * 100))
+
+    async def read() -> None:
+        for _ in range(100):
+            token = await HuntflowTokenFileStorage(token_filename).get()
+            assert token.access_token
+
+    await asyncio.gather(write(), read(), read())
@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import pytest
+
+from huntflow_api_client.tokens.proxy import HuntflowTokenProxy
+from huntflow_api_client.tokens.storage import HuntflowTokenSQLiteStorage
+from huntflow_api_client.tokens.token import ApiToken
+
+
+@pytest.fixture
+def db_filename(tmp_path: Path) -> str:
+    return str(tmp_path / "tokens.db")
+
+
+async def test_get__missing_token(db_filename: str) -> None:
+    storage = HuntflowTokenSQLiteStorage(db_filename)
+
+    with pytest.raises(LookupError):
+        await storage.get()
+    assert await storage.get_version() is None
+
+
+async def test_update__inserts_and_increments_version(db_filename: str) -> None:
+    storage = HuntflowTokenSQLiteStorage(db_filename)
+    first = ApiToken(access_token="a1", refresh_token="r1")
+    second = ApiToken(access_token="a2", refresh_token="r2", last_refresh_timestamp=1.0)
+
+    await storage.update(first)
+    assert await storage.get_version() == 1
+    assert await storage.get() == first
+
+    await storage.update(second)
+    assert await storage.get_version() == 2
+    assert await HuntflowTokenSQLiteStorage(db_filename).get() == second
+
+
+async def test_compare_and_swap__stale_version_is_not_written(db_filename: str) -> None:
+    await HuntflowTokenSQLiteStorage(db_filename).update(ApiToken(access_token="a0"))
+    first = HuntflowTokenSQLiteStorage(db_filename)
+    second = HuntflowTokenSQLiteStorage(db_filename)
+    _, first_version = await first.get_with_version()
+    _, second_version = await second.get_with_version()
+
+    assert await first.compare_and_swap(ApiToken(access_token="new"), first_version)
+    # Reads don't change the version the second writer expects
+    await second.get()
+    assert not await second.compare_and_swap(ApiToken(access_token="stale"), second_version)
+
+    assert await second.get_with_version() == (ApiToken(access_token="new"), 2)
+
+
+async def test_compare_and_swap(db_filename: str) -> None:
+    storage = HuntflowTokenSQLiteStorage(db_filename)
+
+    assert await storage.compare_and_swap(ApiToken(access_token="a1"), None)
+    assert not await storage.compare_and_swap(ApiToken(access_token="a2"), None)
+    assert not await storage.compare_and_swap(ApiToken(access_token="a2"), 5)
+    assert await storage.compare_and_swap(ApiToken(access_token="a2"), 1)
+    assert await storage.get() == ApiToken(access_token="a2")
+
+
+async def test_keys_are_independent(db_filename: str) -> None:
+    first = HuntflowTokenSQLiteStorage(db_filename, key="first")
+    second = HuntflowTokenSQLiteStorage(db_filename, key="second")
+
+    await first.update(ApiToken(access_token="a1"))
+
+    assert await second.get_version() is None
+    await second.update(ApiToken(access_token="b1"))
+    assert await first.get() == ApiToken(access_token="a1")
+    assert await second.get() == ApiToken(access_token="b1")
+
+
+async def test_proxy_cache_is_invalidated_by_version(db_filename: str) -> None:
+    storage = HuntflowTokenSQLiteStorage(db_filename)
+    await storage.update(ApiToken(access_token="a1", refresh_token="r1"))
+    proxy = HuntflowTokenProxy(storage, cache_ttl=0)
+
+    assert await proxy.get_auth_header() == {"Authorization": "Bearer a1"}
+
+    other = HuntflowTokenSQLiteStorage(db_filename)
+    await other.get()
+    await other.update(ApiToken(access_token="a2", refresh_token="r2"))
+
+    assert await proxy.get_auth_header() == {"Authorization": "Bearer a2"}
+
+
+async def test_proxy_losing_refresher_uses_stored_token(db_filename: str) -> None:
+    await HuntflowTokenSQLiteStorage(db_filename).update(
+        ApiToken(access_token="a1", refresh_token="r1"),
+    )
+    first = HuntflowTokenProxy(HuntflowTokenSQLiteStorage(db_filename), cache_ttl=0)
+    second = HuntflowTokenProxy(HuntflowTokenSQLiteStorage(db_filename), cache_ttl=0)
+    await first.get_refresh_data()
+    await second.get_refresh_data()
+
+    await first.update({"access_token": "a2", "refresh_token": "r2", "expires_in": 3600})
+    await second.update({"access_token": "a3", "refresh_token": "r3", "expires_in": 3600})
+
+    stored = await HuntflowTokenSQLiteStorage(db_filename).get()
+    assert stored.access_token == "a2"
+    assert await second.get_auth_header() == {"Authorization": "Bearer a2"}
+    assert await second.get_refresh_data() == {"refresh_token": "r2"}
+    assert not await second.is_updated()
+
+
+async def test_proxy_refresh_is_not_affected_by_reads(db_filename: str) -> None:
+    await HuntflowTokenSQLiteStorage(db_filename).update(
+        ApiToken(access_token="a1", refresh_token="r1"),
+    )
+    proxy = HuntflowTokenProxy(HuntflowTokenSQLiteStorage(db_filename))
+    await proxy.get_refresh_data()
+    await HuntflowTokenSQLiteStorage(db_filename).update(
+        ApiToken(access_token="a2", refresh_token="r2"),
+    )
+    # An unrelated read between getting the refresh data and the update
+    assert await proxy.get_auth_header() == {"Authorization": "Bearer a2"}
+
+    await proxy.update({"access_token": "a3", "refresh_token": "r3", "expires_in": 3600})
+
+    stored = await HuntflowTokenSQLiteStorage(db_filename).get()
+    assert stored.access_token == "a2"
+    assert await proxy.get_auth_header() == {"Authorization": "Bearer a2"}
+
+
+async def test_proxy_is_updated_compares_versions(db_filename: str) -> None:
+    storage = HuntflowTokenSQLiteStorage(db_filename)
+    await storage.update(ApiToken(access_token="a1", refresh_token="r1"))
+    proxy = HuntflowTokenProxy(storage, cache_ttl=60)
+    await proxy.get_auth_header()
+
+    assert not await proxy.is_updated()
+
+    other = HuntflowTokenSQLiteStorage(db_filename)
+    await other.get()
+    await other.update(ApiToken(access_token="a2", refresh_token="r2"))
+
+    assert await proxy.is_updated()
+    assert await proxy.get_auth_header() == {"Authorization": "Bearer a2"}
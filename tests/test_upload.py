@@ -0,0 +1,130 @@
+import email.parser
+import io
+import mmap
+import os
+from email.message import Message
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple, cast
+
+import httpx
+import pytest
+
+from huntflow_api_client.upload import FileSource, MultipartFileStream
+
+DATA = os.urandom(1024 * 1024 + 123)
+
+
+async def read_body(stream: MultipartFileStream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+def parse_body(stream: MultipartFileStream, body: bytes) -> Dict[str, Tuple[Optional[str], bytes]]:
+    """Form fields: name -> (filename, content)"""
+    head = f"Content-Type: {stream.headers['Content-Type']}\r\n\r\n".encode()
+    message = email.parser.BytesParser().parsebytes(head + body)
+    fields = {}
+    for part in cast(List[Message], message.get_payload()):
+        name = str(part.get_param("name", header="content-disposition"))
+        fields[name] = (part.get_filename(), cast(bytes, part.get_payload(decode=True)))
+    return fields
+
+
+async def async_chunks() -> AsyncIterator[bytes]:
+    for start in range(0, len(DATA), 100_000):
+        end = start + 100_000
+        yield DATA[start:end]
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(DATA)
+    return path
+
+
+@pytest.mark.parametrize("source_type", ["bytes", "path", "str", "file", "mmap", "async"])
+async def test_stream(path: Path, source_type: str) -> None:
+    with open(path, "rb") as fin, mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        sources: Dict[str, FileSource] = {
+            "bytes": DATA,
+            "path": path,
+            "str": str(path),
+            "file": fin,
+            "mmap": mm,
+            "async": async_chunks(),
+        }
+        source = sources[source_type]
+        progress: List[Tuple[int, Optional[int]]] = []
+        stream = MultipartFileStream(
+            source,
+            fields={"preset": "resume"},
+            filename="resume.pdf",
+            size=len(DATA) if source_type == "async" else None,
+            chunk_size=65536,
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+
+        body = await read_body(stream)
+
+    assert stream.headers["Content-Length"] == str(len(body))
+    assert parse_body(stream, body) == {
+        "preset": (None, b"resume"),
+        "file": ("resume.pdf", DATA),
+    }
+    assert progress[-1] == (len(DATA), len(DATA))
+    assert all(sent < next_sent for (sent, _), (next_sent, _) in zip(progress, progress[1:]))
+
+
+async def test_stream_can_be_sent_again(path: Path) -> None:
+    with open(path, "rb") as fin:
+        fin.seek(100)
+        stream = MultipartFileStream(fin)
+
+        first_body = await read_body(stream)
+        second_body = await read_body(stream)
+
+    assert first_body == second_body
+    assert parse_body(stream, first_body)["file"] == ("resume.pdf", DATA[100:])
+    assert stream.size == len(DATA) - 100
+
+
+async def test_async_iterable_is_read_once() -> None:
+    stream = MultipartFileStream(async_chunks())
+    body = await read_body(stream)
+
+    assert "Content-Length" not in stream.headers
+    assert parse_body(stream, body)["file"] == ("upload", DATA)
+    with pytest.raises(httpx.StreamConsumed):
+        await read_body(stream)
+
+
+async def test_size_mismatch() -> None:
+    stream = MultipartFileStream(async_chunks(), size=len(DATA) + 1)
+
+    with pytest.raises(ValueError):
+        await read_body(stream)
+
+
+async def test_content_type_and_filename() -> None:
+    photo = io.BytesIO(b"data")
+    photo.name = "/tmp/photo.jpeg"
+
+    stream = MultipartFileStream(photo)
+    body = await read_body(stream)
+
+    assert stream.size == 4
+    assert b'filename="photo.jpeg"\r\nContent-Type: image/jpeg\r\n\r\ndata\r\n' in body
+
+
+async def test_pipe_is_sent_chunked() -> None:
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd, "rb") as pipe:
+        with os.fdopen(write_fd, "wb") as fout:
+            fout.write(b"piped data")
+        stream = MultipartFileStream(pipe, filename="data.txt")
+
+        body = await read_body(stream)
+
+    assert stream.size is None
+    assert "Content-Length" not in stream.headers
+    assert parse_body(stream, body)["file"] == ("data.txt", b"piped data")